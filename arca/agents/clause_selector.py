@@ -0,0 +1,294 @@
+# agents/clause_selector.py
+"""
+Regulation Clause Selector (ARCA System)
+
+Instead of sending the whole regulation with every excerpt, the auditor
+sends only the clauses that match the excerpt.
+
+Flow (once per pipeline run):
+1. Segment the regulation into clauses: the structural units of
+   document_structure.py (articles, numbered clauses, lettered sub-clauses),
+   oversized units split at paragraphs; unstructured text falls back to
+   line-start markers and paragraphs
+2. Embed all clauses in ONE batch (clause vectors are memoized by content
+   hash, so clauses shared by re-submitted regulations are not re-embedded)
+3. For each policy excerpt, rank clauses by cosine similarity and keep the
+   best ones that fit the token budget (kept in document order)
+
+Regulations that already fit the budget are passed through unchanged.
+"""
+
+import os
+import re
+import sys
+import math
+import threading
+from pathlib import Path
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional
+
+PROJECT_ROOT = Path(__file__).parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from document_structure import segment_structure, flatten
+from disk_cache import content_hash
+
+CLAUSE_TOKEN_BUDGET = int(os.getenv("ARCA_CLAUSE_TOKEN_BUDGET", "800"))
+CLAUSE_TOP_N = int(os.getenv("ARCA_CLAUSE_TOP_N", "4"))
+
+# Rough token estimate (Gemini averages ~4 chars/token)
+CHARS_PER_TOKEN = 4
+
+# Lines that open a new clause: "Article 12", "Section 3", "4.", "4.2)", "(a)"
+CLAUSE_START_RE = re.compile(
+    r"^[ \t]*(?:(?:article|art\.|section|chapter|chapitre)\s+[\dIVXLC]+\b"
+    r"|\d+(?:\.\d+)*[.)][ \t]"
+    r"|\([a-z0-9]{1,3}\)[ \t])",
+    re.IGNORECASE | re.MULTILINE
+)
+PARAGRAPH_BREAK_RE = re.compile(r"\n[ \t]*\n")
+
+# Fragments shorter than this (e.g. a bare heading) are merged into the next clause
+MIN_CLAUSE_CHARS = 60
+# Structural units longer than this are split at paragraphs
+MAX_CLAUSE_CHARS = CLAUSE_TOKEN_BUDGET * CHARS_PER_TOKEN
+# Memoized clause embeddings per selector
+CLAUSE_VECTOR_CACHE_SIZE = 4096
+
+
+def _cosine(a: List[float], b: List[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+def _tokens(text: str) -> int:
+    return max(1, len(text) // CHARS_PER_TOKEN) if text else 0
+
+
+def _paragraph_cuts(text: str, start: int, end: int) -> List[int]:
+    """Cut points inside text[start:end]: line-start clause markers and paragraph breaks"""
+    boundaries = {start, end}
+    boundaries.update(m.start() for m in CLAUSE_START_RE.finditer(text, start, end))
+    boundaries.update(m.end() for m in PARAGRAPH_BREAK_RE.finditer(text, start, end))
+    return sorted(boundaries)
+
+
+def _merge_short(text: str, pieces: List[tuple]) -> List[tuple]:
+    """
+    Merge fragments shorter than MIN_CLAUSE_CHARS into the next piece
+
+    Args:
+        pieces: Contiguous (start, end, segment_id) tuples; a merged piece
+                keeps the segment_id of the piece it ends in
+    """
+    spans = []
+    pending_start = None
+    for start, end, segment_id in pieces:
+        if pending_start is not None:
+            start = pending_start
+        if not text[start:end].strip():
+            pending_start = None
+            continue
+        if len(text[start:end].strip()) < MIN_CLAUSE_CHARS and end < len(text):
+            pending_start = start
+            continue
+        pending_start = None
+        spans.append((start, end, segment_id))
+
+    if pending_start is not None:
+        if spans:
+            spans[-1] = (spans[-1][0], len(text), spans[-1][2])
+        else:
+            spans.append((pending_start, len(text), None))
+    return spans
+
+
+def segment_clauses(text: str) -> List[Dict[str, Any]]:
+    """
+    Split a regulation into clauses with character offsets
+
+    Returns:
+        List of dicts: clause_id (C1..Cn), text, start, end, segment_id
+        (structural path such as "article-12/clause-3", None for
+        unstructured text)
+    """
+    units = flatten(segment_structure(text), text)
+    if sum(1 for unit in units if unit["kind"] != "preamble") >= 2:
+        pieces = []
+        # Units tile the text; extend each to the next unit's start so
+        # pieces stay contiguous
+        bounds = [unit["start"] for unit in units[1:]] + [len(text)]
+        previous_end = 0
+        for unit, end in zip(units, bounds):
+            start = previous_end
+            if end - start > MAX_CLAUSE_CHARS:
+                cuts = _paragraph_cuts(text, start, end)
+                pieces.extend((a, b, unit["segment_id"]) for a, b in zip(cuts, cuts[1:]))
+            else:
+                pieces.append((start, end, unit["segment_id"]))
+            previous_end = end
+    else:
+        cuts = _paragraph_cuts(text, 0, len(text))
+        pieces = [(a, b, None) for a, b in zip(cuts, cuts[1:])]
+
+    clauses = []
+    for start, end, segment_id in _merge_short(text, pieces):
+        # Trim surrounding whitespace but keep offsets exact
+        raw = text[start:end]
+        lead = len(raw) - len(raw.lstrip())
+        clause_text = raw.strip()
+        if not clause_text:
+            continue
+        clauses.append({
+            "clause_id": f"C{len(clauses) + 1}",
+            "text": clause_text,
+            "start": start + lead,
+            "end": start + lead + len(clause_text),
+            "segment_id": segment_id
+        })
+    return clauses
+
+
+class ClauseSelector:
+    """
+    Select the regulation clauses relevant to each policy excerpt
+    """
+
+    def __init__(
+        self,
+        embeddings: Any,
+        token_budget: int = CLAUSE_TOKEN_BUDGET,
+        top_n: int = CLAUSE_TOP_N
+    ):
+        """
+        Args:
+            embeddings: LangChain embeddings (e.g. PolicyResearcherAgent.embeddings)
+            token_budget: Max regulation tokens per auditor prompt
+            top_n: Max clauses per excerpt
+        """
+        self.embeddings = embeddings
+        self.token_budget = token_budget
+        self.top_n = top_n
+        self._clause_vectors: "OrderedDict[str, List[float]]" = OrderedDict()
+        # Concurrent analyses share the memo
+        self._vectors_lock = threading.Lock()
+
+    def embed_clauses(self, texts: List[str]) -> List[List[float]]:
+        """
+        Clause embeddings in one batch for the texts not seen before
+        (memoized by content hash, least recently used evicted)
+        """
+        keys = [content_hash(text) for text in texts]
+        with self._vectors_lock:
+            known = {key: self._clause_vectors[key] for key in keys if key in self._clause_vectors}
+
+        missing = list(dict.fromkeys(key for key in keys if key not in known))
+        if missing:
+            text_by_key = dict(zip(keys, texts))
+            vectors = self.embeddings.embed_documents([text_by_key[key] for key in missing])
+            known.update(zip(missing, vectors))
+
+        with self._vectors_lock:
+            for key in keys:
+                self._clause_vectors[key] = known[key]
+                self._clause_vectors.move_to_end(key)
+            while len(self._clause_vectors) > CLAUSE_VECTOR_CACHE_SIZE:
+                self._clause_vectors.popitem(last=False)
+        return [known[key] for key in keys]
+
+    def needs_selection(self, regulation_text: str) -> bool:
+        """Short regulations are sent whole"""
+        return _tokens(regulation_text) > self.token_budget
+
+    def select(
+        self,
+        regulation_text: str,
+        excerpts: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Pick the clauses to send with each excerpt
+
+        Args:
+            regulation_text: Full regulation
+            excerpts: Policy excerpts to audit
+
+        Returns:
+            One dict per excerpt:
+            - context: Regulation text to put in the prompt
+            - clause_ids: Clauses used (empty when the whole text is sent)
+            - clauses: The selected clause dicts (with similarity)
+        """
+        if not excerpts:
+            return []
+
+        if not self.needs_selection(regulation_text):
+            return [
+                {"context": regulation_text, "clause_ids": [], "clauses": []}
+                for _ in excerpts
+            ]
+
+        clauses = segment_clauses(regulation_text)
+        if len(clauses) <= 1:
+            return [
+                {"context": regulation_text, "clause_ids": [], "clauses": []}
+                for _ in excerpts
+            ]
+
+        # One embedding batch for the clauses, one for the excerpts
+        clause_vectors = self.embed_clauses([c["text"] for c in clauses])
+        excerpt_vectors = self.embeddings.embed_documents(excerpts)
+
+        selections = []
+        for excerpt_vector in excerpt_vectors:
+            ranked = sorted(
+                (
+                    (_cosine(excerpt_vector, clause_vector), i)
+                    for i, clause_vector in enumerate(clause_vectors)
+                ),
+                reverse=True
+            )
+
+            chosen, used = [], 0
+            for similarity, i in ranked[:self.top_n]:
+                cost = _tokens(clauses[i]["text"])
+                if chosen and used + cost > self.token_budget:
+                    continue
+                chosen.append((i, similarity))
+                used += cost
+
+            chosen.sort()  # document order reads naturally in the prompt
+            selected = [dict(clauses[i], similarity=round(sim, 4)) for i, sim in chosen]
+
+            context = "\n\n".join(c["text"] for c in selected)
+            # A single oversized clause is cut to the budget
+            context = context[:self.token_budget * CHARS_PER_TOKEN]
+
+            selections.append({
+                "context": context,
+                "clause_ids": [c["clause_id"] for c in selected],
+                "clauses": selected
+            })
+
+        return selections
+
+    @staticmethod
+    def merge(selections: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Union of several selections (batch prompts carry one regulation context)
+        """
+        by_id = {}
+        for selection in selections:
+            for clause in selection["clauses"]:
+                by_id.setdefault(clause["clause_id"], clause)
+
+        if not by_id:
+            return selections[0] if selections else {"context": "", "clause_ids": [], "clauses": []}
+
+        clauses = sorted(by_id.values(), key=lambda c: c["start"])
+        return {
+            "context": "\n\n".join(c["text"] for c in clauses),
+            "clause_ids": [c["clause_id"] for c in clauses],
+            "clauses": clauses
+        }
@@ -12,26 +12,233 @@ Input:
 Output:
 - List of conflict analyses with severity (HIGH/MEDIUM/LOW)
 
+Modes:
+- single: one LLM call per policy excerpt (default)
+- batch: one LLM call carrying the regulation once with all excerpts labelled,
+  missing/malformed verdicts fall back to single-policy calls
+
+Verdict cache:
+- Successful verdicts are persisted in SQLite (cache/verdicts.sqlite), keyed by
+  content hashes of regulation, excerpt, prompt-template version and model
+- Fallback results from failed calls are never cached
+
+Rule engine (optional, see obligation_rules.py):
+- Clear-cut numeric/temporal conflicts ("90 days" vs "within 30 days") get an
+  immediate HIGH verdict, no LLM call
+
+Pre-screen (optional, see prescreen.py):
+- Clearly unrelated excerpts get an immediate no-conflict verdict, no LLM call
+
+Clause selection (optional, see clause_selector.py):
+- Each prompt carries only the regulation clauses matching its excerpt
+
+Obligation records (optional, see obligation_records.py):
+- Excerpts with records precomputed at ingest are sent as compact
+  "<actor> MUST <action> [deadline] [scope]" lines instead of raw text
+
+Verbatim quotes (see span_aligner.py):
+- Prompts number the regulation and excerpt sentences ([R1].., [P1]..); the
+  LLM answers with sentence ids and the quoted fields are cut from the
+  original text locally, so quotes are always verbatim and cost no output tokens
+
+Cascade mode (optional):
+- Audit with a cheaper/faster model first; only HIGH verdicts, low-confidence
+  verdicts and unparseable responses are re-run on the stronger model
+
+Deadlines:
+- Every LLM call has a per-call timeout (hedged after the model's p95 latency)
+- run() accepts an overall deadline; when too little time is left for another
+  call, the remaining lower-ranked excerpts are returned as unaudited
+
+Async (run_async):
+- Same phases and result as run(); the local embedding work runs in a worker
+  thread and the per-excerpt LLM calls are awaited concurrently
+  (ARCA_AUDIT_CONCURRENCY at once), so the event loop is never blocked
+
+Streaming (on_verdict):
+- run() and run_async() call on_verdict(index, verdict) as soon as each
+  excerpt's verdict is final: rule engine and pre-screen verdicts first,
+  LLM verdicts as their calls return (after escalation in cascade mode)
+
 Tools: None (pure LLM reasoning)
 """
 
 import os
-from typing import List, Dict, Any
+import sys
+import json
+import re
+import time
+import asyncio
+from functools import partial
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple, Callable
 from dotenv import load_dotenv
-from langchain_google_genai import GoogleGenerativeAI
+
+# Project root (arca/) holds the shared infrastructure modules
+PROJECT_ROOT = Path(__file__).parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from disk_cache import SQLiteCache, content_hash, DEFAULT_CACHE_DIR
+from llm_client import get_llm, estimate_tokens, LLMTimeoutError
+from agents.obligation_records import render_obligations
+from agents.span_aligner import SpanAligner, split_sentences, number_sentences
 
 load_dotenv()
 
-# LLM Configuration
-llm = GoogleGenerativeAI(
-    model="gemini-2.5-flash",
-    temperature=0.0,
-    google_api_key=os.getenv("GOOGLE_API_KEY")
+# LLM Configuration (shared rate-limited client, see llm_client.py)
+AUDITOR_MODEL = os.getenv("ARCA_AUDITOR_MODEL", "gemini-2.5-flash")
+llm = get_llm(model=AUDITOR_MODEL, temperature=0.0)
+
+# Cascade configuration: cheap first tier, escalation threshold
+AUDITOR_FAST_MODEL = os.getenv("ARCA_AUDITOR_FAST_MODEL", "gemini-2.5-flash-lite")
+CASCADE_MIN_CONFIDENCE = float(os.getenv("ARCA_CASCADE_MIN_CONFIDENCE", "0.7"))
+
+# Send precomputed obligation records instead of raw excerpts (when available)
+AUDIT_WITH_OBLIGATION_RECORDS = os.getenv("ARCA_AUDIT_OBLIGATION_RECORDS", "0") != "0"
+
+# Deadlines: per-call timeout, and the minimum time worth starting a call with
+AUDIT_CALL_TIMEOUT = float(os.getenv("ARCA_AUDIT_CALL_TIMEOUT", "60"))
+AUDIT_MIN_CALL_SECONDS = float(os.getenv("ARCA_AUDIT_MIN_CALL_SECONDS", "5"))
+# Audit calls in flight at once in run_async()
+AUDIT_CONCURRENCY = int(os.getenv("ARCA_AUDIT_CONCURRENCY", "5"))
+
+# Streaming hook: on_verdict(index in policy_items, final verdict)
+VerdictCallback = Callable[[int, Dict[str, Any]], None]
+
+# Verdict cache configuration
+VERDICT_CACHE_ENABLED = os.getenv("ARCA_VERDICT_CACHE", "1") != "0"
+VERDICT_CACHE_PATH = os.getenv(
+    "ARCA_VERDICT_CACHE_PATH", os.path.join(DEFAULT_CACHE_DIR, "verdicts.sqlite")
 )
+VERDICT_CACHE_TTL_DAYS = float(os.getenv("ARCA_VERDICT_CACHE_TTL_DAYS", "30"))
+VERDICT_CACHE_MAX_ENTRIES = int(os.getenv("ARCA_VERDICT_CACHE_MAX_ENTRIES", "50000"))
+
+# Bump when a prompt template changes so stale verdicts are never served
+PROMPT_VERSIONS = {
+    "single": "single-v3",
+    "batch": "batch-v3"
+}
+
+# Fields the LLM must return; quotes are filled in locally by the SpanAligner
+REQUIRED_RESPONSE_KEYS = [
+    "severity",
+    "has_conflict",
+    "divergence_summary",
+    "recommendation"
+]
+
+# Fields every final verdict carries (what the report needs)
+REQUIRED_ANALYSIS_KEYS = [
+    "severity",
+    "has_conflict",
+    "divergence_summary",
+    "conflicting_policy_excerpt",
+    "new_rule_excerpt",
+    "recommendation"
+]
+
+# ─────────────────────────────────────────────────────────
+# PROMPT TEMPLATES
+# ─────────────────────────────────────────────────────────
+
+SEVERITY_INSTRUCTIONS = """2. Classify the severity as:
+   - HIGH: Direct contradiction, legal risk, immediate action required
+   - MEDIUM: Partial conflict, ambiguity, or missing requirement
+   - LOW: Minor gap, best practice improvement, or no real conflict"""
+
+SINGLE_AUDIT_PROMPT = """You are a senior legal compliance analyst specialized in regulatory gap analysis.
+
+Your task: Compare the internal company policy excerpt below with a new regulation and determine if there is a conflict.
+
+NEW REGULATION:
+{regulation}
+
+INTERNAL POLICY EXCERPT:
+{excerpt}
+
+Sentences are numbered: [R#] for the regulation, [P#] for the policy.
+
+ANALYSIS INSTRUCTIONS:
+1. Identify if there is ANY conflict, divergence, or gap between the policy and the regulation
+{severity_instructions}
+
+3. Return your analysis in this EXACT JSON format (no other text):
+{{
+  "severity": "HIGH" | "MEDIUM" | "LOW",
+  "has_conflict": true | false,
+  "divergence_summary": "One sentence explaining the conflict",
+  "policy_sentences": ["P#", ...] (ids of the problematic policy sentences, usually one),
+  "regulation_sentences": ["R#", ...] (ids of the conflicting regulation sentences, usually one),
+  "recommendation": "One clear action item for legal team",
+  "confidence": 0.0 to 1.0 (how certain you are of this verdict)
+}}
+
+If there is NO conflict, set has_conflict to false and use severity "LOW".
+"""
+
+BATCH_AUDIT_PROMPT = """You are a senior legal compliance analyst specialized in regulatory gap analysis.
+
+Your task: Compare EACH internal company policy excerpt below with the new regulation and determine, for each excerpt independently, if there is a conflict.
+
+NEW REGULATION:
+{regulation}
+
+INTERNAL POLICY EXCERPTS:
+{excerpts}
+
+Sentences are numbered: [R#] for the regulation, [P#] within each excerpt
+(every excerpt starts again at P1).
+
+ANALYSIS INSTRUCTIONS:
+1. For every excerpt, identify if there is ANY conflict, divergence, or gap between the policy and the regulation
+{severity_instructions}
+
+3. Return a JSON array with EXACTLY one object per excerpt, in this EXACT format (no other text):
+[
+  {{
+    "excerpt_index": <number of the excerpt, e.g. 1>,
+    "severity": "HIGH" | "MEDIUM" | "LOW",
+    "has_conflict": true | false,
+    "divergence_summary": "One sentence explaining the conflict",
+    "policy_sentences": ["P#", ...] (ids of the problematic sentences of THIS excerpt, usually one),
+    "regulation_sentences": ["R#", ...] (ids of the conflicting regulation sentences, usually one),
+    "recommendation": "One clear action item for legal team",
+    "confidence": 0.0 to 1.0 (how certain you are of this verdict)
+  }}
+]
+
+If there is NO conflict for an excerpt, set has_conflict to false and use severity "LOW".
+"""
+
+
+def build_verdict_cache() -> Optional[SQLiteCache]:
+    """
+    Open the persistent verdict cache (None when disabled via ARCA_VERDICT_CACHE=0)
+    """
+    if not VERDICT_CACHE_ENABLED:
+        return None
+    return SQLiteCache(
+        VERDICT_CACHE_PATH,
+        table="verdicts",
+        ttl_seconds=VERDICT_CACHE_TTL_DAYS * 24 * 3600,
+        max_entries=VERDICT_CACHE_MAX_ENTRIES
+    )
 
 
 class ComplianceAuditorAgent:
-    def __init__(self):
+    def __init__(
+        self,
+        verdict_cache: Optional[SQLiteCache] = None,
+        use_cache: bool = True,
+        prescreener: Optional[Any] = None,
+        clause_selector: Optional[Any] = None,
+        rule_engine: Optional[Any] = None,
+        use_obligation_records: bool = AUDIT_WITH_OBLIGATION_RECORDS,
+        fast_model: str = AUDITOR_FAST_MODEL,
+        min_confidence: float = CASCADE_MIN_CONFIDENCE,
+        aligner: Optional[SpanAligner] = None
+    ):
         """
         Initialize the Compliance Auditor Agent
         
@@ -39,17 +246,296 @@ class ComplianceAuditorAgent:
         - No external tools
         - Pure logical reasoning
         - Classify conflicts as HIGH, MEDIUM, or LOW
+
+        Args:
+            verdict_cache: Cache instance to use (default: built from env config)
+            use_cache: Set False to bypass the verdict cache entirely
+            prescreener: Optional ExcerptPrescreener run before the LLM
+            clause_selector: Optional ClauseSelector trimming the regulation
+                             sent with each excerpt
+            rule_engine: Optional ObligationRuleEngine resolving numeric
+                         conflicts before the LLM
+            use_obligation_records: Audit excerpts through their ingest-time
+                                    obligation records when items carry them
+            fast_model: First-tier model used in cascade mode
+            min_confidence: Cascade escalates first-tier verdicts below this
+            aligner: SpanAligner turning sentence ids into verbatim quotes
         """
         self.llm = llm
+        self.prescreener = prescreener
+        self.clause_selector = clause_selector
+        self.rule_engine = rule_engine
+        self.use_obligation_records = use_obligation_records
+        self.aligner = aligner or SpanAligner()
+        self.model_name = getattr(llm, "model", "unknown")
+
+        # Model tiers: "strong" is the default auditor, "fast" the cascade first tier
+        self.llms = {
+            "strong": llm,
+            "fast": get_llm(model=fast_model, temperature=0.0)
+        }
+        self.min_confidence = min_confidence
+
+        if not use_cache:
+            self.verdict_cache = None
+        elif verdict_cache is not None:
+            self.verdict_cache = verdict_cache
+        else:
+            try:
+                self.verdict_cache = build_verdict_cache()
+            except Exception as e:
+                print(f"⚠️  Verdict cache unavailable ({e}), continuing without cache")
+                self.verdict_cache = None
+
+    # ─────────────────────────────────────────────────────────
+    # VERDICT CACHE
+    # ─────────────────────────────────────────────────────────
+
+    def _cache_key(
+        self,
+        new_regulation_text: str,
+        policy_excerpt: str,
+        template: str,
+        tier: str = "strong"
+    ) -> str:
+        """Content-hash key: regulation + excerpt + prompt-template version + model"""
+        return content_hash(
+            new_regulation_text,
+            policy_excerpt,
+            PROMPT_VERSIONS[template],
+            getattr(self.llms[tier], "model", "unknown")
+        )
+
+    def _cache_lookup(
+        self,
+        new_regulation_text: str,
+        policy_excerpt: str,
+        policy_id: str,
+        template: str,
+        usage: Optional[Dict[str, int]] = None,
+        tier: str = "strong"
+    ) -> Optional[Dict[str, Any]]:
+        """Return a cached verdict (with policy_id attached) or None"""
+        if self.verdict_cache is None:
+            return None
+
+        try:
+            cached = self.verdict_cache.get(
+                self._cache_key(new_regulation_text, policy_excerpt, template, tier)
+            )
+        except Exception as e:
+            print(f"   ⚠️  Verdict cache read failed: {e}")
+            return None
+
+        if usage is not None:
+            usage["cache_hits" if cached is not None else "cache_misses"] += 1
+        if cached is None:
+            return None
+
+        cached["policy_id"] = policy_id
+        return cached
+
+    def _cache_store(
+        self,
+        new_regulation_text: str,
+        policy_excerpt: str,
+        analysis: Dict[str, Any],
+        template: str,
+        tier: str = "strong"
+    ) -> None:
+        """Persist a successfully parsed verdict (never called for fallbacks)"""
+        if self.verdict_cache is None or not self._is_valid_analysis(analysis):
+            return
+
+        verdict = {k: v for k, v in analysis.items() if k != "policy_id"}
+        try:
+            self.verdict_cache.set(
+                self._cache_key(new_regulation_text, policy_excerpt, template, tier),
+                verdict
+            )
+        except Exception as e:
+            print(f"   ⚠️  Verdict cache write failed: {e}")
+
+    def cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Hit-rate statistics of the verdict cache (None when disabled)"""
+        if self.verdict_cache is None:
+            return None
+        return self.verdict_cache.stats()
+
+    # ─────────────────────────────────────────────────────────
+    # PROMPT BUILDING & PARSING
+    # ─────────────────────────────────────────────────────────
+
+    def build_single_prompt(self, new_regulation_text: str, policy_excerpt: str) -> str:
+        """Build the single-policy audit prompt"""
+        return SINGLE_AUDIT_PROMPT.format(
+            regulation=number_sentences(split_sentences(new_regulation_text, "R")),
+            excerpt=number_sentences(split_sentences(policy_excerpt, "P")),
+            severity_instructions=SEVERITY_INSTRUCTIONS
+        )
+
+    def build_batch_prompt(
+        self,
+        new_regulation_text: str,
+        policy_items: List[Dict[str, Any]]
+    ) -> str:
+        """Build the multi-policy audit prompt (regulation sent once, excerpts labelled 1..N)"""
+        excerpts = "\n\n".join(
+            f"[EXCERPT {i}] (policy_id: {item['policy_id']})\n"
+            f"{number_sentences(split_sentences(item['excerpt'], 'P'))}"
+            for i, item in enumerate(policy_items, 1)
+        )
+        return BATCH_AUDIT_PROMPT.format(
+            regulation=number_sentences(split_sentences(new_regulation_text, "R")),
+            excerpts=excerpts,
+            severity_instructions=SEVERITY_INSTRUCTIONS
+        )
+
+    @staticmethod
+    def _parse_json_object(response: str) -> Dict[str, Any]:
+        """Extract the JSON object from an LLM response (handles markdown code blocks)"""
+        json_match = re.search(r'\{.*\}', response, re.DOTALL)
+        if not json_match:
+            raise ValueError("No valid JSON found in LLM response")
+        return json.loads(json_match.group())
+
+    @staticmethod
+    def _parse_json_array(response: str) -> List[Any]:
+        """Extract the JSON array from an LLM response (handles markdown code blocks)"""
+        json_match = re.search(r'\[.*\]', response, re.DOTALL)
+        if not json_match:
+            raise ValueError("No valid JSON array found in LLM response")
+        parsed = json.loads(json_match.group())
+        if not isinstance(parsed, list):
+            raise ValueError("LLM response is not a JSON array")
+        return parsed
+
+    @staticmethod
+    def _is_valid_analysis(analysis: Any, required_keys: List[str] = REQUIRED_ANALYSIS_KEYS) -> bool:
+        """Check that a parsed verdict carries every field the report needs"""
+        return (
+            isinstance(analysis, dict)
+            and all(key in analysis for key in required_keys)
+            and analysis["severity"] in ("HIGH", "MEDIUM", "LOW")
+        )
+
+    @classmethod
+    def _is_valid_response(cls, entry: Any) -> bool:
+        """Check a raw LLM verdict (before the quotes are attached)"""
+        return cls._is_valid_analysis(entry, REQUIRED_RESPONSE_KEYS)
+
+    def _invoke(
+        self,
+        prompt: str,
+        tier: str = "strong",
+        usage: Optional[Dict[str, Any]] = None,
+        validator: Optional[Any] = None,
+        deadline: Optional[float] = None
+    ) -> str:
+        """
+        Call the tier's LLM, recording tokens, calls and latency per tier
+
+        The call times out after AUDIT_CALL_TIMEOUT or at the run deadline,
+        whichever comes first; validator lets a hedged duplicate win when
+        the first response is not usable.
+        """
+        timeout = AUDIT_CALL_TIMEOUT
+        if deadline is not None:
+            timeout = min(timeout, deadline - time.monotonic())
+            if timeout <= 0:
+                raise LLMTimeoutError("Audit deadline reached before the LLM call")
+
+        if usage is not None:
+            usage["calls"] += 1
+            usage["prompt_tokens"] += estimate_tokens(prompt)
+
+        started = time.perf_counter()
+        try:
+            response = self.llms[tier].invoke(prompt, timeout=timeout, validator=validator)
+        finally:
+            if usage is not None:
+                tier_stats = usage["tiers"].setdefault(tier, {"calls": 0, "latency_seconds": 0.0})
+                tier_stats["calls"] += 1
+                tier_stats["latency_seconds"] += time.perf_counter() - started
+
+        if usage is not None:
+            usage["completion_tokens"] += estimate_tokens(response)
+        return response
+
+    def _valid_single_response(self, response: str) -> bool:
+        try:
+            return self._is_valid_response(self._parse_json_object(response))
+        except Exception:
+            return False
+
+    def _valid_batch_response(self, response: str) -> bool:
+        try:
+            return any(self._is_valid_response(entry) for entry in self._parse_json_array(response))
+        except Exception:
+            return False
+
+    def has_time_for_call(self, deadline: Optional[float], tier: str = "strong") -> bool:
+        """
+        True when there is no deadline, or enough time left for a typical call
+        (the tier's recent median latency, at least AUDIT_MIN_CALL_SECONDS)
+        """
+        if deadline is None:
+            return True
+        needed = AUDIT_MIN_CALL_SECONDS
+        latency_percentile = getattr(self.llms[tier], "latency_percentile", None)
+        if latency_percentile is not None:
+            needed = max(needed, latency_percentile(50) or 0.0)
+        return deadline - time.monotonic() >= needed
+
+    def _audit_view(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        The item as sent to the LLM: compact obligation records in place of
+        the raw excerpt when enabled, available and actually shorter
+        """
+        records = item.get("obligations")
+        if not self.use_obligation_records or not records:
+            return item
+        compact = "Policy obligations:\n" + render_obligations(records)
+        if len(compact) >= len(item['excerpt']):
+            return item
+        return dict(item, excerpt=compact, raw_excerpt=item['excerpt'])
+
+    @staticmethod
+    def _unaudited_verdict(policy_id: str, policy_excerpt: str) -> Dict[str, Any]:
+        """Placeholder for an excerpt left out because the latency budget ran out"""
+        return {
+            "policy_id": policy_id,
+            "severity": "LOW",
+            "has_conflict": False,
+            "divergence_summary": "Not audited: latency budget exhausted",
+            "conflicting_policy_excerpt": policy_excerpt[:200],
+            "new_rule_excerpt": "",
+            "recommendation": "Re-run the analysis with a larger latency budget",
+            "unaudited": True
+        }
+
+    # ─────────────────────────────────────────────────────────
+    # SINGLE-POLICY MODE
+    # ─────────────────────────────────────────────────────────
 
     def analyze_single_policy(
         self, 
         new_regulation_text: str, 
         policy_excerpt: str,
-        policy_id: str
+        policy_id: str,
+        usage: Optional[Dict[str, Any]] = None,
+        tier: str = "strong",
+        deadline: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         Analyze a single policy excerpt against the new regulation
+
+        Args:
+            usage: Optional token counter updated in place
+                   (calls, prompt_tokens, completion_tokens, tiers)
+            tier: Model tier to use ("strong" or "fast")
+            deadline: time.monotonic() value; without time for a call the
+                      excerpt is returned unaudited
         
         Returns:
         - severity: HIGH, MEDIUM, or LOW
@@ -59,49 +545,30 @@ class ComplianceAuditorAgent:
         - recommendation: Actionable next step
         """
         
-        prompt = f"""You are a senior legal compliance analyst specialized in regulatory gap analysis.
+        cached = self._cache_lookup(
+            new_regulation_text, policy_excerpt, policy_id, "single", usage, tier
+        )
+        if cached is not None:
+            return cached
 
-Your task: Compare the internal company policy excerpt below with a new regulation and determine if there is a conflict.
+        if not self.has_time_for_call(deadline, tier):
+            return self._unaudited_verdict(policy_id, policy_excerpt)
 
-NEW REGULATION:
-{new_regulation_text}
-
-INTERNAL POLICY EXCERPT:
-{policy_excerpt}
-
-ANALYSIS INSTRUCTIONS:
-1. Identify if there is ANY conflict, divergence, or gap between the policy and the regulation
-2. Classify the severity as:
-   - HIGH: Direct contradiction, legal risk, immediate action required
-   - MEDIUM: Partial conflict, ambiguity, or missing requirement
-   - LOW: Minor gap, best practice improvement, or no real conflict
-
-3. Return your analysis in this EXACT JSON format (no other text):
-{{
-  "severity": "HIGH" | "MEDIUM" | "LOW",
-  "has_conflict": true | false,
-  "divergence_summary": "One sentence explaining the conflict",
-  "conflicting_policy_excerpt": "Quote the specific problematic part from the policy (max 200 chars)",
-  "new_rule_excerpt": "Quote the specific conflicting part from the regulation (max 200 chars)",
-  "recommendation": "One clear action item for legal team"
-}}
-
-If there is NO conflict, set has_conflict to false and use severity "LOW".
-"""
+        prompt = self.build_single_prompt(new_regulation_text, policy_excerpt)
 
         try:
-            response = self.llm.invoke(prompt)
-            
-            # Parse JSON from response
-            import json
-            import re
+            response = self._invoke(
+                prompt, tier, usage,
+                validator=self._valid_single_response,
+                deadline=deadline
+            )
             
-            # Extract JSON from response (handle markdown code blocks)
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                analysis = json.loads(json_match.group())
-            else:
-                raise ValueError("No valid JSON found in LLM response")
+            analysis = self.aligner.align(
+                self._parse_json_object(response), new_regulation_text, policy_excerpt
+            )
+
+            # Only successfully parsed verdicts reach the cache
+            self._cache_store(new_regulation_text, policy_excerpt, analysis, "single", tier)
             
             # Add policy_id to result
             analysis["policy_id"] = policy_id
@@ -109,6 +576,9 @@ If there is NO conflict, set has_conflict to false and use severity "LOW".
             return analysis
             
         except Exception as e:
+            if isinstance(e, LLMTimeoutError) and deadline is not None and time.monotonic() >= deadline:
+                return self._unaudited_verdict(policy_id, policy_excerpt)
+
             # Fallback structure if parsing fails
             return {
                 "policy_id": policy_id,
@@ -117,72 +587,810 @@ If there is NO conflict, set has_conflict to false and use severity "LOW".
                 "divergence_summary": f"Analysis failed: {str(e)}",
                 "conflicting_policy_excerpt": policy_excerpt[:200],
                 "new_rule_excerpt": new_regulation_text[:200],
-                "recommendation": "Manual review required due to analysis error"
+                "recommendation": "Manual review required due to analysis error",
+                "analysis_failed": True
             }
 
-    def run(
-        self, 
-        new_regulation_text: str, 
-        policy_items: List[Dict[str, Any]]
-    ) -> Dict[str, Any]:
+    # ─────────────────────────────────────────────────────────
+    # BATCH MODE
+    # ─────────────────────────────────────────────────────────
+
+    def analyze_policy_batch(
+        self,
+        new_regulation_text: str,
+        policy_items: List[Dict[str, Any]],
+        usage: Optional[Dict[str, Any]] = None,
+        tier: str = "strong",
+        deadline: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
         """
-        Main execution: Analyze all policy excerpts against the new regulation
-        
-        TSD Flow:
-        1. Receive Top 5 excerpts from Agent 1 (Policy Researcher)
-        2. Analyze each one individually
-        3. Return structured analysis for Agent 3 (Report Generator)
-        
+        Analyze several policy excerpts in ONE LLM call
+
+        The regulation is sent once with the excerpts labelled [EXCERPT 1..N].
+        The LLM returns a JSON array of verdicts keyed by excerpt_index.
+        Any excerpt whose verdict is missing or malformed (or every excerpt,
+        if the array itself cannot be parsed) is re-analyzed with
+        analyze_single_policy.
+
         Args:
-            new_regulation_text: The complete new regulation text
-            policy_items: List of dicts from Agent 1, each with:
-                - policy_id
-                - excerpt
-                - score
-        
+            usage: Optional token counter updated in place
+                   (calls, fallback_calls, prompt_tokens, completion_tokens, tiers)
+            tier: Model tier to use ("strong" or "fast")
+            deadline: time.monotonic() value; excerpts that cannot be audited
+                      in time are returned unaudited
+
         Returns:
-            Dict with:
-            - regulation_text: Original regulation
-            - total_policies_analyzed: Count
-            - conflicts: List of analysis results
+            List of analyses in the same order as policy_items
+        """
+        if not policy_items:
+            return []
+
+        # Serve cached verdicts first; only the misses go into the batch prompt
+        cached: Dict[int, Dict[str, Any]] = {}
+        for i, item in enumerate(policy_items, 1):
+            hit = self._cache_lookup(
+                new_regulation_text, item['excerpt'], item['policy_id'], "batch", usage, tier
+            )
+            if hit is not None:
+                cached[i] = hit
+
+        pending = [i for i in range(1, len(policy_items) + 1) if i not in cached]
+        verdicts: Dict[int, Dict[str, Any]] = {}
+
+        # A lone miss gains nothing from the batch prompt, send it single
+        if len(pending) > 1:
+            batch_verdicts = self._run_batch_call(
+                new_regulation_text,
+                [policy_items[i - 1] for i in pending],
+                usage,
+                tier,
+                deadline
+            )
+            # Map batch-local indices back to positions in policy_items
+            for local_index, verdict in batch_verdicts.items():
+                i = pending[local_index - 1]
+                self._cache_store(
+                    new_regulation_text, policy_items[i - 1]['excerpt'], verdict, "batch", tier
+                )
+                verdicts[i] = verdict
+
+        verdicts.update(cached)
+
+        analyses = []
+        for i, item in enumerate(policy_items, 1):
+            if i in verdicts:
+                analysis = verdicts[i]
+                analysis["policy_id"] = item['policy_id']
+            elif not self.has_time_for_call(deadline, tier):
+                analysis = self._unaudited_verdict(item['policy_id'], item['excerpt'])
+            else:
+                if len(pending) > 1:
+                    print(f"   ↩️  Missing verdict for excerpt {i} ({item['policy_id']}), re-analyzing individually")
+                    if usage is not None:
+                        usage["fallback_calls"] += 1
+                analysis = self.analyze_single_policy(
+                    new_regulation_text=new_regulation_text,
+                    policy_excerpt=item['excerpt'],
+                    policy_id=item['policy_id'],
+                    usage=usage,
+                    tier=tier,
+                    deadline=deadline
+                )
+            analyses.append(analysis)
+
+        return analyses
+
+    def _run_batch_call(
+        self,
+        new_regulation_text: str,
+        policy_items: List[Dict[str, Any]],
+        usage: Optional[Dict[str, Any]] = None,
+        tier: str = "strong",
+        deadline: Optional[float] = None
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Issue one batch LLM call and return the valid verdicts keyed by
+        1-based excerpt index (malformed or duplicate entries are dropped)
+        """
+        verdicts: Dict[int, Dict[str, Any]] = {}
+        if not self.has_time_for_call(deadline, tier):
+            print("   ⏱️  Latency budget exhausted, batch call skipped")
+            return verdicts
+
+        prompt = self.build_batch_prompt(new_regulation_text, policy_items)
+
+        try:
+            response = self._invoke(
+                prompt, tier, usage,
+                validator=self._valid_batch_response,
+                deadline=deadline
+            )
+
+            for entry in self._parse_json_array(response):
+                if not self._is_valid_response(entry):
+                    continue
+                try:
+                    index = int(entry.pop("excerpt_index"))
+                except (KeyError, TypeError, ValueError):
+                    continue
+                if 1 <= index <= len(policy_items) and index not in verdicts:
+                    verdicts[index] = self.aligner.align(
+                        entry, new_regulation_text, policy_items[index - 1]['excerpt']
+                    )
+
+        except Exception as e:
+            print(f"   ⚠️  Batch analysis failed ({e}), falling back to single-policy calls")
+
+        return verdicts
+
+    @staticmethod
+    def _llm_usage(usage: Dict[str, Any]) -> Dict[str, int]:
+        """Token/call counters only (cache and tier counters are reported separately)"""
+        return {
+            k: v for k, v in usage.items()
+            if not k.startswith("cache_") and k != "tiers"
+        }
+
+    # ─────────────────────────────────────────────────────────
+    # CASCADE MODE
+    # ─────────────────────────────────────────────────────────
+
+    def escalation_reason(self, analysis: Dict[str, Any]) -> Optional[str]:
         """
+        Why a first-tier verdict must be re-run on the strong model (None = keep it)
+        """
+        if analysis.get("analysis_failed") or not self._is_valid_analysis(analysis):
+            return "parse_failure"
+        if analysis.get("severity") == "HIGH":
+            return "high_severity"
+        try:
+            confidence = float(analysis.get("confidence"))
+        except (TypeError, ValueError):
+            return "missing_confidence"
+        if confidence < self.min_confidence:
+            return "low_confidence"
+        return None
+
+    def _cascade_report(self, usage: Dict[str, Any], escalations: Dict[str, int]) -> Dict[str, Any]:
+        """Per-tier call counts and latency for the report metadata"""
+        tiers = {}
+        for tier, stats in usage["tiers"].items():
+            tiers[tier] = {
+                "model": getattr(self.llms[tier], "model", "unknown"),
+                "calls": stats["calls"],
+                "latency_seconds": round(stats["latency_seconds"], 3),
+                "avg_latency_seconds": (
+                    round(stats["latency_seconds"] / stats["calls"], 3) if stats["calls"] else 0.0
+                )
+            }
+        return {
+            "fast_model": getattr(self.llms["fast"], "model", "unknown"),
+            "strong_model": getattr(self.llms["strong"], "model", "unknown"),
+            "min_confidence": self.min_confidence,
+            "escalations": sum(escalations.values()),
+            "escalation_reasons": escalations,
+            "tiers": tiers
+        }
+
+    def _token_usage_report(
+        self,
+        single_contexts: List[str],
+        batch_context: str,
+        policy_items: List[Dict[str, Any]],
+        usage: Dict[str, int],
+        batch_mode: bool
+    ) -> Dict[str, Any]:
+        """
+        Report token usage for batch and single modes side by side
+
+        The mode that actually ran reports measured counts; the other mode
+        reports the prompt tokens it WOULD have sent (estimated: True).
+
+        Args:
+            single_contexts: Regulation text sent with each excerpt in single mode
+            batch_context: Regulation text sent once in batch mode
+        """
+        if batch_mode:
+            single_prompt_tokens = sum(
+                estimate_tokens(self.build_single_prompt(context, item['excerpt']))
+                for context, item in zip(single_contexts, policy_items)
+            )
+            batch = dict(self._llm_usage(usage), estimated=False)
+            single = {
+                "calls": len(policy_items),
+                "prompt_tokens": single_prompt_tokens,
+                "completion_tokens": None,
+                "estimated": True
+            }
+        else:
+            batch_prompt_tokens = (
+                estimate_tokens(self.build_batch_prompt(batch_context, policy_items))
+                if policy_items else 0
+            )
+            single = dict(self._llm_usage(usage), estimated=False)
+            batch = {
+                "calls": 1 if policy_items else 0,
+                "prompt_tokens": batch_prompt_tokens,
+                "completion_tokens": None,
+                "estimated": True
+            }
+
+        return {
+            "mode": "batch" if batch_mode else "single",
+            "batch": batch,
+            "single": single,
+            "prompt_tokens_saved_by_batch": single["prompt_tokens"] - batch["prompt_tokens"]
+        }
+
+    # ─────────────────────────────────────────────────────────
+    # RUN (sync and async share every phase but the LLM calls)
+    # ─────────────────────────────────────────────────────────
+        
+    @staticmethod
+    def _new_usage() -> Dict[str, Any]:
+        return {
+            "calls": 0,
+            "fallback_calls": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "tiers": {}
+        }
         
+    @staticmethod
+    def _merge_usage(total: Dict[str, Any], part: Dict[str, Any]) -> None:
+        """Add the counters of part (one concurrent call) into total"""
+        for key, value in part.items():
+            if key == "tiers":
+                for tier, stats in value.items():
+                    tier_stats = total["tiers"].setdefault(tier, {"calls": 0, "latency_seconds": 0.0})
+                    tier_stats["calls"] += stats["calls"]
+                    tier_stats["latency_seconds"] += stats["latency_seconds"]
+            else:
+                total[key] += value
+
+    @staticmethod
+    def _print_run_header(batch_mode: bool, cascade_mode: bool) -> None:
         print("=" * 60)
         print("⚖️  COMPLIANCE AUDITOR: Starting Analysis")
+        print(f"   Mode: {'batch' if batch_mode else 'single'}{' + cascade' if cascade_mode else ''}")
         print("=" * 60)
-        
+
+    def _prepare_audit(
+        self,
+        new_regulation_text: str,
+        policy_items: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Local phases before any LLM call: rule engine, pre-screen, audit
+        views and clause selection (embedding work, no LLM)
+
+        Returns:
+            Audit plan: audit_indices, audit_items, compact_items, selections,
+            batch_selection, rule_verdicts, rule_stats, prescreened,
+            prescreen_stats
+        """
+        # Rule engine: clear-cut numeric conflicts resolved without the LLM
+        audit_indices = list(range(len(policy_items)))
+        rule_verdicts: Dict[int, Dict[str, Any]] = {}
+        rule_stats = None
+
+        if self.rule_engine is not None and policy_items:
+            try:
+                audit_indices, rule_verdicts, rule_stats = self.rule_engine.screen(
+                    new_regulation_text, policy_items
+                )
+                print(f"\n📐 Rule engine: {len(rule_verdicts)}/{len(policy_items)} excerpts resolved "
+                      f"({rule_stats['regulation_obligations']} numeric obligations in the regulation)")
+                for index, verdict in rule_verdicts.items():
+                    print(f"   📏 {verdict['policy_id']}: {verdict['divergence_summary']}")
+            except Exception as e:
+                print(f"\n⚠️  Rule engine failed ({e}), sending every excerpt to the LLM")
+                audit_indices = list(range(len(policy_items)))
+                rule_verdicts, rule_stats = {}, None
+
+        # Pre-screen: skip clearly unrelated excerpts before any LLM call
+        prescreened: Dict[int, Dict[str, Any]] = {}
+        prescreen_stats = None
+
+        if self.prescreener is not None and audit_indices:
+            candidates = audit_indices
+            try:
+                local_audit, local_skipped, prescreen_stats = self.prescreener.screen(
+                    new_regulation_text, [policy_items[i] for i in candidates]
+                )
+                audit_indices = [candidates[j] for j in local_audit]
+                prescreened = {candidates[j]: verdict for j, verdict in local_skipped.items()}
+                print(f"\n🔎 Pre-screen: {len(prescreened)}/{len(candidates)} excerpts skipped "
+                      f"(threshold {prescreen_stats['threshold']:.3f})")
+                for index in prescreened:
+                    print(f"   ⏭️  {policy_items[index]['policy_id']}: unrelated, LLM audit skipped")
+            except Exception as e:
+                print(f"\n⚠️  Pre-screen failed ({e}), auditing every excerpt")
+                audit_indices = candidates
+                prescreened, prescreen_stats = {}, None
+
+        audit_items = [self._audit_view(policy_items[i]) for i in audit_indices]
+        compact_items = [item for item in audit_items if "raw_excerpt" in item]
+
+        # Clause selection: regulation context per excerpt (whole text by default)
+        selections = [
+            {"context": new_regulation_text, "clause_ids": [], "clauses": []}
+            for _ in audit_items
+        ]
+        if self.clause_selector is not None and audit_items:
+            try:
+                selections = self.clause_selector.select(
+                    new_regulation_text, [item['excerpt'] for item in audit_items]
+                )
+            except Exception as e:
+                print(f"\n⚠️  Clause selection failed ({e}), sending the full regulation")
+
+        # Batch prompts carry one context: the union of the selected clauses
+        batch_selection = {"context": new_regulation_text, "clause_ids": [], "clauses": []}
+        if any(s["clause_ids"] for s in selections):
+            batch_selection = self.clause_selector.merge(selections)
+
+        return {
+            "audit_indices": audit_indices,
+            "audit_items": audit_items,
+            "compact_items": compact_items,
+            "selections": selections,
+            "batch_selection": batch_selection,
+            "rule_verdicts": rule_verdicts,
+            "rule_stats": rule_stats,
+            "prescreened": prescreened,
+            "prescreen_stats": prescreen_stats
+        }
+
+    def _audit_batch(
+        self,
+        plan: Dict[str, Any],
+        usage: Dict[str, Any],
+        tier: str,
+        deadline: Optional[float]
+    ) -> List[Dict[str, Any]]:
+        """Audit every planned excerpt in one batch call"""
+        batch_selection = plan["batch_selection"]
+        print(f"\n[1/1] Analyzing {len(plan['audit_items'])} policies in one batch")
+        analyses = self.analyze_policy_batch(
+            new_regulation_text=batch_selection["context"],
+            policy_items=plan["audit_items"],
+            usage=usage,
+            tier=tier,
+            deadline=deadline
+        )
+        for analysis in analyses:
+            analysis["regulation_clauses_used"] = batch_selection["clause_ids"]
+        return analyses
+
+    def _audit_item(
+        self,
+        position: int,
+        total: int,
+        item: Dict[str, Any],
+        selection: Dict[str, Any],
+        tier: str,
+        deadline: Optional[float],
+        usage: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Audit one planned excerpt against its selected clauses"""
+        print(f"\n[{position}/{total}] Analyzing Policy: {item['policy_id']}")
+        if selection["clause_ids"]:
+            print(f"   📑 Clauses: {', '.join(selection['clause_ids'])}")
+        analysis = self.analyze_single_policy(
+            new_regulation_text=selection["context"],
+            policy_excerpt=item['excerpt'],
+            policy_id=item['policy_id'],
+            usage=usage,
+            tier=tier,
+            deadline=deadline
+        )
+        analysis["regulation_clauses_used"] = selection["clause_ids"]
+        return analysis
+
+    def _escalate(
+        self,
+        item: Dict[str, Any],
+        context: Dict[str, Any],
+        analysis: Dict[str, Any],
+        deadline: Optional[float],
+        usage: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        Cascade step for one first-tier verdict: re-run it on the strong
+        model when it is uncertain or HIGH
+
+        Returns:
+            (final verdict, escalation reason or None when not escalated)
+        """
+        if analysis.get("unaudited"):
+            return analysis, None
+        reason = self.escalation_reason(analysis)
+        if reason is None:
+            analysis["model_tier"] = "fast"
+            return analysis, None
+        if not self.has_time_for_call(deadline, "strong"):
+            # Keep the first-tier verdict rather than dropping it
+            analysis["model_tier"] = "fast"
+            analysis["escalation_skipped"] = reason
+            return analysis, None
+
+        print(f"   ⬆️  Escalating {item['policy_id']} to strong model ({reason})")
+        strong = self.analyze_single_policy(
+            new_regulation_text=context["context"],
+            policy_excerpt=item['excerpt'],
+            policy_id=item['policy_id'],
+            usage=usage,
+            tier="strong",
+            deadline=deadline
+        )
+        if strong.get("unaudited"):
+            # The strong model never ran: not counted as an escalation
+            analysis["model_tier"] = "fast"
+            analysis["escalation_skipped"] = reason
+            return analysis, None
+        strong["regulation_clauses_used"] = context["clause_ids"]
+        strong["model_tier"] = "strong"
+        strong["escalation_reason"] = reason
+        return strong, reason
+
+    def _publish_verdicts(
+        self,
+        plan: Dict[str, Any],
+        positions: List[int],
+        analyses: List[Dict[str, Any]],
+        on_verdict: Optional[VerdictCallback]
+    ) -> None:
+        """
+        Finalize LLM verdicts as they become final: re-anchor quotes taken
+        from compact obligation lines in the raw excerpt, then pass each one
+        to on_verdict with its retrieval index
+
+        Args:
+            positions: Indexes of the verdicts in plan["audit_items"]
+        """
+        for position, analysis in zip(positions, analyses):
+            item = plan["audit_items"][position]
+            if "raw_excerpt" in item and "quote_spans" in analysis:
+                self.aligner.requote(analysis, "policy", item['raw_excerpt'])
+            self._notify(on_verdict, plan["audit_indices"][position], analysis)
+
+    @staticmethod
+    def _notify(on_verdict: Optional[VerdictCallback], index: int, analysis: Dict[str, Any]) -> None:
+        if on_verdict is None:
+            return
+        try:
+            on_verdict(index, analysis)
+        except Exception as e:
+            print(f"⚠️  Verdict callback failed: {e}")
+
+    def _publish_local_verdicts(self, plan: Dict[str, Any], on_verdict: Optional[VerdictCallback]) -> None:
+        """Pass the rule engine and pre-screen verdicts (final before any LLM call) to on_verdict"""
+        local = {**plan["prescreened"], **plan["rule_verdicts"]}
+        for index in sorted(local):
+            self._notify(on_verdict, index, local[index])
+
+    def _finish_audit(
+        self,
+        new_regulation_text: str,
+        policy_items: List[Dict[str, Any]],
+        plan: Dict[str, Any],
+        llm_analyses: List[Dict[str, Any]],
+        usage: Dict[str, Any],
+        escalations: Dict[str, int],
+        batch_mode: bool,
+        cascade_mode: bool,
+        deadline: Optional[float]
+    ) -> Dict[str, Any]:
+        """Merge local and LLM verdicts back into retrieval order and build the result"""
+        audit_items = plan["audit_items"]
+        compact_items = plan["compact_items"]
+        selections = plan["selections"]
+        batch_selection = plan["batch_selection"]
+        rule_stats = plan["rule_stats"]
+        prescreen_stats = plan["prescreen_stats"]
         conflicts = []
-        
-        for i, item in enumerate(policy_items, 1):
-            print(f"\n[{i}/{len(policy_items)}] Analyzing Policy: {item['policy_id']}")
-            
-            analysis = self.analyze_single_policy(
-                new_regulation_text=new_regulation_text,
-                policy_excerpt=item['excerpt'],
-                policy_id=item['policy_id']
-            )
+
+        # Restore retrieval order (rule and pre-screen verdicts interleaved)
+        by_index = dict(zip(plan["audit_indices"], llm_analyses))
+        by_index.update(plan["prescreened"])
+        by_index.update(plan["rule_verdicts"])
+        analyses = [by_index[i] for i in range(len(policy_items))]
             
+        for analysis in analyses:
             # Only keep actual conflicts (or log all for transparency)
-            if analysis.get("has_conflict", False):
+            if analysis.get("unaudited"):
+                print(f"   ⏱️  {analysis['policy_id']}: Not audited (latency budget exhausted)")
+            elif analysis.get("has_conflict", False):
                 conflicts.append(analysis)
-                print(f"   ⚠️  {analysis['severity']} risk detected")
+                print(f"   ⚠️  {analysis['policy_id']}: {analysis['severity']} risk detected")
             else:
-                print(f"   ✅ No conflict detected")
+                print(f"   ✅ {analysis['policy_id']}: No conflict detected")
+
+        token_usage = self._token_usage_report(
+            [s["context"] for s in selections],
+            batch_selection["context"],
+            audit_items,
+            usage,
+            batch_mode
+        )
         
         result = {
             "regulation_text": new_regulation_text,
             "total_policies_analyzed": len(policy_items),
             "total_conflicts_found": len(conflicts),
-            "conflicts": conflicts
+            "conflicts": conflicts,
+            "token_usage": token_usage
         }
         
+        if self.verdict_cache is not None:
+            lookups = usage["cache_hits"] + usage["cache_misses"]
+            result["verdict_cache"] = {
+                "hits": usage["cache_hits"],
+                "misses": usage["cache_misses"],
+                "hit_rate": round(usage["cache_hits"] / lookups, 4) if lookups else 0.0,
+                "overall": self.cache_stats()
+            }
+
+        if prescreen_stats is not None:
+            result["prescreen"] = prescreen_stats
+
+        if rule_stats is not None:
+            result["rule_engine"] = rule_stats
+
+        if compact_items:
+            result["obligation_records"] = {
+                "compact_excerpts": len(compact_items),
+                "excerpt_chars_saved": sum(
+                    len(item['raw_excerpt']) - len(item['excerpt']) for item in compact_items
+                )
+            }
+
+        if cascade_mode:
+            result["cascade"] = self._cascade_report(usage, escalations)
+
+        unaudited = [
+            {"policy_id": item['policy_id'], "score": item.get('score'), "rank": i + 1}
+            for i, (item, analysis) in enumerate(zip(policy_items, analyses))
+            if analysis.get("unaudited")
+        ]
+        if deadline is not None:
+            result["unaudited"] = {
+                "count": len(unaudited),
+                "reason": "latency_budget" if unaudited else None,
+                "policies": unaudited,
+                "seconds_left": round(deadline - time.monotonic(), 3)
+            }
+
+        if any(s["clause_ids"] for s in selections):
+            used = {}
+            for selection in ([batch_selection] if batch_mode else selections):
+                for clause in selection["clauses"]:
+                    used[clause["clause_id"]] = {"start": clause["start"], "end": clause["end"]}
+            result["clause_selection"] = {
+                "token_budget": self.clause_selector.token_budget,
+                "per_policy": [
+                    {"policy_id": a["policy_id"], "clause_ids": a.get("regulation_clauses_used", [])}
+                    for a in llm_analyses
+                ],
+                "clauses": used
+            }
+
         print("\n" + "=" * 60)
         print(f"✅ Analysis Complete: {len(conflicts)} conflicts found")
+        if cascade_mode:
+            print(f"   Cascade: {sum(escalations.values())} escalations to the strong model")
+        if rule_stats is not None:
+            print(f"   Rule engine: {rule_stats['llm_calls_saved']} LLM calls saved")
+        if prescreen_stats is not None:
+            print(f"   Pre-screen: {prescreen_stats['llm_calls_saved']} LLM calls saved")
+        if "unaudited" in result and result["unaudited"]["count"]:
+            print(f"   Unaudited (latency budget): {result['unaudited']['count']} excerpts")
+        if self.verdict_cache is not None:
+            print(f"   Verdict cache: {usage['cache_hits']} hits, {usage['cache_misses']} misses")
+        print(f"   Prompt tokens — batch: {token_usage['batch']['prompt_tokens']}"
+              f" | single: {token_usage['single']['prompt_tokens']}")
         print("=" * 60)
         
         return result
 
 
+    def run(
+        self,
+        new_regulation_text: str,
+        policy_items: List[Dict[str, Any]],
+        batch_mode: bool = False,
+        cascade_mode: bool = False,
+        deadline: Optional[float] = None,
+        on_verdict: Optional[VerdictCallback] = None
+    ) -> Dict[str, Any]:
+        """
+        Main execution: Analyze all policy excerpts against the new regulation
+
+        TSD Flow:
+        1. Receive Top 5 excerpts from Agent 1 (Policy Researcher)
+        2. Analyze each one individually (or all at once in batch mode)
+        3. Return structured analysis for Agent 3 (Report Generator)
+
+        Args:
+            new_regulation_text: The complete new regulation text
+            policy_items: List of dicts from Agent 1, each with:
+                - policy_id
+                - excerpt
+                - score
+            batch_mode: Send the regulation once with all excerpts (default: False)
+            cascade_mode: Audit with the fast model first, escalate HIGH /
+                          low-confidence / unparseable verdicts (default: False)
+            deadline: time.monotonic() value by which auditing must stop;
+                      excerpts are audited in retrieval (rank) order, so the
+                      lowest-ranked ones are the ones left unaudited
+            on_verdict: Called as on_verdict(index, verdict) as soon as each
+                        excerpt's verdict is final (index in policy_items);
+                        local verdicts come first, LLM verdicts as they
+                        arrive (after escalation in cascade mode)
+
+        Returns:
+            Dict with:
+            - regulation_text: Original regulation
+            - total_policies_analyzed: Count
+            - conflicts: List of analysis results
+            - token_usage: Batch vs single token usage, side by side
+            - verdict_cache: Cache hits/misses for this run (when enabled)
+            - prescreen: LLM calls saved by the pre-screen (when enabled)
+            - rule_engine: Conflicts resolved without the LLM (when enabled)
+            - obligation_records: Excerpts audited through compact records
+            - clause_selection: Regulation clauses sent per policy (when applied)
+            - cascade: Per-tier calls, latency and escalations (cascade mode)
+            - unaudited: Excerpts skipped because the deadline was reached
+        """
+        self._print_run_header(batch_mode, cascade_mode)
+        usage = self._new_usage()
+        first_tier = "fast" if cascade_mode else "strong"
+
+        plan = self._prepare_audit(new_regulation_text, policy_items)
+        audit_items = plan["audit_items"]
+        self._publish_local_verdicts(plan, on_verdict)
+
+        if batch_mode:
+            llm_analyses = self._audit_batch(plan, usage, first_tier, deadline)
+            if not cascade_mode:
+                self._publish_verdicts(plan, list(range(len(llm_analyses))), llm_analyses, on_verdict)
+        else:
+            llm_analyses = []
+            for i, (item, selection) in enumerate(zip(audit_items, plan["selections"]), 1):
+                llm_analyses.append(
+                    self._audit_item(i, len(audit_items), item, selection, first_tier, deadline, usage)
+                )
+                if not cascade_mode:
+                    self._publish_verdicts(plan, [i - 1], llm_analyses[-1:], on_verdict)
+
+        # Cascade: re-run uncertain or HIGH first-tier verdicts on the strong model
+        escalations: Dict[str, int] = {}
+        if cascade_mode:
+            for i, (item, selection) in enumerate(zip(audit_items, plan["selections"])):
+                context = plan["batch_selection"] if batch_mode else selection
+                llm_analyses[i], reason = self._escalate(item, context, llm_analyses[i], deadline, usage)
+                if reason is not None:
+                    escalations[reason] = escalations.get(reason, 0) + 1
+                self._publish_verdicts(plan, [i], llm_analyses[i:i + 1], on_verdict)
+
+        return self._finish_audit(
+            new_regulation_text, policy_items, plan, llm_analyses, usage,
+            escalations, batch_mode, cascade_mode, deadline
+        )
+
+    async def _gather_calls(
+        self,
+        calls: List[Callable[[Dict[str, Any]], Any]],
+        usage: Dict[str, Any],
+        concurrency: int,
+        on_result: Optional[Callable[[int, Any], None]] = None
+    ) -> List[Any]:
+        """
+        Run blocking audit calls as concurrent awaitables (worker threads,
+        at most concurrency at once); each call gets its own usage counter,
+        merged into usage in call order. on_result(position, result) is
+        called on the event loop as each call finishes.
+
+        The shared rate-limited LLM client is thread-safe, so the calls
+        queue on the provider quota instead of on each other.
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def run_call(position, call):
+            call_usage = self._new_usage()
+            async with semaphore:
+                result = await asyncio.to_thread(call, call_usage)
+            if on_result is not None:
+                on_result(position, result)
+            return result, call_usage
+
+        outcomes = await asyncio.gather(*(run_call(i, call) for i, call in enumerate(calls)))
+        for _, call_usage in outcomes:
+            self._merge_usage(usage, call_usage)
+        return [result for result, _ in outcomes]
+
+    async def run_async(
+        self,
+        new_regulation_text: str,
+        policy_items: List[Dict[str, Any]],
+        batch_mode: bool = False,
+        cascade_mode: bool = False,
+        deadline: Optional[float] = None,
+        concurrency: int = AUDIT_CONCURRENCY,
+        on_verdict: Optional[VerdictCallback] = None
+    ) -> Dict[str, Any]:
+        """
+        Async run(): same phases and result, without blocking the event loop
+
+        The local phases (rule engine, pre-screen and clause embeddings) run
+        in a worker thread; in single mode the per-excerpt LLM calls, and in
+        cascade mode the escalations, are issued concurrently (up to
+        concurrency at once, in rank order). With a deadline, excerpts whose
+        call cannot start in time are still returned unaudited. on_verdict
+        receives the verdicts in completion order, not rank order.
+
+        Args:
+            concurrency: Max audit calls in flight (default: ARCA_AUDIT_CONCURRENCY)
+            (others: see run)
+        """
+        self._print_run_header(batch_mode, cascade_mode)
+        usage = self._new_usage()
+        first_tier = "fast" if cascade_mode else "strong"
+
+        plan = await asyncio.to_thread(self._prepare_audit, new_regulation_text, policy_items)
+        audit_items = plan["audit_items"]
+        self._publish_local_verdicts(plan, on_verdict)
+
+        def publish(position: int, analysis: Dict[str, Any]) -> None:
+            self._publish_verdicts(plan, [position], [analysis], on_verdict)
+
+        if batch_mode:
+            llm_analyses = await asyncio.to_thread(self._audit_batch, plan, usage, first_tier, deadline)
+            if not cascade_mode:
+                self._publish_verdicts(plan, list(range(len(llm_analyses))), llm_analyses, on_verdict)
+        else:
+            llm_analyses = await self._gather_calls(
+                [
+                    partial(self._audit_item, i, len(audit_items), item, selection, first_tier, deadline)
+                    for i, (item, selection) in enumerate(zip(audit_items, plan["selections"]), 1)
+                ],
+                usage,
+                concurrency,
+                on_result=None if cascade_mode else publish
+            )
+
+        escalations: Dict[str, int] = {}
+        if cascade_mode:
+            outcomes = await self._gather_calls(
+                [
+                    partial(
+                        self._escalate,
+                        item,
+                        plan["batch_selection"] if batch_mode else selection,
+                        analysis,
+                        deadline
+                    )
+                    for item, selection, analysis in zip(audit_items, plan["selections"], llm_analyses)
+                ],
+                usage,
+                concurrency,
+                on_result=lambda position, outcome: publish(position, outcome[0])
+            )
+            llm_analyses = []
+            for analysis, reason in outcomes:
+                llm_analyses.append(analysis)
+                if reason is not None:
+                    escalations[reason] = escalations.get(reason, 0) + 1
+
+        return await asyncio.to_thread(
+            self._finish_audit,
+            new_regulation_text, policy_items, plan, llm_analyses, usage,
+            escalations, batch_mode, cascade_mode, deadline
+        )
+
 def quick_test():
     """Test the Compliance Auditor with sample data"""
     from policy_researcher import PolicyResearcherAgent
@@ -0,0 +1,304 @@
+# agents/obligation_records.py
+"""
+Structured Policy Obligations (ARCA System)
+
+Optional ingest stage: every policy chunk is turned ONCE into compact
+obligation records, so later regulations reuse them instead of re-reading
+raw chunk text.
+
+Record schema (one per obligation in a chunk):
+- actor: Who must act ("IT department", "employees", ...)
+- action: What they must / may / must not do
+- deadline: Time limit or period, verbatim ("within 30 days"), or null
+- scope: What or whom it applies to, or null
+- modality: "must" | "may" | "must not"
+
+Storage: vectorstore/obligations.json, next to the FAISS index
+- Records are keyed by a content hash of the chunk text, so re-ingesting
+  only extracts chunks that changed
+- The file carries a fingerprint of index.faiss; the Policy Researcher
+  ignores records built for a different index
+
+Build: python ingest.py --obligations (or ARCA_INGEST_OBLIGATIONS=1)
+"""
+
+import os
+import sys
+import json
+import re
+import hashlib
+from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
+
+# Project root (arca/) holds the shared infrastructure modules
+PROJECT_ROOT = Path(__file__).parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from disk_cache import content_hash
+
+OBLIGATIONS_FILENAME = "obligations.json"
+STORE_VERSION = 1
+# Bump when OBLIGATION_PROMPT changes so stale records are re-extracted
+EXTRACTOR_VERSION = "obligations-v1"
+
+OBLIGATION_MODEL = os.getenv("ARCA_OBLIGATION_MODEL", "gemini-2.5-flash")
+OBLIGATION_WORKERS = int(os.getenv("ARCA_OBLIGATION_WORKERS", "4"))
+
+MODALITIES = ("must", "may", "must not")
+MODALITY_ALIASES = {
+    "shall": "must",
+    "required": "must",
+    "mandatory": "must",
+    "should": "must",
+    "shall not": "must not",
+    "may not": "must not",
+    "prohibited": "must not",
+    "forbidden": "must not",
+    "can": "may",
+    "permitted": "may",
+    "allowed": "may"
+}
+RECORD_FIELDS = ("actor", "action", "deadline", "scope", "modality")
+
+OBLIGATION_PROMPT = """You are a legal analyst extracting obligations from an internal company policy.
+
+POLICY CHUNK:
+{chunk}
+
+Extract every obligation, permission or prohibition stated in the chunk.
+Return a JSON array (no other text); use an empty array if there are none:
+[
+  {{
+    "actor": "Who must act (e.g. 'employees', 'IT department')",
+    "action": "What they must / may / must not do (short verb phrase)",
+    "deadline": "Time limit or period verbatim (e.g. 'within 30 days') or null",
+    "scope": "What or whom the obligation applies to, or null",
+    "modality": "must" | "may" | "must not"
+  }}
+]
+"""
+
+
+def index_fingerprint(vector_dir: str) -> Optional[str]:
+    """SHA-256 of index.faiss (None when the index does not exist)"""
+    path = os.path.join(vector_dir, "index.faiss")
+    if not os.path.exists(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def normalize_record(raw: Any) -> Optional[Dict[str, Any]]:
+    """Validate one LLM record; None when it has no usable action"""
+    if not isinstance(raw, dict):
+        return None
+
+    record = {}
+    for field in RECORD_FIELDS:
+        value = raw.get(field)
+        if isinstance(value, str):
+            value = " ".join(value.split()) or None
+            if value and value.lower() in ("null", "none", "n/a"):
+                value = None
+        elif value is not None:
+            value = str(value)
+        record[field] = value
+
+    if not record["action"]:
+        return None
+
+    modality = (record["modality"] or "must").lower()
+    record["modality"] = MODALITY_ALIASES.get(modality, modality)
+    if record["modality"] not in MODALITIES:
+        record["modality"] = "must"
+    return record
+
+
+def parse_obligation_response(response: str) -> List[Dict[str, Any]]:
+    """Parse the extractor's JSON array (handles markdown code blocks)"""
+    match = re.search(r'\[.*\]', response, re.DOTALL)
+    if not match:
+        raise ValueError("No valid JSON array found in LLM response")
+    records = [normalize_record(entry) for entry in json.loads(match.group())]
+    return [record for record in records if record is not None]
+
+
+def render_obligations(records: List[Dict[str, Any]]) -> str:
+    """
+    Compact text form used in auditor prompts, one obligation per line:
+    "- <actor> MUST <action> [deadline: ...] [scope: ...]"
+    (the deadline is omitted when the action already states it)
+    """
+    lines = []
+    for record in records:
+        line = f"- {record.get('actor') or 'Unspecified'} {record['modality'].upper()} {record['action']}"
+        deadline = record.get("deadline")
+        if deadline and deadline.lower() not in record["action"].lower():
+            line += f" [deadline: {deadline}]"
+        if record.get("scope"):
+            line += f" [scope: {record['scope']}]"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+class ObligationStore:
+    """
+    Obligation records for the chunks of one FAISS index
+    """
+
+    def __init__(
+        self,
+        records: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        fingerprint: Optional[str] = None,
+        extractor_version: str = EXTRACTOR_VERSION,
+        model: Optional[str] = None
+    ):
+        self.records = records or {}
+        self.fingerprint = fingerprint
+        self.extractor_version = extractor_version
+        self.model = model
+
+    @staticmethod
+    def chunk_key(chunk_text: str) -> str:
+        return content_hash(chunk_text)
+
+    def get(self, chunk_text: str) -> Optional[List[Dict[str, Any]]]:
+        """Records for a chunk (None when the chunk was never extracted)"""
+        return self.records.get(self.chunk_key(chunk_text))
+
+    def is_current(self, vector_dir: str) -> bool:
+        """True when the records were built for the index currently on disk"""
+        return (
+            self.fingerprint is not None
+            and self.extractor_version == EXTRACTOR_VERSION
+            and self.fingerprint == index_fingerprint(vector_dir)
+        )
+
+    @classmethod
+    def load(cls, vector_dir: str) -> Optional["ObligationStore"]:
+        """Load vector_dir/obligations.json (None when missing or unreadable)"""
+        path = os.path.join(vector_dir, OBLIGATIONS_FILENAME)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Could not read obligation records ({e})")
+            return None
+        if data.get("version") != STORE_VERSION:
+            return None
+        return cls(
+            records=data.get("records", {}),
+            fingerprint=data.get("index_fingerprint"),
+            extractor_version=data.get("extractor_version", ""),
+            model=data.get("model")
+        )
+
+    def save(self, vector_dir: str) -> str:
+        """Write vector_dir/obligations.json atomically and return its path"""
+        path = os.path.join(vector_dir, OBLIGATIONS_FILENAME)
+        payload = {
+            "version": STORE_VERSION,
+            "extractor_version": self.extractor_version,
+            "model": self.model,
+            "index_fingerprint": self.fingerprint,
+            "created_at": datetime.now().isoformat(),
+            "total_chunks": len(self.records),
+            "records": self.records
+        }
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, path)
+        return path
+
+
+def extract_chunk_obligations(chunk_text: str, llm: Any) -> List[Dict[str, Any]]:
+    """
+    Extract obligation records from one chunk with the LLM
+
+    Raises:
+        Exception: LLM or parsing errors (the caller decides how to degrade)
+    """
+    response = llm.invoke(OBLIGATION_PROMPT.format(chunk=chunk_text))
+    return parse_obligation_response(response)
+
+
+def build_obligation_store(
+    chunk_texts: List[str],
+    vector_dir: str,
+    llm: Optional[Any] = None,
+    workers: int = OBLIGATION_WORKERS
+) -> ObligationStore:
+    """
+    Extract records for every chunk and save them next to the index
+
+    Chunks already extracted by the same extractor version (same content
+    hash) are reused from the previous obligations.json.
+
+    Args:
+        chunk_texts: page_content of every chunk in the index
+        vector_dir: Directory holding index.faiss (written before this runs)
+        llm: Client with .invoke(prompt) (default: shared rate-limited client)
+        workers: Concurrent extraction calls (the shared limiter still applies)
+
+    Returns:
+        The saved ObligationStore
+    """
+    if llm is None:
+        from llm_client import get_llm
+        llm = get_llm(model=OBLIGATION_MODEL, temperature=0.0)
+
+    previous = ObligationStore.load(vector_dir)
+    reusable = (
+        previous.records
+        if previous is not None and previous.extractor_version == EXTRACTOR_VERSION
+        else {}
+    )
+
+    records: Dict[str, List[Dict[str, Any]]] = {}
+    pending: Dict[str, str] = {}
+    for text in chunk_texts:
+        key = ObligationStore.chunk_key(text)
+        if key in reusable:
+            records[key] = reusable[key]
+        else:
+            pending.setdefault(key, text)
+
+    print(f"📜 Extracting obligations: {len(pending)} new chunks, {len(records)} reused")
+
+    failures = 0
+
+    def extract(item):
+        key, text = item
+        try:
+            return key, extract_chunk_obligations(text, llm)
+        except Exception as e:
+            print(f"   ⚠️  Obligation extraction failed for chunk {key[:12]}: {e}")
+            return key, None
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for key, chunk_records in pool.map(extract, pending.items()):
+            if chunk_records is None:
+                failures += 1
+                continue
+            records[key] = chunk_records
+
+    store = ObligationStore(
+        records=records,
+        fingerprint=index_fingerprint(vector_dir),
+        model=getattr(llm, "model", None)
+    )
+    path = store.save(vector_dir)
+
+    total = sum(len(r) for r in records.values())
+    print(f"✅ Obligation records saved: {path}")
+    print(f"   Chunks: {len(records)} | Obligations: {total} | Failed: {failures}")
+    return store
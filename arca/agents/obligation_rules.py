@@ -0,0 +1,469 @@
+# agents/obligation_rules.py
+"""
+Obligation Rule Engine (ARCA System)
+
+Deterministic check for numeric and temporal obligations that runs BEFORE
+the LLM audit. Plain numeric mismatches ("retained 90 days" vs "deleted
+within 30 days", "5 business days" vs "48 hours") get an immediate HIGH
+verdict; everything else goes to the LLM as before.
+
+Pipeline:
+1. Extract: durations, percentages and monetary amounts, per sentence
+2. Normalize: durations -> hour intervals (business days and months are
+   ranges), currencies -> ISO code
+3. Classify: maximum ("within", "no later than"), minimum ("at least"),
+   threshold ("exceeding") or plain value, from the words before the number
+4. Compare: regulation vs policy obligations of the same action group
+   (retention, notification, response, ...), subject (data, logs, ...),
+   parties (authority, customers, CISO, ...) and anchoring event (breach,
+   request, account closure, ...)
+
+Only clear-cut cases are resolved: sentences touching several action groups,
+several quantities of the same kind, non-overlapping subjects, or different
+parties or anchoring events are left to the LLM. A conflict is reported only when the policy falls outside the
+regulation's bound under every interpretation of the units.
+"""
+
+import re
+import math
+from typing import List, Dict, Any, Optional, Tuple
+
+HOURS_PER_DAY = 24.0
+
+# Duration units -> (min hours, max hours)
+DURATION_UNITS = {
+    "hour": (1.0, 1.0),
+    "day": (HOURS_PER_DAY, HOURS_PER_DAY),
+    "week": (7 * HOURS_PER_DAY, 7 * HOURS_PER_DAY),
+    "month": (28 * HOURS_PER_DAY, 31 * HOURS_PER_DAY),
+    "year": (365 * HOURS_PER_DAY, 366 * HOURS_PER_DAY),
+}
+
+NUMBER_WORDS = {
+    "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7,
+    "eight": 8, "nine": 9, "ten": 10, "eleven": 11, "twelve": 12, "fifteen": 15,
+    "twenty": 20, "thirty": 30, "forty": 40, "forty-five": 45, "sixty": 60, "ninety": 90
+}
+
+CURRENCIES = {
+    "mad": "MAD", "dh": "MAD", "dhs": "MAD", "dirham": "MAD", "dirhams": "MAD",
+    "usd": "USD", "$": "USD", "dollar": "USD", "dollars": "USD",
+    "eur": "EUR", "€": "EUR", "euro": "EUR", "euros": "EUR",
+    "gbp": "GBP", "£": "GBP"
+}
+
+_NUMBER = r"\d{1,3}(?:[ ,.]\d{3})+(?:\.\d+)?|\d+(?:[.,]\d+)?"
+
+DURATION_RE = re.compile(
+    r"\b(?P<num>\d+(?:[.,]\d+)?|" + "|".join(sorted(NUMBER_WORDS, key=len, reverse=True)) + r")"
+    r"(?:\s*\(\s*\d+\s*\))?[\s-]*"
+    r"(?:(?P<qual>business|working|calendar)[\s-]+)?"
+    r"(?P<unit>hours?|days?|weeks?|months?|years?)\b",
+    re.IGNORECASE
+)
+PERCENT_RE = re.compile(r"\b(?P<num>\d+(?:[.,]\d+)?)\s*(?:%|per\s?cent\b)", re.IGNORECASE)
+MONEY_RE = re.compile(
+    r"(?:(?P<cur1>MAD|DHS?|USD|EUR|GBP|\$|€|£)\s?(?P<num1>" + _NUMBER + r"))"
+    r"|(?:\b(?P<num2>" + _NUMBER + r")\s?(?P<cur2>MAD|DHS?|dirhams?|USD|dollars?|EUR|euros?|GBP)\b)",
+    re.IGNORECASE
+)
+
+SENTENCE_RE = re.compile(r"[^.;!?\n]+(?:[.;!?]|$)", re.MULTILINE)
+WORD_RE = re.compile(r"[a-z]+")
+
+# Cue phrases looked up in the words just before a quantity.
+# The cue ending closest to the number wins; on ties the longer cue wins
+# ("not exceeding" beats "exceeding").
+BOUND_CUES = {
+    "max": (
+        "within", "no later than", "not later than", "not exceed", "not exceeding",
+        "not to exceed", "no more than", "not more than", "at most", "maximum",
+        "maximum of", "up to", "no longer than", "not longer than", "before", "every"
+    ),
+    "min": (
+        "at least", "minimum", "minimum of", "not less than", "no less than",
+        "no fewer than", "not fewer than", "no shorter than"
+    ),
+    "threshold": (
+        "exceeding", "exceeds", "exceed", "above", "over", "more than",
+        "greater than", "in excess of", "higher than", "longer than"
+    )
+}
+CUE_WINDOW_CHARS = 40
+NEGATION_RE = re.compile(r"\b(?:not|no|never)\b")
+
+# Action groups: an obligation is compared only with obligations of the same group
+ACTION_GROUPS = {
+    "retention": {
+        "retain", "retained", "retention", "keep", "kept", "store", "stored", "storage",
+        "archive", "archived", "delete", "deleted", "deletion", "erase", "erased",
+        "erasure", "destroy", "destroyed", "destruction", "purge", "purged",
+        "dispose", "disposed", "disposal"
+    },
+    "notification": {
+        "notify", "notified", "notification", "inform", "informed", "report",
+        "reported", "reporting", "disclose", "disclosed", "disclosure", "declare",
+        "declared", "declaration"
+    },
+    "response": {
+        "respond", "responded", "response", "reply", "acknowledge", "acknowledged",
+        "acknowledgement", "confirm", "confirmed", "confirmation", "answer"
+    },
+    "gifts": {"gift", "gifts", "hospitality", "entertainment", "invitation", "invitations"},
+    "credentials": {"password", "passwords", "credential", "credentials", "passphrase"},
+    "training": {"training", "trained", "awareness"}
+}
+# Topic groups take precedence over the action verb in the same sentence
+# ("Gifts exceeding MAD 500 must be declared" is a gifts rule, not a notification)
+TOPIC_GROUPS = ("gifts", "credentials", "training")
+
+# Subjects: when both sides name one, they must share it
+SUBJECT_TERMS = {
+    "personal_data": {"data", "information", "pii"},
+    "logs": {"log", "logs", "logging"},
+    "records": {"record", "records", "document", "documents", "file", "files"},
+    "backups": {"backup", "backups"},
+    "incidents": {"incident", "incidents", "breach", "breaches"},
+    "requests": {"request", "requests", "complaint", "complaints"},
+    "accounts": {"account", "accounts"}
+}
+
+# Parties (actor or recipient): both sides must name the same ones, or none.
+# "notify the supervisory authority" and "report to the CISO" are different
+# obligations even when the deadlines are comparable.
+PARTY_TERMS = {
+    "authority": {"authority", "authorities", "regulator", "regulators", "supervisory", "cndp", "ministry"},
+    "data_subjects": {"subjects", "individual", "individuals", "persons", "users"},
+    "customers": {"customer", "customers", "client", "clients", "consumer", "consumers"},
+    "employees": {"employee", "employees", "staff", "personnel", "workers"},
+    "management": {
+        "ciso", "dpo", "management", "manager", "managers", "board", "officer",
+        "executive", "committee"
+    },
+    "internal_teams": {"department", "departments", "team", "teams"},
+    "third_parties": {"vendor", "vendors", "supplier", "suppliers", "partner", "partners", "processor", "processors"}
+}
+# Party words used as a modifier ("customer data", "employee records") name
+# whose data it is, not who acts or is notified
+PARTY_MODIFIED_WORDS = set().union(*SUBJECT_TERMS.values()) | {"personal", "s"}
+
+# Anchoring events (when the clock starts): both sides must name the same ones, or none
+EVENT_TERMS = {
+    "breach": {"breach", "breaches"},
+    "incident": {"incident", "incidents"},
+    "request": {"request", "requests", "complaint", "complaints", "receipt"},
+    "closure": {"closure", "termination", "terminated", "closed", "expiry", "expiration"},
+    "collection": {"collection", "collected"},
+    "awareness": {"aware", "awareness", "discovery", "discovered", "detection", "detected"}
+}
+
+KIND_PHRASES = {
+    "max": "at most",
+    "min": "at least",
+    "threshold": "above",
+    "value": ""
+}
+
+
+# ─────────────────────────────────────────────────────────
+# EXTRACTION
+# ─────────────────────────────────────────────────────────
+
+def _parse_number(raw: str) -> Optional[float]:
+    raw = raw.strip().lower()
+    if raw in NUMBER_WORDS:
+        return float(NUMBER_WORDS[raw])
+    # "10 000", "10,000", "10.000" as thousands separators; "2.5" / "2,5" as decimals
+    if re.fullmatch(r"\d{1,3}(?:[ ,.]\d{3})+", raw):
+        return float(re.sub(r"[ ,.]", "", raw))
+    try:
+        return float(raw.replace(" ", "").replace(",", "."))
+    except ValueError:
+        return None
+
+
+def _business_day_hours(days: float) -> Tuple[float, float]:
+    """n business days span n..n + 2 weekend days per started week (calendar)"""
+    weekend_days = 2 * math.ceil(days / 5)
+    return days * HOURS_PER_DAY, (days + weekend_days) * HOURS_PER_DAY
+
+
+def extract_quantities(sentence: str) -> List[Dict[str, Any]]:
+    """
+    Find durations, percentages and monetary amounts in a sentence
+
+    Returns:
+        List of dicts: dimension (duration | percent | money:<CUR>),
+        low, high (normalized), text, start, end
+    """
+    quantities = []
+
+    for match in DURATION_RE.finditer(sentence):
+        value = _parse_number(match.group("num"))
+        if value is None:
+            continue
+        unit = match.group("unit").lower().rstrip("s")
+        qualifier = (match.group("qual") or "").lower()
+        if unit == "day" and qualifier in ("business", "working"):
+            low, high = _business_day_hours(value)
+        else:
+            unit_low, unit_high = DURATION_UNITS[unit]
+            low, high = value * unit_low, value * unit_high
+        quantities.append({
+            "dimension": "duration", "low": low, "high": high,
+            "text": match.group(0).strip(), "start": match.start(), "end": match.end()
+        })
+
+    for match in PERCENT_RE.finditer(sentence):
+        value = _parse_number(match.group("num"))
+        if value is None:
+            continue
+        quantities.append({
+            "dimension": "percent", "low": value, "high": value,
+            "text": match.group(0).strip(), "start": match.start(), "end": match.end()
+        })
+
+    for match in MONEY_RE.finditer(sentence):
+        raw = match.group("num1") or match.group("num2")
+        currency = CURRENCIES.get((match.group("cur1") or match.group("cur2")).lower())
+        value = _parse_number(raw)
+        if value is None or currency is None:
+            continue
+        quantities.append({
+            "dimension": f"money:{currency}", "low": value, "high": value,
+            "text": match.group(0).strip(), "start": match.start(), "end": match.end()
+        })
+
+    quantities.sort(key=lambda q: q["start"])
+    return quantities
+
+
+def _bound_kind(prefix: str) -> str:
+    """max / min / threshold / value, from the text just before a quantity"""
+    window = prefix[-CUE_WINDOW_CHARS:].lower()
+    best = None  # (end, length, kind, cue_start)
+    for kind, cues in BOUND_CUES.items():
+        for cue in cues:
+            for match in re.finditer(r"\b" + re.escape(cue) + r"\b", window):
+                candidate = (match.end(), len(cue), kind, match.start())
+                if best is None or candidate[:2] > best[:2]:
+                    best = candidate
+    if best is None:
+        return "value"
+
+    kind = best[2]
+    # "must not be kept longer than 30 days" is a maximum, not a trigger threshold
+    if kind == "threshold" and NEGATION_RE.search(window[:best[3]]):
+        return "max"
+    return kind
+
+
+def _terms(sentence: str, vocabulary: Dict[str, set]) -> List[str]:
+    words = set(WORD_RE.findall(sentence.lower()))
+    return sorted(name for name, terms in vocabulary.items() if words & terms)
+
+
+def _parties(sentence: str) -> List[str]:
+    words = WORD_RE.findall(sentence.lower())
+    found = set()
+    for position, word in enumerate(words):
+        following = words[position + 1] if position + 1 < len(words) else ""
+        if following in PARTY_MODIFIED_WORDS:
+            continue
+        for name, terms in PARTY_TERMS.items():
+            if word in terms:
+                found.add(name)
+    return sorted(found)
+
+
+def extract_obligations(text: str) -> List[Dict[str, Any]]:
+    """
+    Extract comparable numeric obligations from regulation or policy text
+
+    Sentences are skipped when they touch several action groups or hold
+    several quantities of the same dimension (left to the LLM).
+
+    Returns:
+        List of dicts: group, subjects, parties, events, kind, dimension,
+        low, high, quantity, sentence
+    """
+    obligations = []
+    for match in SENTENCE_RE.finditer(text):
+        sentence = match.group(0).strip()
+        if not sentence:
+            continue
+
+        groups = _terms(sentence, ACTION_GROUPS)
+        topics = [g for g in groups if g in TOPIC_GROUPS]
+        if topics:
+            groups = topics
+        if len(groups) != 1:
+            continue
+
+        quantities = extract_quantities(sentence)
+        dimensions = [q["dimension"] for q in quantities]
+        subjects = _terms(sentence, SUBJECT_TERMS)
+        parties = _parties(sentence)
+        events = _terms(sentence, EVENT_TERMS)
+
+        for quantity in quantities:
+            if dimensions.count(quantity["dimension"]) != 1:
+                continue
+            obligations.append({
+                "group": groups[0],
+                "subjects": subjects,
+                "parties": parties,
+                "events": events,
+                "kind": _bound_kind(sentence[:quantity["start"]]),
+                "dimension": quantity["dimension"],
+                "low": quantity["low"],
+                "high": quantity["high"],
+                "quantity": quantity["text"],
+                "sentence": sentence
+            })
+    return obligations
+
+
+# ─────────────────────────────────────────────────────────
+# COMPARISON
+# ─────────────────────────────────────────────────────────
+
+def compare_obligations(regulation: Dict[str, Any], policy: Dict[str, Any]) -> Optional[str]:
+    """
+    Decide whether a policy obligation clearly conflicts with a regulation one
+
+    Returns:
+        "exceeds_maximum", "below_minimum", "threshold_too_high" or None
+        (no clear-cut conflict, or not comparable)
+    """
+    if regulation["group"] != policy["group"] or regulation["dimension"] != policy["dimension"]:
+        return None
+    if regulation["subjects"] and policy["subjects"] and not set(regulation["subjects"]) & set(policy["subjects"]):
+        return None
+    # Who acts or is notified, and what starts the clock, must be the same
+    if regulation["parties"] != policy["parties"] or regulation["events"] != policy["events"]:
+        return None
+
+    if regulation["kind"] == "max" and policy["kind"] in ("max", "min", "value"):
+        # Even the shortest reading of the policy is above the longest reading of the limit
+        if policy["low"] > regulation["high"]:
+            return "exceeds_maximum"
+    elif regulation["kind"] == "min" and policy["kind"] in ("max", "min", "value"):
+        if policy["high"] < regulation["low"]:
+            return "below_minimum"
+    elif regulation["kind"] == "threshold" and policy["kind"] == "threshold":
+        if policy["low"] > regulation["high"]:
+            return "threshold_too_high"
+    return None
+
+
+def _group_label(group: str) -> str:
+    return group.replace("_", " ")
+
+
+def build_rule_verdict(
+    regulation: Dict[str, Any],
+    policy: Dict[str, Any],
+    conflict: str,
+    policy_id: str
+) -> Dict[str, Any]:
+    """HIGH verdict in the auditor's schema, with a generated summary"""
+    group = _group_label(regulation["group"])
+    policy_phrase = " ".join(filter(None, [KIND_PHRASES[policy["kind"]], policy["quantity"]]))
+
+    if conflict == "exceeds_maximum":
+        summary = (
+            f"The policy sets {policy_phrase} for {group}, beyond the regulation's "
+            f"maximum of {regulation['quantity']}."
+        )
+        recommendation = f"Shorten the policy's {group} period to at most {regulation['quantity']}."
+    elif conflict == "below_minimum":
+        summary = (
+            f"The policy sets {policy_phrase} for {group}, below the regulation's "
+            f"minimum of {regulation['quantity']}."
+        )
+        recommendation = f"Extend the policy's {group} requirement to at least {regulation['quantity']}."
+    else:
+        summary = (
+            f"The policy only applies its {group} rule above {policy['quantity']}, "
+            f"while the regulation applies it above {regulation['quantity']}."
+        )
+        recommendation = f"Lower the policy's {group} threshold to {regulation['quantity']}."
+
+    return {
+        "policy_id": policy_id,
+        "severity": "HIGH",
+        "has_conflict": True,
+        "divergence_summary": summary,
+        "conflicting_policy_excerpt": policy["sentence"][:200],
+        "new_rule_excerpt": regulation["sentence"][:200],
+        "recommendation": recommendation,
+        "confidence": 1.0,
+        "resolved_by": "rule_engine",
+        "rule": {
+            "conflict": conflict,
+            "group": regulation["group"],
+            "dimension": regulation["dimension"],
+            "regulation_quantity": regulation["quantity"],
+            "regulation_bound": regulation["kind"],
+            "policy_quantity": policy["quantity"],
+            "policy_bound": policy["kind"]
+        }
+    }
+
+
+class ObligationRuleEngine:
+    """
+    Resolve clear-cut numeric conflicts locally, before the LLM audit
+    """
+
+    def check(
+        self,
+        regulation_obligations: List[Dict[str, Any]],
+        policy_excerpt: str,
+        policy_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return a HIGH verdict for the first clear conflict, or None
+        """
+        for policy in extract_obligations(policy_excerpt):
+            for regulation in regulation_obligations:
+                conflict = compare_obligations(regulation, policy)
+                if conflict is not None:
+                    return build_rule_verdict(regulation, policy, conflict, policy_id)
+        return None
+
+    def screen(
+        self,
+        regulation_text: str,
+        policy_items: List[Dict[str, Any]]
+    ) -> Tuple[List[int], Dict[int, Dict[str, Any]], Dict[str, Any]]:
+        """
+        Split policy_items into excerpts still needing the LLM and excerpts
+        resolved by a rule
+
+        Returns:
+            (indices_to_audit, resolved_verdicts_by_index, stats)
+        """
+        regulation_obligations = extract_obligations(regulation_text)
+
+        to_audit: List[int] = []
+        resolved: Dict[int, Dict[str, Any]] = {}
+
+        for index, item in enumerate(policy_items):
+            verdict = None
+            if regulation_obligations:
+                verdict = self.check(regulation_obligations, item['excerpt'], item['policy_id'])
+            if verdict is None:
+                to_audit.append(index)
+            else:
+                resolved[index] = verdict
+
+        stats = {
+            "evaluated": len(policy_items),
+            "regulation_obligations": len(regulation_obligations),
+            "resolved": len(resolved),
+            "llm_calls_saved": len(resolved),
+            "resolved_policy_ids": [v["policy_id"] for v in resolved.values()]
+        }
+        return to_audit, resolved, stats
@@ -5,9 +5,12 @@ Agent 1: Policy Researcher (ARCA System)
 - Compliant with TSD requirements: Top 5 excerpts with IDs
 - Input: query (str)
 - Output: dict with query, items (list of dicts), concatenated_excerpts (str)
+- Items carry pre-extracted obligation records when vectorstore/obligations.json
+  matches the loaded index (see obligation_records.py)
 """
 
 import os
+import sys
 from pathlib import Path
 from typing import List, Dict, Any
 from langchain_huggingface import HuggingFaceEmbeddings
@@ -18,6 +21,11 @@ from langchain_community.vectorstores import FAISS
 CURRENT_FILE_DIR = Path(__file__).parent
 # Go up one level to get project root (arca/)
 PROJECT_ROOT = CURRENT_FILE_DIR.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from agents.obligation_records import ObligationStore
+
 # Build absolute path to vectorstore
 DEFAULT_VECTOR_DIR = str(PROJECT_ROOT / "vectorstore")
 
@@ -47,6 +55,15 @@ class PolicyResearcherAgent:
         except Exception as e:
             raise RuntimeError(f"❌ Failed to load vectorstore from {self.vector_dir}: {e}")
 
+        # Optional obligation records (only if built for this exact index)
+        self.obligation_store = ObligationStore.load(self.vector_dir)
+        if self.obligation_store is not None:
+            if self.obligation_store.is_current(self.vector_dir):
+                print(f"   📜 Obligation records loaded for {len(self.obligation_store.records)} chunks")
+            else:
+                print("   ⚠️  Obligation records are stale (index changed), ignoring them")
+                self.obligation_store = None
+
     def vector_db_search(self, query: str, k: int = TOP_K) -> List[Dict[str, Any]]:
         """
         Core tool: vector_db_search
@@ -71,13 +88,18 @@ class PolicyResearcherAgent:
             if policy_id.endswith(".md"):
                 policy_id = policy_id[:-3]  # Remove .md extension
             
-            formatted.append({
+            item = {
                 "policy_id": policy_id,
                 "excerpt": doc.page_content,
                 "score": float(score),
                 "source": metadata.get("source", "unknown"),
                 "metadata": metadata
-            })
+            }
+            if self.obligation_store is not None:
+                records = self.obligation_store.get(doc.page_content)
+                if records is not None:
+                    item["obligations"] = records
+            formatted.append(item)
 
         return formatted
 
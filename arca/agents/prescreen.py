@@ -0,0 +1,384 @@
+# agents/prescreen.py
+"""
+Compliance Auditor Pre-screen (ARCA System)
+
+Cheap local filter that runs BEFORE the LLM audit and gives clearly
+unrelated excerpts an immediate no-conflict verdict.
+
+Signals (per excerpt, against the regulation):
+- similarity: cosine similarity of MiniLM embeddings
+- keyword_overlap: share of the excerpt's content words found in the regulation
+- obligation_overlap: shared obligation vocabulary (must, within, delete, notify...)
+  and shared numeric quantities ("30 days")
+
+Scoring:
+- Default: fixed linear blend of the signals
+- Optional: small logistic-regression classifier trained on labelled pairs
+  (see train_classifier), loaded from ARCA_PRESCREEN_MODEL
+
+Excerpts scoring below the calibrated threshold are skipped. Every skipped
+item is appended to logs/prescreen_skipped.jsonl so precision can be audited.
+
+The stage is opt-in (ARCA_PRESCREEN=1 in arca_pipeline). The default threshold
+is not calibrated against any recall target; without a trained model the
+pre-screen warns at startup.
+"""
+
+import os
+import re
+import json
+import math
+import hashlib
+from pathlib import Path
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+PRESCREEN_MODEL_PATH = os.getenv(
+    "ARCA_PRESCREEN_MODEL", str(PROJECT_ROOT / "cache" / "prescreen_model.json")
+)
+PRESCREEN_LOG_PATH = os.getenv(
+    "ARCA_PRESCREEN_LOG", str(PROJECT_ROOT / "logs" / "prescreen_skipped.jsonl")
+)
+# Uncalibrated fallback (no trained model): only near-orthogonal excerpts are skipped
+DEFAULT_THRESHOLD = float(os.getenv("ARCA_PRESCREEN_THRESHOLD", "0.15"))
+
+FEATURES = ["similarity", "keyword_overlap", "obligation_overlap"]
+
+# Weights of the default (untrained) linear score
+DEFAULT_WEIGHTS = {
+    "similarity": 0.6,
+    "keyword_overlap": 0.25,
+    "obligation_overlap": 0.15
+}
+
+STOPWORDS = {
+    "about", "above", "after", "again", "also", "among", "been", "before", "being",
+    "between", "both", "could", "does", "doing", "down", "during", "each", "from",
+    "further", "have", "having", "here", "into", "itself", "more", "most", "only",
+    "other", "same", "should", "some", "such", "than", "that", "their", "them",
+    "then", "there", "these", "they", "this", "those", "through", "under", "until",
+    "very", "were", "what", "when", "where", "which", "while", "will", "with",
+    "within", "would", "your", "article", "section", "policy", "company", "shall",
+    "must", "including", "applicable", "accordance"
+}
+
+OBLIGATION_TERMS = {
+    "must", "shall", "required", "require", "requires", "mandatory", "prohibited",
+    "forbidden", "obliged", "obligation", "deadline", "within", "minimum", "maximum",
+    "least", "exceed", "retain", "retention", "delete", "deletion", "erase", "destroy",
+    "notify", "notification", "report", "inform", "consent", "approve", "approval",
+    "penalty", "sanction", "fine", "audit", "encrypt", "encryption", "record", "log"
+}
+
+WORD_RE = re.compile(r"[a-zA-ZÀ-ÿ]{4,}")
+QUANTITY_RE = re.compile(
+    r"(\d+(?:[.,]\d+)?)\s*(%|percent|hours?|days?|weeks?|months?|years?|mad|dirhams?|eur|euros?|usd)",
+    re.IGNORECASE
+)
+
+
+# ─────────────────────────────────────────────────────────
+# FEATURE EXTRACTION
+# ─────────────────────────────────────────────────────────
+
+def _content_words(text: str) -> set:
+    return {w for w in (m.lower() for m in WORD_RE.findall(text)) if w not in STOPWORDS}
+
+
+def _obligation_terms(text: str) -> set:
+    words = {m.lower() for m in WORD_RE.findall(text)}
+    terms = {w for w in words if w in OBLIGATION_TERMS}
+    terms.update(f"{n.replace(',', '.')} {u.lower().rstrip('s')}" for n, u in QUANTITY_RE.findall(text))
+    return terms
+
+
+def _cosine(a: List[float], b: List[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+def _sigmoid(z: float) -> float:
+    return 1.0 / (1.0 + math.exp(-max(-60.0, min(60.0, z))))
+
+
+def lexical_features(regulation_text: str, excerpt: str) -> Dict[str, float]:
+    """Keyword and obligation overlap (no embeddings needed)"""
+    excerpt_words = _content_words(excerpt)
+    regulation_words = _content_words(regulation_text)
+    keyword_overlap = (
+        len(excerpt_words & regulation_words) / len(excerpt_words) if excerpt_words else 0.0
+    )
+
+    excerpt_obligations = _obligation_terms(excerpt)
+    regulation_obligations = _obligation_terms(regulation_text)
+    obligation_overlap = (
+        len(excerpt_obligations & regulation_obligations) / len(excerpt_obligations)
+        if excerpt_obligations else 0.0
+    )
+
+    return {
+        "keyword_overlap": round(keyword_overlap, 4),
+        "obligation_overlap": round(obligation_overlap, 4)
+    }
+
+
+class ExcerptPrescreener:
+    """
+    Decide which retrieved excerpts are worth an LLM audit
+    """
+
+    def __init__(
+        self,
+        embeddings: Any = None,
+        threshold: Optional[float] = None,
+        model_path: Optional[str] = PRESCREEN_MODEL_PATH,
+        log_path: Optional[str] = PRESCREEN_LOG_PATH
+    ):
+        """
+        Args:
+            embeddings: LangChain embeddings (e.g. PolicyResearcherAgent.embeddings);
+                        without it the similarity signal is 0 and the threshold
+                        is applied to the lexical signals only
+            threshold: Skip excerpts scoring below this (default: from the
+                       trained model file, else ARCA_PRESCREEN_THRESHOLD)
+            model_path: Optional trained classifier (JSON from train_classifier)
+            log_path: JSONL file receiving every skipped item (None = no log)
+        """
+        self.embeddings = embeddings
+        self.log_path = log_path
+        self.classifier: Optional[Dict[str, Any]] = None
+
+        if model_path and os.path.exists(model_path):
+            try:
+                with open(model_path, "r", encoding="utf-8") as f:
+                    self.classifier = json.load(f)
+                print(f"✅ Pre-screen classifier loaded ({model_path})")
+            except Exception as e:
+                print(f"⚠️  Could not load pre-screen classifier ({e}), using default weights")
+
+        if threshold is not None:
+            self.threshold = threshold
+        elif self.classifier is not None and "threshold" in self.classifier:
+            self.threshold = float(self.classifier["threshold"])
+        else:
+            self.threshold = DEFAULT_THRESHOLD
+            print(
+                f"⚠️  Pre-screen uses the uncalibrated default threshold ({self.threshold}); "
+                f"train a classifier (python agents/prescreen.py labelled_pairs.jsonl) "
+                f"to calibrate it for recall"
+            )
+
+    def features(
+        self,
+        regulation_text: str,
+        excerpts: List[str]
+    ) -> List[Dict[str, float]]:
+        """
+        Compute all signals for several excerpts (embeddings in one batch)
+        """
+        similarities = [0.0] * len(excerpts)
+        if self.embeddings is not None and excerpts:
+            regulation_vector = self.embeddings.embed_query(regulation_text)
+            excerpt_vectors = self.embeddings.embed_documents(excerpts)
+            similarities = [_cosine(regulation_vector, v) for v in excerpt_vectors]
+
+        rows = []
+        for excerpt, similarity in zip(excerpts, similarities):
+            row = {"similarity": round(similarity, 4)}
+            row.update(lexical_features(regulation_text, excerpt))
+            rows.append(row)
+        return rows
+
+    def score(self, features: Dict[str, float]) -> float:
+        """Relevance score in [0, 1] (classifier probability or default blend)"""
+        if self.classifier is not None:
+            weights = self.classifier["weights"]
+            z = self.classifier.get("bias", 0.0) + sum(
+                weights.get(name, 0.0) * features[name] for name in FEATURES
+            )
+            return _sigmoid(z)
+        return sum(DEFAULT_WEIGHTS[name] * features[name] for name in FEATURES)
+
+    def screen(
+        self,
+        regulation_text: str,
+        policy_items: List[Dict[str, Any]]
+    ) -> Tuple[List[int], Dict[int, Dict[str, Any]], Dict[str, Any]]:
+        """
+        Split policy_items into excerpts to audit and excerpts to skip
+
+        Returns:
+            (indices_to_audit, skipped_verdicts_by_index, stats)
+        """
+        rows = self.features(regulation_text, [item['excerpt'] for item in policy_items])
+
+        to_audit: List[int] = []
+        skipped: Dict[int, Dict[str, Any]] = {}
+        log_entries = []
+
+        for index, (item, row) in enumerate(zip(policy_items, rows)):
+            score = self.score(row)
+            if score >= self.threshold:
+                to_audit.append(index)
+                continue
+
+            skipped[index] = {
+                "policy_id": item['policy_id'],
+                "severity": "LOW",
+                "has_conflict": False,
+                "divergence_summary": f"Pre-screen: excerpt unrelated to the regulation (score {score:.3f})",
+                "conflicting_policy_excerpt": item['excerpt'][:200],
+                "new_rule_excerpt": "",
+                "recommendation": "No action required",
+                "prescreened": True
+            }
+            log_entries.append({
+                "policy_id": item['policy_id'],
+                "excerpt": item['excerpt'],
+                "score": round(score, 4),
+                "threshold": self.threshold,
+                "features": row
+            })
+
+        if log_entries:
+            self._log_skipped(regulation_text, log_entries)
+
+        stats = {
+            "evaluated": len(policy_items),
+            "skipped": len(skipped),
+            "llm_calls_saved": len(skipped),
+            "threshold": self.threshold,
+            "scorer": "classifier" if self.classifier is not None else "default",
+            "skipped_policy_ids": [entry["policy_id"] for entry in log_entries]
+        }
+        return to_audit, skipped, stats
+
+    def _log_skipped(self, regulation_text: str, entries: List[Dict[str, Any]]) -> None:
+        """Append skipped items to the audit log (one JSON object per line)"""
+        if not self.log_path:
+            return
+        regulation_hash = hashlib.sha256(regulation_text.encode("utf-8")).hexdigest()[:16]
+        timestamp = datetime.now().isoformat()
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.log_path)), exist_ok=True)
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                for entry in entries:
+                    record = dict(entry, timestamp=timestamp, regulation_hash=regulation_hash)
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except Exception as e:
+            print(f"   ⚠️  Could not write pre-screen log: {e}")
+
+
+# ─────────────────────────────────────────────────────────
+# TRAINING & CALIBRATION
+# ─────────────────────────────────────────────────────────
+
+def calibrate_threshold(
+    scores: List[float],
+    labels: List[int],
+    target_recall: float = 0.98
+) -> float:
+    """
+    Highest threshold that still keeps target_recall of the relevant excerpts
+
+    Args:
+        scores: Pre-screen scores
+        labels: 1 = excerpt needed an LLM audit (related/conflicting), 0 = unrelated
+        target_recall: Share of relevant excerpts that must pass the pre-screen
+    """
+    positives = sorted(s for s, y in zip(scores, labels) if y == 1)
+    if not positives:
+        return 0.0
+    # Scores of the relevant excerpts we are allowed to lose
+    # (epsilon: 10 * (1 - 0.9) is 0.999..., which would floor to 0)
+    allowed_misses = int(math.floor(len(positives) * (1.0 - target_recall) + 1e-9))
+    return positives[allowed_misses]
+
+
+def train_classifier(
+    examples: List[Dict[str, Any]],
+    embeddings: Any = None,
+    target_recall: float = 0.98,
+    epochs: int = 500,
+    learning_rate: float = 0.5,
+    output_path: Optional[str] = PRESCREEN_MODEL_PATH
+) -> Dict[str, Any]:
+    """
+    Fit the optional logistic-regression scorer and calibrate its threshold
+
+    Args:
+        examples: Dicts with regulation, excerpt, label (1 = needs audit)
+        embeddings: Embeddings used for the similarity feature
+        target_recall: Recall the calibrated threshold must preserve
+        output_path: Where to save the model JSON (None = don't save)
+
+    Returns:
+        Model dict: weights, bias, threshold, training stats
+    """
+    screener = ExcerptPrescreener(embeddings=embeddings, threshold=0.0, model_path=None, log_path=None)
+    rows, labels = [], []
+    for example in examples:
+        rows.append(screener.features(example["regulation"], [example["excerpt"]])[0])
+        labels.append(int(example["label"]))
+
+    weights = {name: 0.0 for name in FEATURES}
+    bias = 0.0
+    n = len(rows)
+    for _ in range(epochs):
+        grad_w = {name: 0.0 for name in FEATURES}
+        grad_b = 0.0
+        for row, y in zip(rows, labels):
+            error = _sigmoid(bias + sum(weights[k] * row[k] for k in FEATURES)) - y
+            for k in FEATURES:
+                grad_w[k] += error * row[k]
+            grad_b += error
+        for k in FEATURES:
+            weights[k] -= learning_rate * grad_w[k] / n
+        bias -= learning_rate * grad_b / n
+
+    model = {"weights": weights, "bias": bias}
+    screener.classifier = model
+    scores = [screener.score(row) for row in rows]
+    model["threshold"] = calibrate_threshold(scores, labels, target_recall)
+    model["target_recall"] = target_recall
+    model["training_examples"] = n
+    model["trained_at"] = datetime.now().isoformat()
+
+    skipped = [y for s, y in zip(scores, labels) if s < model["threshold"]]
+    model["training_skip_rate"] = round(len(skipped) / n, 4) if n else 0.0
+    model["training_skip_precision"] = (
+        round(skipped.count(0) / len(skipped), 4) if skipped else 1.0
+    )
+
+    if output_path:
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(model, f, indent=2)
+        print(f"💾 Pre-screen classifier saved to: {output_path}")
+
+    return model
+
+
+if __name__ == "__main__":
+    # Usage: python agents/prescreen.py labelled_pairs.jsonl
+    # Each line: {"regulation": "...", "excerpt": "...", "label": 0|1}
+    import sys
+    from langchain_huggingface import HuggingFaceEmbeddings
+
+    if len(sys.argv) != 2:
+        print("Usage: python agents/prescreen.py labelled_pairs.jsonl")
+        sys.exit(1)
+
+    with open(sys.argv[1], "r", encoding="utf-8") as f:
+        labelled = [json.loads(line) for line in f if line.strip()]
+
+    trained = train_classifier(
+        labelled,
+        embeddings=HuggingFaceEmbeddings(
+            model_name=os.getenv("ARCA_EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+        )
+    )
+    print(json.dumps(trained, indent=2))
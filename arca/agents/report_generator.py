@@ -115,6 +115,24 @@ class ReportGeneratorAgent:
             }
         }
         
+        # Token usage (batch vs single modes, side by side)
+        if "token_usage" in audit_results:
+            report["metadata"]["token_usage"] = audit_results["token_usage"]
+        if "verdict_cache" in audit_results:
+            report["metadata"]["verdict_cache"] = audit_results["verdict_cache"]
+        if "prescreen" in audit_results:
+            report["metadata"]["prescreen"] = audit_results["prescreen"]
+        if "rule_engine" in audit_results:
+            report["metadata"]["rule_engine"] = audit_results["rule_engine"]
+        if "obligation_records" in audit_results:
+            report["metadata"]["obligation_records"] = audit_results["obligation_records"]
+        if "clause_selection" in audit_results:
+            report["metadata"]["clause_selection"] = audit_results["clause_selection"]
+        if "cascade" in audit_results:
+            report["metadata"]["cascade"] = audit_results["cascade"]
+        if "unaudited" in audit_results:
+            report["metadata"]["unaudited"] = audit_results["unaudited"]
+        
         # Validation check
         self._validate_report(report)
         
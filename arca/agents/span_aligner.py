@@ -0,0 +1,241 @@
+# agents/span_aligner.py
+"""
+Verbatim Quote Aligner (ARCA System)
+
+The auditor no longer asks the LLM to copy quotes back. Prompts show the
+regulation and the policy excerpt as numbered sentences ([R1].., [P1]..),
+the LLM answers with sentence ids, and this module cuts the verbatim text
+out of the original strings.
+
+Hints understood (per side):
+- Sentence ids: "P2", "[R3]", 2, or a list of them (first consecutive run is used)
+- Anchors: any other short string, matched to the closest sentence
+  (exact substring first, then difflib fuzzy matching)
+
+When no hint resolves, the sentence closest to the divergence summary is
+quoted, so the report fields are never empty.
+"""
+
+import re
+import difflib
+from typing import List, Dict, Any, Optional, Union
+
+QUOTE_LIMIT = 200
+
+# Sentence boundaries: after end punctuation, blank lines, and before list items
+BOUNDARY_RE = re.compile(
+    r"(?<=[.!?;:])\s+"
+    r"|\n[ \t]*\n\s*"
+    r"|\n(?=[ \t]*(?:[-•*]|\d+[.)]|\([a-z0-9]{1,3}\))[ \t])",
+    re.IGNORECASE
+)
+# Fragments shorter than this (list numbers, headings) are merged into the next sentence
+MIN_SENTENCE_CHARS = 20
+SENTENCE_ID_RE = re.compile(r"^\[?\s*([A-Za-z]?)\s*(\d+)\s*\]?$")
+MIN_ANCHOR_SCORE = 0.5
+
+
+def split_sentences(text: str, prefix: str = "S") -> List[Dict[str, Any]]:
+    """
+    Split text into sentences with exact character offsets
+
+    Returns:
+        List of dicts: sentence_id (<prefix>1..n), text, start, end
+    """
+    pieces = []
+    start = 0
+    for match in BOUNDARY_RE.finditer(text):
+        pieces.append((start, match.start()))
+        start = match.end()
+    pieces.append((start, len(text)))
+
+    spans = []
+    pending_start = None
+    for piece_start, piece_end in pieces:
+        if pending_start is not None:
+            piece_start = pending_start
+        if not text[piece_start:piece_end].strip():
+            continue
+        if len(text[piece_start:piece_end].strip()) < MIN_SENTENCE_CHARS:
+            pending_start = piece_start
+            continue
+        pending_start = None
+        spans.append((piece_start, piece_end))
+
+    if pending_start is not None:
+        if spans:
+            spans[-1] = (spans[-1][0], len(text))
+        else:
+            spans.append((pending_start, len(text)))
+
+    sentences = []
+    for span_start, span_end in spans:
+        raw = text[span_start:span_end]
+        lead = len(raw) - len(raw.lstrip())
+        stripped = raw.strip()
+        if not stripped:
+            continue
+        sentences.append({
+            "sentence_id": f"{prefix}{len(sentences) + 1}",
+            "text": stripped,
+            "start": span_start + lead,
+            "end": span_start + lead + len(stripped)
+        })
+    return sentences
+
+
+def number_sentences(sentences: List[Dict[str, Any]]) -> str:
+    """Prompt form: one "[P1] sentence" per line"""
+    return "\n".join(f"[{s['sentence_id']}] {' '.join(s['text'].split())}" for s in sentences)
+
+
+def clip_quote(text: str, limit: int = QUOTE_LIMIT) -> str:
+    """Cut a verbatim quote to the limit at a word boundary"""
+    if len(text) <= limit:
+        return text
+    cut = text[:limit]
+    space = cut.rfind(" ")
+    return cut[:space] if space > limit // 2 else cut
+
+
+class SpanAligner:
+    """
+    Turn LLM span hints into verbatim quotes
+    """
+
+    def __init__(self, limit: int = QUOTE_LIMIT):
+        self.limit = limit
+
+    def _by_ids(self, sentences: List[Dict[str, Any]], hints: List[Any]) -> List[int]:
+        indices = []
+        for hint in hints:
+            match = SENTENCE_ID_RE.match(str(hint).strip())
+            if not match:
+                return []
+            position = int(match.group(2)) - 1
+            if 0 <= position < len(sentences):
+                indices.append(position)
+        indices = sorted(set(indices))
+        # First run of consecutive sentences
+        run = indices[:1]
+        for position in indices[1:]:
+            if position != run[-1] + 1:
+                break
+            run.append(position)
+        return run
+
+    def _by_anchor(
+        self,
+        sentences: List[Dict[str, Any]],
+        anchor: str,
+        min_score: float = MIN_ANCHOR_SCORE
+    ) -> List[int]:
+        needle = " ".join(anchor.split()).lower()
+        if not needle:
+            return []
+
+        best, best_score = None, 0.0
+        for position, sentence in enumerate(sentences):
+            haystack = " ".join(sentence["text"].split()).lower()
+            if needle in haystack or haystack in needle:
+                return [position]
+            matcher = difflib.SequenceMatcher(None, needle, haystack, autojunk=False)
+            block = matcher.find_longest_match(0, len(needle), 0, len(haystack))
+            score = max(matcher.ratio(), block.size / len(needle))
+            if score > best_score:
+                best, best_score = position, score
+        return [best] if best is not None and best_score >= min_score else []
+
+    def resolve(
+        self,
+        text: str,
+        sentences: List[Dict[str, Any]],
+        hint: Union[str, int, List[Any], None],
+        min_score: float = MIN_ANCHOR_SCORE
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Resolve a hint to a verbatim span of text
+
+        Returns:
+            Dict with quote, start, end, sentence_ids (None when unresolved)
+        """
+        if hint is None or not sentences:
+            return None
+        hints = hint if isinstance(hint, list) else [hint]
+        hints = [h for h in hints if h is not None and str(h).strip()]
+        if not hints:
+            return None
+
+        positions = self._by_ids(sentences, hints)
+        if not positions and len(hints) == 1 and isinstance(hints[0], str):
+            positions = self._by_anchor(sentences, hints[0], min_score)
+        if not positions:
+            return None
+
+        first, last = sentences[positions[0]], sentences[positions[-1]]
+        quote = clip_quote(text[first["start"]:last["end"]], self.limit)
+        return {
+            "quote": quote,
+            "start": first["start"],
+            "end": first["start"] + len(quote),
+            "sentence_ids": [sentences[p]["sentence_id"] for p in positions]
+        }
+
+    def align(
+        self,
+        analysis: Dict[str, Any],
+        regulation_text: str,
+        policy_excerpt: str
+    ) -> Dict[str, Any]:
+        """
+        Fill conflicting_policy_excerpt / new_rule_excerpt with verbatim quotes
+
+        Reads (and removes) the policy_sentences / regulation_sentences hints;
+        quotes the LLM still wrote itself are treated as anchors.
+        """
+        sides = (
+            ("policy", "policy_sentences", "conflicting_policy_excerpt", policy_excerpt, "P"),
+            ("regulation", "regulation_sentences", "new_rule_excerpt", regulation_text, "R"),
+        )
+        spans = {}
+        for side, hint_key, quote_key, text, prefix in sides:
+            sentences = split_sentences(text, prefix)
+            hint = analysis.pop(hint_key, None)
+            if hint is None:
+                hint = analysis.get(quote_key)
+
+            span = self.resolve(text, sentences, hint)
+            source = "hint"
+            if span is None and sentences:
+                # Closest sentence to the summary keeps the field meaningful
+                span = self.resolve(
+                    text, sentences, analysis.get("divergence_summary") or "", min_score=0.0
+                )
+                source = "summary"
+            if span is None:
+                span = {"quote": clip_quote(text.strip(), self.limit), "start": 0, "end": 0, "sentence_ids": []}
+                source = "fallback"
+
+            analysis[quote_key] = span.pop("quote")
+            span["source"] = source
+            spans[side] = span
+
+        analysis["quote_spans"] = spans
+        return analysis
+
+    def requote(self, analysis: Dict[str, Any], side: str, source_text: str) -> Dict[str, Any]:
+        """
+        Re-anchor an aligned quote in a different source text (e.g. the raw
+        excerpt behind a compact obligation view); keeps the quote when no
+        sentence of the source matches it
+        """
+        quote_key = "conflicting_policy_excerpt" if side == "policy" else "new_rule_excerpt"
+        prefix = "P" if side == "policy" else "R"
+        span = self.resolve(source_text, split_sentences(source_text, prefix), analysis.get(quote_key))
+        if span is None:
+            return analysis
+
+        analysis[quote_key] = span.pop("quote")
+        span["source"] = "anchor"
+        analysis.setdefault("quote_spans", {})[side] = span
+        return analysis
@@ -7,18 +7,46 @@ TSD Requirements:
 - Input: new_regulation_text (str, max 2000 words), date_of_law (str, optional)
 - Output: TSD-compliant JSON report
 - Framework: FastAPI (recommended) or Flask
+
+Long analyses can also run as background jobs (job_queue.py):
+POST /jobs or /jobs/file returns a job id at once, GET /jobs/{job_id}
+reports status and per-stage progress, GET /jobs/{job_id}/result returns
+the report.
+
+POST /analyze_regulation/stream runs the analysis and streams its progress
+as Server-Sent Events: stage starts/ends, each retrieved policy, each audit
+verdict as soon as it is final, and the report as the last event.
 """
 
 from fastapi import FastAPI, HTTPException, status, UploadFile, File, Form
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field, validator
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 import uvicorn
 import os
-import tempfile
-
-from arca_pipeline import ARCASystem, analyze_regulation_from_file_smart
+import json
+import asyncio
+import hashlib
+from contextlib import nullcontext
+
+from arca_pipeline import ARCASystem, STAGES, analyze_regulation_from_file_smart_async
+from document_processor import SUMMARY_MODES
+from llm_client import get_llm_stats
+from pipeline_executor import InstrumentedExecutor
+from job_queue import JobQueue, JobWorkerPool
+
+# Upload limits: file size, and slack for the multipart envelope and form fields
+MAX_UPLOAD_MB = float(os.getenv("ARCA_MAX_UPLOAD_MB", "10"))
+MAX_UPLOAD_BYTES = int(MAX_UPLOAD_MB * 1024 * 1024)
+UPLOAD_ENVELOPE_BYTES = 64 * 1024
+# Uploads are read and hashed in chunks of this size
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+# Endpoints receiving file uploads (request body capped by UploadSizeLimitMiddleware)
+UPLOAD_PATHS = {"/analyze_regulation_file", "/jobs/file"}
+# Comment line sent on an idle event stream so proxies keep it open
+SSE_KEEPALIVE_SECONDS = 15.0
 
 # ─────────────────────────────────────────────────────────
 # API MODELS (Pydantic Schemas)
@@ -49,6 +77,22 @@ class RegulationAnalysisRequest(BaseModel):
         max_length=500
     )
     
+    batch_audit: bool = Field(
+        False,
+        description="Audit all retrieved policies in a single LLM call (regulation sent once)"
+    )
+
+    cascade_audit: bool = Field(
+        False,
+        description="Audit with a cheaper model first and escalate HIGH or uncertain verdicts"
+    )
+
+    latency_budget_seconds: Optional[float] = Field(
+        None,
+        gt=0,
+        description="Overall time budget; lower-ranked policies left unaudited when it runs out are listed in metadata.unaudited"
+    )
+    
     @validator('date_of_law')
     def validate_date(cls, v):
         """Validate date format"""
@@ -103,6 +147,29 @@ class HealthCheckResponse(BaseModel):
     agents_initialized: bool
 
 
+class JobSubmittedResponse(BaseModel):
+    """Accepted analysis job"""
+    job_id: str
+    status: str
+    status_url: str
+    result_url: str
+
+
+class JobStatusResponse(BaseModel):
+    """Status and per-stage progress of an analysis job"""
+    job_id: str
+    kind: str
+    status: str = Field(..., description="queued, running, succeeded or failed")
+    attempts: int
+    max_attempts: int
+    progress: Dict[str, Any] = Field(..., description="Current stage and per-stage status/timings")
+    error: Optional[str] = Field(None, description="Error of the last failed attempt")
+    created_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    next_attempt_at: Optional[float] = Field(None, description="When a queued retry becomes runnable")
+
+
 class ErrorResponse(BaseModel):
     """Standard error response"""
     error: str
@@ -122,7 +189,62 @@ app = FastAPI(
     redoc_url="/redoc"
 )
 
-# CORS middleware (allow all origins for development)
+class UploadSizeLimitMiddleware:
+    """
+    Reject oversized upload requests before their body is buffered
+
+    A declared Content-Length over the limit is answered with 413 without
+    reading the body; otherwise the body is counted as it arrives and the
+    request is aborted with 413 as soon as it passes the limit, so an
+    oversized upload costs constant memory and disk.
+    """
+
+    def __init__(self, app, max_body_bytes: int, paths: set):
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+        self.paths = paths
+
+    def _too_large(self) -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File too large. Maximum size is {MAX_UPLOAD_MB:g}MB."
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        declared = dict(scope["headers"]).get(b"content-length", b"")
+        if declared.isdigit() and int(declared) > self.max_body_bytes:
+            error = self._too_large()
+            response = JSONResponse(status_code=error.status_code, content={"detail": error.detail})
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_bytes:
+                    raise self._too_large()
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    max_body_bytes=MAX_UPLOAD_BYTES + UPLOAD_ENVELOPE_BYTES,
+    paths=UPLOAD_PATHS
+)
+
+# CORS middleware (allow all origins for development). Added last so it is
+# the outermost layer: the upload limit's early 413 responses pass through
+# it and keep their CORS headers.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -131,9 +253,136 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+async def read_upload(file: UploadFile, max_bytes: int = MAX_UPLOAD_BYTES) -> Tuple[bytes, str]:
+    """
+    Read an upload in fixed-size chunks, hashing as it streams
+
+    Returns:
+        (content, sha256 hex digest)
+
+    Raises:
+        HTTPException 413: As soon as the upload passes max_bytes
+    """
+    if file.size is not None and file.size > max_bytes:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File too large: {file.size / (1024 * 1024):.2f}MB. Maximum size is {MAX_UPLOAD_MB:g}MB."
+        )
+
+    digest = hashlib.sha256()
+    chunks = []
+    size = 0
+    while True:
+        chunk = await file.read(UPLOAD_CHUNK_BYTES)
+        if not chunk:
+            break
+        size += len(chunk)
+        if size > max_bytes:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"File too large. Maximum size is {MAX_UPLOAD_MB:g}MB."
+            )
+        digest.update(chunk)
+        chunks.append(chunk)
+    return b"".join(chunks), digest.hexdigest()
+
+
+def validate_file_form(file: UploadFile, date_of_law: Optional[str], summary_mode: Optional[str]) -> None:
+    """
+    Check the upload's file type and the form fields of a file analysis
+
+    Raises:
+        HTTPException 400: Unsupported file type, summary mode or date format
+    """
+    file_ext = os.path.splitext(file.filename)[1].lower()
+    if file_ext not in ['.pdf', '.txt', '.md']:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported file type: {file_ext}. Please upload .pdf or .txt files."
+        )
+    
+    if summary_mode is not None and summary_mode not in SUMMARY_MODES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"summary_mode must be one of: {', '.join(SUMMARY_MODES)}"
+        )
+    
+    # Validate date format if provided
+    if date_of_law:
+        try:
+            datetime.strptime(date_of_law, '%Y-%m-%d')
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="date_of_law must be in YYYY-MM-DD format"
+            )
+
+
 # Global ARCA system instance (initialized on startup)
 arca_system: Optional[ARCASystem] = None
 
+# Executor running the pipeline's blocking work (owned by the app lifecycle,
+# installed as the event loop's default executor on startup)
+pipeline_executor: Optional[InstrumentedExecutor] = None
+
+
+def track_run():
+    """Per-analysis executor metrics around one pipeline run (no-op before startup)"""
+    if pipeline_executor is None:
+        return nullcontext()
+    return pipeline_executor.track_run()
+
+
+# Persistent analysis jobs and the workers running them
+job_queue: Optional[JobQueue] = None
+job_workers: Optional[JobWorkerPool] = None
+
+
+async def run_analysis_job(job: Dict[str, Any], on_event) -> Dict[str, Any]:
+    """
+    Job handler: run the analysis described by a queued job
+
+    Args:
+        job: Claimed job (kind "text" or "file", params, payload)
+        on_event: Pipeline progress callback (updates the job's progress)
+    """
+    if arca_system is None:
+        raise RuntimeError("ARCA system not initialized")
+    
+    params = job["params"]
+    with track_run():
+        if job["kind"] == "file":
+            return await analyze_regulation_from_file_smart_async(
+                arca=arca_system,
+                file_path=job["payload"],
+                filename=params["filename"],
+                sha256=params["sha256"],
+                date_of_law=params["date_of_law"],
+                regulation_title=params["regulation_title"],
+                summarize=params["summarize"],
+                summary_mode=params["summary_mode"],
+                on_event=on_event
+            )
+        
+        return await arca_system.analyze_regulation_async(
+            new_regulation_text=params["new_regulation_text"],
+            date_of_law=params["date_of_law"],
+            regulation_title=params["regulation_title"],
+            save_report=True,
+            batch_audit=params["batch_audit"],
+            cascade_audit=params["cascade_audit"],
+            latency_budget=params["latency_budget_seconds"],
+            on_event=on_event
+        )
+
+
+def job_links(job_id: str) -> Dict[str, str]:
+    return {
+        "status_url": f"/jobs/{job_id}",
+        "result_url": f"/jobs/{job_id}/result"
+    }
+
 
 # ─────────────────────────────────────────────────────────
 # LIFECYCLE EVENTS
@@ -144,12 +393,17 @@ async def startup_event():
     """
     Initialize ARCA system on server startup
     """
-    global arca_system
+    global arca_system, pipeline_executor, job_queue, job_workers
     
     print("\n" + "=" * 60)
     print("🚀 ARCA API SERVER STARTING")
     print("=" * 60)
     
+    # Every asyncio.to_thread hop of the async pipeline runs on this pool
+    pipeline_executor = InstrumentedExecutor()
+    asyncio.get_running_loop().set_default_executor(pipeline_executor)
+    print(f"⚙️  Pipeline executor: {pipeline_executor.max_workers} worker threads")
+    
     try:
         arca_system = ARCASystem()
         print("✅ ARCA system initialized successfully")
@@ -158,6 +412,14 @@ async def startup_event():
         print("⚠️  API will be unavailable")
         arca_system = None
     
+    # Jobs queued before a restart are picked up again here
+    job_queue = JobQueue()
+    if arca_system is not None:
+        job_workers = JobWorkerPool(job_queue, run_analysis_job)
+        job_workers.start()
+        queued = job_queue.stats()
+        print(f"📋 Job queue: {job_workers.workers} workers, {queued['queued']} queued, {queued['running']} running")
+    
     print("=" * 60 + "\n")
 
 
@@ -167,6 +429,15 @@ async def shutdown_event():
     Cleanup on server shutdown
     """
     print("\n🛑 ARCA API SERVER SHUTTING DOWN")
+    # Release running jobs before their executor goes away
+    if job_workers is not None:
+        await job_workers.stop()
+    if job_queue is not None:
+        job_queue.close()
+    if arca_system is not None:
+        arca_system.close()
+    if pipeline_executor is not None:
+        pipeline_executor.shutdown(wait=False, cancel_futures=True)
 
 
 # ─────────────────────────────────────────────────────────
@@ -183,7 +454,10 @@ async def root():
         "version": "1.0.0",
         "endpoints": {
             "analyze": "/analyze_regulation (POST)",
+            "stream": "/analyze_regulation/stream (POST, text/event-stream)",
+            "jobs": "/jobs, /jobs/file (POST), /jobs/{job_id}, /jobs/{job_id}/result (GET)",
             "health": "/health (GET)",
+            "stats": "/stats (GET)",
             "docs": "/docs (GET)"
         }
     }
@@ -205,8 +479,8 @@ async def health_check():
     if arca_system is not None:
         agents_initialized = True
         try:
-            # Test if vectorstore is accessible
-            arca_system.agent1.db.similarity_search("test", k=1)
+            # Test if vectorstore is accessible (off the event loop)
+            await asyncio.to_thread(arca_system.agent1.db.similarity_search, "test", k=1)
             vectorstore_loaded = True
         except:
             pass
@@ -221,6 +495,21 @@ async def health_check():
     )
 
 
+@app.get("/stats", tags=["System"], summary="Executor and LLM client metrics")
+async def stats():
+    """
+    Sizing metrics: pipeline executor queue depth, per-task and per-analysis
+    wait and run times (see pipeline_executor.py), job counts by status, and per-model LLM
+    call/throttling counters
+    """
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "executor": pipeline_executor.stats() if pipeline_executor is not None else None,
+        "jobs": job_queue.stats() if job_queue is not None else None,
+        "llm": get_llm_stats()
+    }
+
+
 @app.post(
     "/analyze_regulation",
     response_model=RegulationAnalysisResponse,
@@ -265,13 +554,18 @@ async def analyze_regulation(request: RegulationAnalysisRequest):
         )
     
     try:
-        # Run the complete ARCA pipeline
-        result = arca_system.analyze_regulation(
-            new_regulation_text=request.new_regulation_text,
-            date_of_law=request.date_of_law,
-            regulation_title=request.regulation_title,
-            save_report=True  # Save all reports to disk
-        )
+        # Run the complete ARCA pipeline (async: the event loop keeps serving
+        # other requests while this analysis waits on embeddings and the LLM)
+        with track_run():
+            result = await arca_system.analyze_regulation_async(
+                new_regulation_text=request.new_regulation_text,
+                date_of_law=request.date_of_law,
+                regulation_title=request.regulation_title,
+                save_report=True,  # Save all reports to disk
+                batch_audit=request.batch_audit,
+                cascade_audit=request.cascade_audit,
+                latency_budget=request.latency_budget_seconds
+            )
         
         return RegulationAnalysisResponse(**result)
     
@@ -298,6 +592,7 @@ async def analyze_regulation(request: RegulationAnalysisRequest):
     responses={
         200: {"description": "Analysis completed successfully"},
         400: {"model": ErrorResponse, "description": "Invalid request"},
+        413: {"model": ErrorResponse, "description": "File too large"},
         500: {"model": ErrorResponse, "description": "Internal server error"},
         503: {"model": ErrorResponse, "description": "Service unavailable"}
     },
@@ -308,7 +603,11 @@ async def analyze_regulation_file(
     file: UploadFile = File(..., description="PDF or TXT file containing regulation"),
     date_of_law: Optional[str] = Form(None, description="Date of law (YYYY-MM-DD)"),
     regulation_title: Optional[str] = Form(None, description="Regulation title"),
-    summarize: bool = Form(True, description="Auto-summarize if text exceeds 2000 words")
+    summarize: bool = Form(True, description="Auto-summarize if text exceeds 2000 words"),
+    summary_mode: Optional[str] = Form(
+        None,
+        description="Summarization: auto, single, map_reduce or extractive (local, no LLM call)"
+    )
 ):
     """
     Analyze a regulation from an uploaded PDF or TXT file
@@ -316,7 +615,8 @@ async def analyze_regulation_file(
     **Smart Document Processing:**
     1. Extracts text from PDF or TXT file
     2. Cleans text (removes page numbers, artifacts, etc.)
-    3. Summarizes if document exceeds 2000 words
+    3. Summarizes if document exceeds 2000 words (LLM, or local sentence
+       extraction with summary_mode=extractive)
     4. Analyzes with ARCA pipeline
     
     **Supported File Types:**
@@ -324,7 +624,8 @@ async def analyze_regulation_file(
     - Text (.txt) - Reads plain text files
     
     **Input Requirements:**
-    - File size: Max 10MB
+    - File size: Max 10MB (ARCA_MAX_UPLOAD_MB); larger uploads are rejected
+      with 413 as soon as the limit is passed
     - For PDFs: Text-based (not scanned images)
     - Auto-summarization keeps content under 2000 words
     
@@ -342,61 +643,37 @@ async def analyze_regulation_file(
             detail="ARCA system not initialized. Check server logs."
         )
     
-    # Validate file type
-    file_ext = os.path.splitext(file.filename)[1].lower()
-    if file_ext not in ['.pdf', '.txt', '.md']:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Unsupported file type: {file_ext}. Please upload .pdf or .txt files."
-        )
-    
-    # Validate date format if provided
-    if date_of_law:
-        try:
-            datetime.strptime(date_of_law, '%Y-%m-%d')
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="date_of_law must be in YYYY-MM-DD format"
-            )
+    validate_file_form(file, date_of_law, summary_mode)
     
     try:
-        # Save uploaded file to temporary location
-        with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as temp_file:
-            content = await file.read()
-            temp_file.write(content)
-            temp_file_path = temp_file.name
-        
-        # Check file size (max 10MB)
-        file_size_mb = len(content) / (1024 * 1024)
-        if file_size_mb > 10:
-            os.unlink(temp_file_path)
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"File too large: {file_size_mb:.2f}MB. Maximum size is 10MB."
-            )
+        # Stream the upload in chunks (aborting past the size limit) and hash
+        # it on the way, so the document cache is checked without re-hashing
+        content, content_sha256 = await read_upload(file)
         
         # Use filename as title if not provided
         if regulation_title is None:
             regulation_title = os.path.splitext(file.filename)[0]
         
-        # Process document and run ARCA analysis
-        result = analyze_regulation_from_file_smart(
-            file_path=temp_file_path,
-            date_of_law=date_of_law,
-            regulation_title=regulation_title,
-            summarize=summarize
-        )
-        
-        # Cleanup temporary file
-        os.unlink(temp_file_path)
+        # Process document and run ARCA analysis (async, on the shared system)
+        with track_run():
+            result = await analyze_regulation_from_file_smart_async(
+                arca=arca_system,
+                file_path=content,
+                filename=file.filename,
+                sha256=content_sha256,
+                date_of_law=date_of_law,
+                regulation_title=regulation_title,
+                summarize=summarize,
+                summary_mode=summary_mode
+            )
         
         return RegulationAnalysisResponse(**result)
+        
+    except HTTPException:
+        raise
     
     except ValueError as e:
         # Document processing errors
-        if 'temp_file_path' in locals():
-            os.unlink(temp_file_path)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Document processing failed: {str(e)}"
@@ -404,14 +681,244 @@ async def analyze_regulation_file(
     
     except Exception as e:
         # Internal errors
-        if 'temp_file_path' in locals():
-            os.unlink(temp_file_path)
         print(f"❌ File analysis error: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Analysis failed: {str(e)}"
         )
 
+def format_sse(event: str, data: Any, event_id: int) -> str:
+    """One Server-Sent Events message (JSON data on a single line)"""
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    return f"id: {event_id}\nevent: {event}\ndata: {payload}\n\n"
+
+
+@app.post(
+    "/analyze_regulation/stream",
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {"description": "Event stream (text/event-stream)", "content": {"text/event-stream": {}}},
+        503: {"model": ErrorResponse, "description": "Service unavailable"}
+    },
+    tags=["Analysis"],
+    summary="Analyze a regulation, streaming progress and verdicts as Server-Sent Events"
+)
+async def analyze_regulation_stream(request: RegulationAnalysisRequest):
+    """
+    Same analysis and input as POST /analyze_regulation, streamed as SSE
+
+    **Events** (`event:` name, JSON `data:`):
+    - `stage_start` / `stage_end`: {stage, ...counts} for research, audit, report
+    - `policy`: {rank, policy_id, score, excerpt} for each retrieved policy
+    - `verdict`: {rank, policy_id, has_conflict, unaudited, risk} as soon as
+      each policy's verdict is final (completion order); `risk` has the
+      report's risk object schema, null when there is no conflict
+    - `report`: the complete report (same schema as /analyze_regulation), always last
+    - `error`: {status_code, detail} instead of `report` if the analysis fails
+
+    Closing the connection cancels the analysis.
+    """
+    if arca_system is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="ARCA system not initialized. Check server logs."
+        )
+    
+    loop = asyncio.get_running_loop()
+    events: asyncio.Queue = asyncio.Queue()
+    
+    def on_event(event: Dict[str, Any]) -> None:
+        data = {key: value for key, value in event.items() if key != "event"}
+        loop.call_soon_threadsafe(events.put_nowait, (event["event"], data))
+    
+    async def run_analysis():
+        try:
+            with track_run():
+                result = await arca_system.analyze_regulation_async(
+                    new_regulation_text=request.new_regulation_text,
+                    date_of_law=request.date_of_law,
+                    regulation_title=request.regulation_title,
+                    save_report=True,
+                    batch_audit=request.batch_audit,
+                    cascade_audit=request.cascade_audit,
+                    latency_budget=request.latency_budget_seconds,
+                    on_event=on_event
+                )
+            report = RegulationAnalysisResponse(**result).dict()
+            loop.call_soon_threadsafe(events.put_nowait, ("report", report))
+        except ValueError as e:
+            loop.call_soon_threadsafe(
+                events.put_nowait, ("error", {"status_code": status.HTTP_400_BAD_REQUEST, "detail": str(e)})
+            )
+        except Exception as e:
+            print(f"❌ Streaming analysis error: {e}")
+            loop.call_soon_threadsafe(
+                events.put_nowait,
+                ("error", {"status_code": status.HTTP_500_INTERNAL_SERVER_ERROR, "detail": f"Analysis failed: {str(e)}"})
+            )
+    
+    async def event_stream():
+        task = asyncio.create_task(run_analysis())
+        event_id = 0
+        try:
+            while True:
+                try:
+                    name, data = await asyncio.wait_for(events.get(), timeout=SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                event_id += 1
+                yield format_sse(name, data, event_id)
+                if name in ("report", "error"):
+                    break
+        finally:
+            # Client gone (or stream finished): stop the analysis
+            if not task.done():
+                task.cancel()
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+# ─────────────────────────────────────────────────────────
+# ANALYSIS JOBS
+# ─────────────────────────────────────────────────────────
+
+def require_job_queue() -> JobQueue:
+    if arca_system is None or job_queue is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="ARCA system not initialized. Check server logs."
+        )
+    return job_queue
+
+
+@app.post(
+    "/jobs",
+    response_model=JobSubmittedResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={
+        202: {"description": "Job queued"},
+        503: {"model": ErrorResponse, "description": "Service unavailable"}
+    },
+    tags=["Jobs"],
+    summary="Queue a regulation analysis"
+)
+async def submit_job(request: RegulationAnalysisRequest):
+    """
+    Queue the same analysis as POST /analyze_regulation and return at once
+
+    Poll GET /jobs/{job_id} for status and progress, then fetch the report
+    from GET /jobs/{job_id}/result. Jobs are persisted: they survive a
+    server restart and failed attempts are retried.
+    """
+    queue = require_job_queue()
+    job_id = await queue.call(
+        queue.submit, "text", request.dict(), None, STAGES[1:]
+    )
+    return JobSubmittedResponse(job_id=job_id, status="queued", **job_links(job_id))
+
+
+@app.post(
+    "/jobs/file",
+    response_model=JobSubmittedResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={
+        202: {"description": "Job queued"},
+        400: {"model": ErrorResponse, "description": "Invalid request"},
+        413: {"model": ErrorResponse, "description": "File too large"},
+        503: {"model": ErrorResponse, "description": "Service unavailable"}
+    },
+    tags=["Jobs"],
+    summary="Queue a regulation analysis from a PDF or TXT file"
+)
+async def submit_file_job(
+    file: UploadFile = File(..., description="PDF or TXT file containing regulation"),
+    date_of_law: Optional[str] = Form(None, description="Date of law (YYYY-MM-DD)"),
+    regulation_title: Optional[str] = Form(None, description="Regulation title"),
+    summarize: bool = Form(True, description="Auto-summarize if text exceeds 2000 words"),
+    summary_mode: Optional[str] = Form(
+        None,
+        description="Summarization: auto, single, map_reduce or extractive (local, no LLM call)"
+    )
+):
+    """
+    Queue the same analysis as POST /analyze_regulation_file and return at once
+
+    The uploaded file is stored with the job until it finishes.
+    """
+    queue = require_job_queue()
+    validate_file_form(file, date_of_law, summary_mode)
+    
+    content, content_sha256 = await read_upload(file)
+    params = {
+        "filename": file.filename,
+        "sha256": content_sha256,
+        "date_of_law": date_of_law,
+        "regulation_title": regulation_title or os.path.splitext(file.filename)[0],
+        "summarize": summarize,
+        "summary_mode": summary_mode
+    }
+    job_id = await queue.call(
+        queue.submit, "file", params, content, STAGES
+    )
+    return JobSubmittedResponse(job_id=job_id, status="queued", **job_links(job_id))
+
+
+@app.get(
+    "/jobs/{job_id}",
+    response_model=JobStatusResponse,
+    responses={404: {"model": ErrorResponse, "description": "Unknown job"}},
+    tags=["Jobs"],
+    summary="Job status and per-stage progress"
+)
+async def get_job(job_id: str):
+    """
+    Status (queued, running, succeeded, failed), attempts, and progress:
+    the current stage and, per stage, its status, timings and counts
+    """
+    if job_queue is None:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Job queue not initialized")
+    
+    job = await job_queue.call(job_queue.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Unknown job: {job_id}")
+    return JobStatusResponse(**job)
+
+
+@app.get(
+    "/jobs/{job_id}/result",
+    response_model=RegulationAnalysisResponse,
+    responses={
+        404: {"model": ErrorResponse, "description": "Unknown job"},
+        409: {"model": ErrorResponse, "description": "Job not finished, or failed"}
+    },
+    tags=["Jobs"],
+    summary="Report of a finished job"
+)
+async def get_job_result(job_id: str):
+    """
+    The analysis report once the job has succeeded (409 while it is queued
+    or running, or if it failed; the detail carries its status and error)
+    """
+    if job_queue is None:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Job queue not initialized")
+    
+    job = await job_queue.call(job_queue.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Unknown job: {job_id}")
+    
+    if job["status"] != "succeeded":
+        detail = f"Job is {job['status']}"
+        if job["status"] == "failed":
+            detail += f": {job['error']}"
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail)
+    
+    result = await job_queue.call(job_queue.get_result, job_id)
+    return RegulationAnalysisResponse(**result)
 
 
 # ─────────────────────────────────────────────────────────
@@ -1,24 +1,73 @@
 # arca_pipeline.py
 """
-ARCA System: Complete Sequential Pipeline Integration
+ARCA System: Pipeline Integration
 
-Orchestrates the 3-agent crew in strict sequential order:
+Orchestrates the 3-agent crew. Within one analysis the stages stay in order:
 1. Policy Researcher → Retrieves Top 5 relevant policies
 2. Compliance Auditor → Analyzes conflicts and assigns severity
 3. Report Generator → Formats final JSON output
 
-TSD Compliance: Sequential execution, no parallel processing
+Concurrency model:
+- analyze_regulation(): blocking, for scripts and the CLI
+- analyze_regulation_async(): the same stages and result, used by the API;
+  blocking work (embeddings, FAISS search, document processing) is awaited
+  in worker threads and the auditor's per-excerpt LLM calls run concurrently
+  (ARCA_AUDIT_CONCURRENCY at once), so the event loop keeps serving other
+  requests while many analyses are in flight
+- Executor: the API installs pipeline_executor.InstrumentedExecutor as the
+  event loop's default executor, so those worker threads are one sized,
+  instrumented pool
+- Jobs: job_queue.JobWorkerPool runs queued analyses in the background,
+  ARCA_JOB_WORKERS at a time per API process
+- Shared state: one ARCASystem (agents, document processor and its cache)
+  serves every concurrent analysis; LLM quota is shared per model
+  (llm_client)
 """
 
 import os
 import sys
-from typing import Dict, Any
+import time
+import asyncio
+from typing import Dict, Any, List, Optional, Tuple, Callable
 from datetime import datetime
 
 # Import all 3 agents
 from agents.policy_researcher import PolicyResearcherAgent
-from agents.compliance_auditor import ComplianceAuditorAgent
+from agents.compliance_auditor import ComplianceAuditorAgent, AUDIT_CONCURRENCY
 from agents.report_generator import ReportGeneratorAgent
+from agents.prescreen import ExcerptPrescreener
+from agents.clause_selector import ClauseSelector
+from agents.obligation_rules import ObligationRuleEngine
+
+# Local pre-screen before the LLM audit: opt-in (ARCA_PRESCREEN=1), meant to run
+# with a classifier trained and calibrated on labelled pairs (ARCA_PRESCREEN_MODEL)
+PRESCREEN_ENABLED = os.getenv("ARCA_PRESCREEN", "0") == "1"
+
+# Local numeric/temporal rule engine before the LLM audit (ARCA_RULE_ENGINE=0 to disable)
+RULE_ENGINE_ENABLED = os.getenv("ARCA_RULE_ENGINE", "1") != "0"
+
+# Overall latency budget per analysis in seconds (0 = unlimited)
+LATENCY_BUDGET = float(os.getenv("ARCA_LATENCY_BUDGET", "0"))
+
+# Progress callback: receives one event dict per pipeline step, in order:
+# stage_start / stage_end per stage, one "policy" event per retrieved policy
+# after research, and one "verdict" event per policy as soon as its audit
+# verdict is final. Called from the calling thread (the event loop thread in
+# the async pipeline), so it must not block.
+EventCallback = Callable[[Dict[str, Any]], None]
+
+# Pipeline stages, in order ("document" only for file analyses)
+STAGES = ["document", "research", "audit", "report"]
+
+
+def emit_event(on_event: Optional[EventCallback], event: str, **fields: Any) -> None:
+    """Send an event to the callback; a failing callback never fails the analysis"""
+    if on_event is None:
+        return
+    try:
+        on_event({"event": event, **fields})
+    except Exception as e:
+        print(f"⚠️  Event callback failed: {e}")
 
 
 class ARCASystem:
@@ -26,7 +75,8 @@ class ARCASystem:
         """
         Initialize the complete ARCA system with all 3 agents
         
-        TSD Architecture: Sequential workflow (chaîne de montage)
+        The stages of one analysis run in order (chaîne de montage); one
+        instance serves concurrent analyses (analyze_regulation_async)
         """
         print("=" * 60)
         print("🤖 INITIALIZING ARCA SYSTEM")
@@ -39,8 +89,17 @@ class ARCASystem:
             print("      ✅ Policy Researcher ready")
             
             # Initialize Agent 2: Compliance Auditor
+            # (pre-screen and clause selection reuse Agent 1's MiniLM embeddings)
             print("\n[2/3] Initializing Compliance Auditor Agent...")
-            self.agent2 = ComplianceAuditorAgent()
+            prescreener = (
+                ExcerptPrescreener(embeddings=self.agent1.embeddings)
+                if PRESCREEN_ENABLED else None
+            )
+            self.agent2 = ComplianceAuditorAgent(
+                prescreener=prescreener,
+                clause_selector=ClauseSelector(embeddings=self.agent1.embeddings),
+                rule_engine=ObligationRuleEngine() if RULE_ENGINE_ENABLED else None
+            )
             print("      ✅ Compliance Auditor ready")
             
             # Initialize Agent 3: Report Generator
@@ -48,6 +107,12 @@ class ARCASystem:
             self.agent3 = ReportGeneratorAgent()
             print("      ✅ Report Generator ready")
             
+            # Document processor for file analyses, shared by every request:
+            # one document cache connection, Agent 1's MiniLM embeddings for
+            # extractive summarization
+            from document_processor import DocumentProcessor
+            self.document_processor = DocumentProcessor(embeddings=self.agent1.embeddings)
+            
             print("\n" + "=" * 60)
             print("✅ ARCA SYSTEM INITIALIZED")
             print("=" * 60)
@@ -55,6 +120,10 @@ class ARCASystem:
         except Exception as e:
             print(f"\n❌ INITIALIZATION FAILED: {e}")
             raise
+    
+    def close(self) -> None:
+        """Release shared resources (document cache connection)"""
+        self.document_processor.close()
 
     def analyze_regulation(
         self,
@@ -63,12 +132,16 @@ class ARCASystem:
         regulation_title: str = "Untitled Regulation",
         top_k: int = 5,
         save_report: bool = True,
-        output_path: str = None
+        output_path: str = None,
+        batch_audit: bool = False,
+        cascade_audit: bool = False,
+        latency_budget: Optional[float] = None,
+        on_event: Optional[EventCallback] = None
     ) -> Dict[str, Any]:
         """
         Main pipeline: Analyze a new regulation against internal policies
         
-        TSD Sequential Flow:
+        TSD Stage Flow (in order within one analysis):
         ┌─────────────────────────────────────────────────────────┐
         │ INPUT: new_regulation_text                              │
         └─────────────────────────────────────────────────────────┘
@@ -102,38 +175,37 @@ class ARCASystem:
             top_k: Number of policies to retrieve (default: 5)
             save_report: Whether to save JSON to file (default: True)
             output_path: Custom output path (default: auto-generated)
+            batch_audit: Audit all excerpts in one LLM call (default: False)
+            cascade_audit: Cheap model first, escalate uncertain/HIGH verdicts (default: False)
+            latency_budget: Seconds for the whole analysis; lower-ranked excerpts
+                            left when it runs out are reported as unaudited
+                            (default: ARCA_LATENCY_BUDGET, 0 = unlimited)
+            on_event: Progress callback receiving stage_start / stage_end
+                      events (see EventCallback)
         
         Returns:
             Complete JSON report matching TSD schema
         """
         
-        print("\n" + "=" * 80)
-        print("🚀 STARTING ARCA ANALYSIS PIPELINE")
-        print("=" * 80)
-        print(f"Regulation: {regulation_title}")
-        print(f"Date of Law: {date_of_law or 'Not specified'}")
-        print(f"Text length: {len(new_regulation_text)} characters")
-        print("=" * 80)
-        
-        start_time = datetime.now()
+        start_time, latency_budget, deadline = self._begin_analysis(
+            new_regulation_text, date_of_law, regulation_title, latency_budget
+        )
         
         # ─────────────────────────────────────────────────────────
         # STAGE 1: POLICY RESEARCH
         # ─────────────────────────────────────────────────────────
-        print("\n" + "━" * 80)
-        print("📚 STAGE 1/3: POLICY RESEARCH")
-        print("━" * 80)
+        self._stage_banner("📚 STAGE 1/3: POLICY RESEARCH")
         print(f"Searching for Top {top_k} relevant internal policies...")
+        emit_event(on_event, "stage_start", stage="research")
         
         try:
             research_results = self.agent1.run(
                 query=new_regulation_text,
                 k=top_k
             )
-            
-            print(f"✅ Found {research_results['total_results']} relevant policies")
-            for i, item in enumerate(research_results['items'], 1):
-                print(f"   [{i}] {item['policy_id']} (score: {item['score']:.4f})")
+            self._log_research(research_results)
+            self._emit_policies(on_event, research_results)
+            emit_event(on_event, "stage_end", stage="research", policies=research_results['total_results'])
             
         except Exception as e:
             print(f"❌ STAGE 1 FAILED: {e}")
@@ -142,31 +214,21 @@ class ARCASystem:
         # ─────────────────────────────────────────────────────────
         # STAGE 2: COMPLIANCE AUDIT
         # ─────────────────────────────────────────────────────────
-        print("\n" + "━" * 80)
-        print("⚖️  STAGE 2/3: COMPLIANCE AUDIT")
-        print("━" * 80)
+        self._stage_banner("⚖️  STAGE 2/3: COMPLIANCE AUDIT")
         print(f"Analyzing {len(research_results['items'])} policies for conflicts...")
+        emit_event(on_event, "stage_start", stage="audit")
         
         try:
             audit_results = self.agent2.run(
                 new_regulation_text=new_regulation_text,
-                policy_items=research_results['items']
+                policy_items=research_results['items'],
+                batch_mode=batch_audit,
+                cascade_mode=cascade_audit,
+                deadline=deadline,
+                on_verdict=self._verdict_callback(on_event, research_results['items'])
             )
-            
-            print(f"\n✅ Audit complete:")
-            print(f"   Total conflicts: {audit_results['total_conflicts_found']}")
-            
-            # Show severity breakdown
-            severity_counts = {"HIGH": 0, "MEDIUM": 0, "LOW": 0}
-            for conflict in audit_results['conflicts']:
-                severity_counts[conflict['severity']] += 1
-            
-            if severity_counts['HIGH'] > 0:
-                print(f"   🔴 HIGH severity: {severity_counts['HIGH']}")
-            if severity_counts['MEDIUM'] > 0:
-                print(f"   🟡 MEDIUM severity: {severity_counts['MEDIUM']}")
-            if severity_counts['LOW'] > 0:
-                print(f"   🟢 LOW severity: {severity_counts['LOW']}")
+            self._log_audit(audit_results, latency_budget)
+            emit_event(on_event, "stage_end", stage="audit", conflicts=audit_results['total_conflicts_found'])
             
         except Exception as e:
             print(f"❌ STAGE 2 FAILED: {e}")
@@ -175,9 +237,197 @@ class ARCASystem:
         # ─────────────────────────────────────────────────────────
         # STAGE 3: REPORT GENERATION
         # ─────────────────────────────────────────────────────────
+        emit_event(on_event, "stage_start", stage="report")
+        final_report = self._generate_report(audit_results, date_of_law, regulation_title)
+        
+        self._complete_analysis(final_report, audit_results, start_time, save_report, output_path)
+        emit_event(on_event, "stage_end", stage="report", risks=final_report['total_risks_flagged'])
+        return final_report
+
+    async def analyze_regulation_async(
+        self,
+        new_regulation_text: str,
+        date_of_law: str = None,
+        regulation_title: str = "Untitled Regulation",
+        top_k: int = 5,
+        save_report: bool = True,
+        output_path: str = None,
+        batch_audit: bool = False,
+        cascade_audit: bool = False,
+        latency_budget: Optional[float] = None,
+        audit_concurrency: int = AUDIT_CONCURRENCY,
+        on_event: Optional[EventCallback] = None
+    ) -> Dict[str, Any]:
+        """
+        Async analyze_regulation(): same stages and report, without blocking
+        the event loop
+
+        - Stage 1: embedding + FAISS search run in a worker thread
+        - Stage 2: ComplianceAuditorAgent.run_async (local screening in a
+          worker thread, per-excerpt LLM calls awaited concurrently)
+        - Stage 3: report formatting inline, saving in a worker thread
+
+        The stages still run in order; many analyses can be in flight on one
+        event loop at once.
+
+        Args:
+            audit_concurrency: Max audit LLM calls in flight for this analysis
+                               (default: ARCA_AUDIT_CONCURRENCY)
+            (others: see analyze_regulation)
+
+        Returns:
+            Complete JSON report matching TSD schema
+        """
+        start_time, latency_budget, deadline = self._begin_analysis(
+            new_regulation_text, date_of_law, regulation_title, latency_budget
+        )
+
+        self._stage_banner("📚 STAGE 1/3: POLICY RESEARCH")
+        print(f"Searching for Top {top_k} relevant internal policies...")
+        emit_event(on_event, "stage_start", stage="research")
+
+        try:
+            research_results = await asyncio.to_thread(
+                self.agent1.run,
+                query=new_regulation_text,
+                k=top_k
+            )
+            self._log_research(research_results)
+            self._emit_policies(on_event, research_results)
+            emit_event(on_event, "stage_end", stage="research", policies=research_results['total_results'])
+
+        except Exception as e:
+            print(f"❌ STAGE 1 FAILED: {e}")
+            raise
+
+        self._stage_banner("⚖️  STAGE 2/3: COMPLIANCE AUDIT")
+        print(f"Analyzing {len(research_results['items'])} policies for conflicts...")
+        emit_event(on_event, "stage_start", stage="audit")
+
+        try:
+            audit_results = await self.agent2.run_async(
+                new_regulation_text=new_regulation_text,
+                policy_items=research_results['items'],
+                batch_mode=batch_audit,
+                cascade_mode=cascade_audit,
+                deadline=deadline,
+                concurrency=audit_concurrency,
+                on_verdict=self._verdict_callback(on_event, research_results['items'])
+            )
+            self._log_audit(audit_results, latency_budget)
+            emit_event(on_event, "stage_end", stage="audit", conflicts=audit_results['total_conflicts_found'])
+
+        except Exception as e:
+            print(f"❌ STAGE 2 FAILED: {e}")
+            raise
+
+        emit_event(on_event, "stage_start", stage="report")
+        final_report = self._generate_report(audit_results, date_of_law, regulation_title)
+
+        await asyncio.to_thread(
+            self._complete_analysis, final_report, audit_results, start_time, save_report, output_path
+        )
+        emit_event(on_event, "stage_end", stage="report", risks=final_report['total_risks_flagged'])
+        return final_report
+
+    # ─────────────────────────────────────────────────────────
+    # STAGE HELPERS (shared by the sync and async pipelines)
+    # ─────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _begin_analysis(
+        new_regulation_text: str,
+        date_of_law: Optional[str],
+        regulation_title: str,
+        latency_budget: Optional[float]
+    ) -> Tuple[datetime, Optional[float], Optional[float]]:
+        """Print the run header; returns (start time, latency budget, deadline)"""
+        print("\n" + "=" * 80)
+        print("🚀 STARTING ARCA ANALYSIS PIPELINE")
+        print("=" * 80)
+        print(f"Regulation: {regulation_title}")
+        print(f"Date of Law: {date_of_law or 'Not specified'}")
+        print(f"Text length: {len(new_regulation_text)} characters")
+        print("=" * 80)
+        
+        start_time = datetime.now()
+
+        if latency_budget is None:
+            latency_budget = LATENCY_BUDGET or None
+        deadline = time.monotonic() + latency_budget if latency_budget else None
+        return start_time, latency_budget, deadline
+        
+    @staticmethod
+    def _stage_banner(title: str) -> None:
         print("\n" + "━" * 80)
-        print("📊 STAGE 3/3: REPORT GENERATION")
+        print(title)
         print("━" * 80)
+        
+    @staticmethod
+    def _log_research(research_results: Dict[str, Any]) -> None:
+        print(f"✅ Found {research_results['total_results']} relevant policies")
+        for i, item in enumerate(research_results['items'], 1):
+            print(f"   [{i}] {item['policy_id']} (score: {item['score']:.4f})")
+            
+    @staticmethod
+    def _emit_policies(on_event: Optional[EventCallback], research_results: Dict[str, Any]) -> None:
+        for rank, item in enumerate(research_results['items'], 1):
+            emit_event(
+                on_event, "policy",
+                rank=rank, policy_id=item['policy_id'], score=item['score'], excerpt=item['excerpt']
+            )
+
+    def _verdict_callback(
+        self,
+        on_event: Optional[EventCallback],
+        policy_items: List[Dict[str, Any]]
+    ) -> Optional[Callable[[int, Dict[str, Any]], None]]:
+        """Auditor on_verdict hook turning each final verdict into a "verdict" event"""
+        if on_event is None:
+            return None
+
+        def on_verdict(index: int, verdict: Dict[str, Any]) -> None:
+            has_conflict = bool(verdict.get("has_conflict")) and not verdict.get("unaudited")
+            emit_event(
+                on_event, "verdict",
+                rank=index + 1,
+                policy_id=policy_items[index]['policy_id'],
+                has_conflict=has_conflict,
+                unaudited=bool(verdict.get("unaudited")),
+                # Same shape as the report's risks
+                risk=self.agent3.format_risk_object(verdict) if has_conflict else None
+            )
+
+        return on_verdict
+            
+    @staticmethod
+    def _log_audit(audit_results: Dict[str, Any], latency_budget: Optional[float]) -> None:
+        if "unaudited" in audit_results:
+            audit_results["unaudited"]["latency_budget_seconds"] = latency_budget
+            
+        print(f"\n✅ Audit complete:")
+        print(f"   Total conflicts: {audit_results['total_conflicts_found']}")
+        
+        # Show severity breakdown
+        severity_counts = {"HIGH": 0, "MEDIUM": 0, "LOW": 0}
+        for conflict in audit_results['conflicts']:
+            severity_counts[conflict['severity']] += 1
+        
+        if severity_counts['HIGH'] > 0:
+            print(f"   🔴 HIGH severity: {severity_counts['HIGH']}")
+        if severity_counts['MEDIUM'] > 0:
+            print(f"   🟡 MEDIUM severity: {severity_counts['MEDIUM']}")
+        if severity_counts['LOW'] > 0:
+            print(f"   🟢 LOW severity: {severity_counts['LOW']}")
+
+    def _generate_report(
+        self,
+        audit_results: Dict[str, Any],
+        date_of_law: Optional[str],
+        regulation_title: str
+    ) -> Dict[str, Any]:
+        """Stage 3: format the audit into the final JSON report"""
+        self._stage_banner("📊 STAGE 3/3: REPORT GENERATION")
         print("Formatting final JSON report...")
         
         try:
@@ -193,7 +443,17 @@ class ARCASystem:
         except Exception as e:
             print(f"❌ STAGE 3 FAILED: {e}")
             raise
+        return final_report
         
+    def _complete_analysis(
+        self,
+        final_report: Dict[str, Any],
+        audit_results: Dict[str, Any],
+        start_time: datetime,
+        save_report: bool,
+        output_path: Optional[str]
+    ) -> None:
+        """Save the report (optional) and print the run summary"""
         # ─────────────────────────────────────────────────────────
         # SAVE REPORT (Optional)
         # ─────────────────────────────────────────────────────────
@@ -222,8 +482,6 @@ class ARCASystem:
         if save_report:
             print(f"Report saved: {output_path}")
         print("=" * 80)
-        
-        return final_report
 
 
 # ─────────────────────────────────────────────────────────
@@ -289,7 +547,12 @@ def analyze_regulation_from_file_smart(
     file_path: str,
     date_of_law: str = None,
     regulation_title: str = None,
-    summarize: bool = True
+    summarize: bool = True,
+    summary_mode: Optional[str] = None,
+    filename: Optional[str] = None,
+    sha256: Optional[str] = None,
+    arca: Optional[ARCASystem] = None,
+    on_event: Optional[EventCallback] = None
 ) -> Dict[str, Any]:
     """
     Smart file analysis: Supports PDF and TXT files with automatic processing
@@ -309,56 +572,139 @@ def analyze_regulation_from_file_smart(
         )
     
     Args:
-        file_path: Path to PDF or TXT file
+        file_path: Path to PDF or TXT file, or the file's bytes (e.g. an upload)
         date_of_law: Date in YYYY-MM-DD format (optional)
         regulation_title: Title of regulation (optional, uses filename if not provided)
         summarize: Auto-summarize if text exceeds 2000 words (default: True)
+        summary_mode: "single", "map_reduce", "extractive" (local, no LLM) or
+                      "auto" (default: ARCA_SUMMARY_MODE)
+        filename: Original filename, required when file_path is bytes
+        sha256: Precomputed SHA-256 of the file bytes (skips re-hashing for
+                the document cache)
+        arca: Initialized ARCASystem to reuse (default: a new one)
+        on_event: Progress callback (see EventCallback); adds the "document" stage
     
     Returns:
         Complete JSON report from ARCA analysis
     """
-    from document_processor import DocumentProcessor
+    _print_smart_header(file_path, filename, summarize)
+    
+    if arca is None:
+        arca = ARCASystem()
+
+    # Step 1: Process document
+    emit_event(on_event, "stage_start", stage="document")
+    doc_result, regulation_title = _process_document(
+        arca, file_path, regulation_title, summarize, summary_mode, filename, sha256
+    )
+    emit_event(on_event, "stage_end", stage="document", words=doc_result['word_count'])
+    
+    # Step 2: Run ARCA analysis on processed text
+    print("\n" + "🔄 Passing processed text to ARCA pipeline...")
+    
+    analysis_result = arca.analyze_regulation(
+        new_regulation_text=doc_result['processed_text'],
+        date_of_law=date_of_law,
+        regulation_title=regulation_title,
+        on_event=on_event
+    )
     
+    _attach_document_metadata(analysis_result, doc_result)
+    return analysis_result
+
+
+async def analyze_regulation_from_file_smart_async(
+    file_path: str,
+    date_of_law: str = None,
+    regulation_title: str = None,
+    summarize: bool = True,
+    summary_mode: Optional[str] = None,
+    filename: Optional[str] = None,
+    sha256: Optional[str] = None,
+    arca: Optional[ARCASystem] = None,
+    on_event: Optional[EventCallback] = None
+) -> Dict[str, Any]:
+    """
+    Async analyze_regulation_from_file_smart(): extraction, cleaning and
+    summarization run in a worker thread, the analysis through
+    ARCASystem.analyze_regulation_async (same arguments and result)
+    """
+    _print_smart_header(file_path, filename, summarize)
+
+    if arca is None:
+        arca = await asyncio.to_thread(ARCASystem)
+
+    emit_event(on_event, "stage_start", stage="document")
+    doc_result, regulation_title = await asyncio.to_thread(
+        _process_document,
+        arca, file_path, regulation_title, summarize, summary_mode, filename, sha256
+    )
+    emit_event(on_event, "stage_end", stage="document", words=doc_result['word_count'])
+
+    print("\n" + "🔄 Passing processed text to ARCA pipeline...")
+
+    analysis_result = await arca.analyze_regulation_async(
+        new_regulation_text=doc_result['processed_text'],
+        date_of_law=date_of_law,
+        regulation_title=regulation_title,
+        on_event=on_event
+    )
+
+    _attach_document_metadata(analysis_result, doc_result)
+    return analysis_result
+
+
+def _print_smart_header(file_path: Any, filename: Optional[str], summarize: bool) -> None:
     print("\n" + "=" * 80)
     print("📄 SMART FILE ANALYSIS MODE")
     print("=" * 80)
-    print(f"File: {file_path}")
+    print(f"File: {filename or file_path}")
     print(f"Summarization: {'Enabled' if summarize else 'Disabled'}")
     print("=" * 80)
     
-    # Step 1: Process document
-    processor = DocumentProcessor()
-    doc_result = processor.process_document(
+
+def _process_document(
+    arca: ARCASystem,
+    file_path: Any,
+    regulation_title: Optional[str],
+    summarize: bool,
+    summary_mode: Optional[str],
+    filename: Optional[str],
+    sha256: Optional[str]
+) -> Tuple[Dict[str, Any], str]:
+    """Extract, clean and summarize the document; returns (result, title)"""
+    doc_result = arca.document_processor.process_document(
         file_path=file_path,
         summarize=summarize,
-        max_words=2000
+        max_words=2000,
+        lean=True,  # raw text is not needed past extraction
+        summary_mode=summary_mode,
+        filename=filename,
+        sha256=sha256
     )
     
     # Use filename as title if not provided
     if regulation_title is None:
         regulation_title = os.path.splitext(doc_result['original_file'])[0]
+    return doc_result, regulation_title
     
-    # Step 2: Run ARCA analysis on processed text
-    arca = ARCASystem()
     
-    print("\n" + "🔄 Passing processed text to ARCA pipeline...")
-    
-    analysis_result = arca.analyze_regulation(
-        new_regulation_text=doc_result['processed_text'],
-        date_of_law=date_of_law,
-        regulation_title=regulation_title
-    )
-    
-    # Add document processing metadata to the result
+def _attach_document_metadata(analysis_result: Dict[str, Any], doc_result: Dict[str, Any]) -> None:
+    """Add document processing metadata to the result"""
     analysis_result['document_metadata'] = {
         'source_file': doc_result['original_file'],
         'file_type': doc_result['file_type'],
-        'original_word_count': len(doc_result['raw_text'].split()),
+        'original_word_count': doc_result['raw_word_count'],
         'processed_word_count': doc_result['word_count'],
-        'was_summarized': doc_result['was_summarized']
+        'was_summarized': doc_result['was_summarized'],
+        'structure': doc_result.get('structure', {})
     }
-    
-    return analysis_result
+    if 'pdf_extraction' in doc_result:
+        analysis_result['document_metadata']['pdf_extraction'] = doc_result['pdf_extraction']
+    if 'summary_stats' in doc_result:
+        analysis_result['document_metadata']['summary_stats'] = doc_result['summary_stats']
+    if 'cache' in doc_result:
+        analysis_result['document_metadata']['document_cache'] = doc_result['cache']
 
 
 
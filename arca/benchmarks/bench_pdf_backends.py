@@ -0,0 +1,95 @@
+# benchmarks/bench_pdf_backends.py
+"""
+ARCA PDF Backend Benchmark
+
+Extracts every page of each PDF with every installed backend (see
+pdf_backends.py) and reports speed and output fidelity:
+- pages/s over the whole document
+- text density (non-space characters and words per page)
+- word recall against the reference backend (pdfplumber when installed):
+  share of the reference's words, counted with multiplicity, that the
+  backend also produced (order-insensitive, so layout differences in line
+  order do not count as lost text)
+- the backend ARCA_PDF_BACKEND=auto would pick from its first-page probe
+
+Run:
+    python benchmarks/bench_pdf_backends.py
+    python benchmarks/bench_pdf_backends.py gazette_2023.pdf --repeat 3
+"""
+
+import sys
+import time
+import argparse
+import statistics
+from collections import Counter
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from pdf_backends import available_backends, open_document, select_backend, text_density
+
+
+def extract_all(backend: str, path: str):
+    with open_document(backend, path) as document:
+        return [document.page_text(index) for index in range(len(document))]
+
+
+def word_recall(reference: Counter, candidate: Counter) -> float:
+    total = sum(reference.values())
+    if not total:
+        return 1.0
+    return sum((reference & candidate).values()) / total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ARCA PDF backend benchmark")
+    parser.add_argument("paths", nargs="*", help="PDF files (default: agents/new_regulation.pdf)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    paths = args.paths or [str(PROJECT_ROOT / "agents" / "new_regulation.pdf")]
+    backends = available_backends()
+    if not backends:
+        raise SystemExit("No PDF backend installed (pdfplumber, pdfminer.six or pypdfium2)")
+
+    print("=" * 70)
+    print(f"📄 PDF backend benchmark: {', '.join(backends)} ({args.repeat} runs each, median)")
+    print("=" * 70)
+
+    for path in paths:
+        print(f"\n{path}")
+        results = {}
+        for backend in backends:
+            timings = []
+            try:
+                for _ in range(args.repeat):
+                    started = time.perf_counter()
+                    pages = extract_all(backend, path)
+                    timings.append(time.perf_counter() - started)
+            except Exception as e:
+                print(f"   {backend:<12} failed: {type(e).__name__}: {e}")
+                continue
+            results[backend] = (statistics.median(timings), pages)
+
+        if not results:
+            continue
+        reference_name = "pdfplumber" if "pdfplumber" in results else next(iter(results))
+        reference_words = Counter(" ".join(results[reference_name][1]).split())
+
+        for backend, (median, pages) in results.items():
+            density = text_density(pages)
+            recall = word_recall(reference_words, Counter(" ".join(pages).split()))
+            print(
+                f"   {backend:<12} {len(pages) / median if median else 0:8.1f} pages/s | "
+                f"{median * 1000:8.1f} ms | {density['chars_per_page']:7.1f} chars/page | "
+                f"{density['words_per_page']:6.1f} words/page | recall vs {reference_name} {recall:6.1%}"
+            )
+
+        chosen, probes = select_backend(path)
+        probe_times = ", ".join(f"{p['backend']} {p['seconds'] * 1000:.1f} ms" for p in probes)
+        print(f"   auto → {chosen} (probe: {probe_times or 'single backend'})")
+
+
+if __name__ == "__main__":
+    main()
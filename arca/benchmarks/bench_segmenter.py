@@ -0,0 +1,142 @@
+# benchmarks/bench_segmenter.py
+"""
+ARCA Structure Segmenter Benchmark
+
+Times document_structure.segment_structure + flatten on:
+1. Real documents: agents/new_regulation.pdf (when a PDF backend is installed)
+   and any .pdf/.txt/.md paths given on the command line, extracted and
+   cleaned by DocumentProcessor
+2. Synthetic gazettes of growing size (titles, chapters, articles, numbered
+   and lettered clauses, page artifacts removed by the cleaner), to show
+   throughput stays flat as the input grows (linear time)
+3. The same gazettes as a collection of texts whose article numbering
+   restarts in each text ("Article 1, 2, ..." again, no chapter headings),
+   so thousands of sibling articles share an id and get "~n" suffixes
+
+Run:
+    python benchmarks/bench_segmenter.py
+    python benchmarks/bench_segmenter.py --sizes-mb 1 4 16 gazette_2023.pdf
+"""
+
+import sys
+import time
+import random
+import argparse
+import statistics
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from document_structure import segment_structure, flatten, structure_summary
+from text_cleaner import TextCleaner
+
+WORDS = (
+    "the controller shall ensure that personal data are processed lawfully fairly and "
+    "in a transparent manner within thirty days of the request unless otherwise provided"
+).split()
+
+
+def build_gazette(size_mb: float, seed: int = 11, restart_every: int = 0) -> str:
+    """
+    Synthetic gazette text with a realistic heading mix
+
+    Args:
+        restart_every: When set, a series of texts of this many articles
+                       each, numbered from 1 again and without titles or
+                       chapters (duplicate sibling article ids)
+    """
+    rng = random.Random(seed)
+    target = int(size_mb * 1024 * 1024)
+    parts, size, article = [], 0, 1
+    title = chapter = text = 0
+    while size < target:
+        if restart_every:
+            if article % restart_every == 1:
+                text += 1
+                parts.append(f"Décret n° {text} du 3 mars\n\n")
+        else:
+            if article % 40 == 1:
+                title += 1
+                parts.append(f"TITRE {title}\nDispositions {title}\n")
+            if article % 10 == 1:
+                chapter += 1
+                parts.append(f"Chapitre {chapter} - Objet\n")
+        number = (article - 1) % restart_every + 1 if restart_every else article
+        lines = [f"Article {number}: {' '.join(rng.choices(WORDS, k=6))}"]
+        for clause in range(1, rng.randint(2, 6)):
+            lines.append(f"{clause}. {' '.join(rng.choices(WORDS, k=rng.randint(15, 40)))}.")
+            for letter in "abc"[:rng.randint(0, 3)]:
+                lines.append(f"{letter}) {' '.join(rng.choices(WORDS, k=rng.randint(8, 20)))};")
+        block = "\n".join(lines) + "\n\n"
+        parts.append(block)
+        size += len(block)
+        article += 1
+    return "".join(parts)
+
+
+def load_documents(paths):
+    """(name, cleaned text) of real documents"""
+    documents = []
+    pdf_paths = [p for p in paths if p.lower().endswith(".pdf")]
+    default_pdf = PROJECT_ROOT / "agents" / "new_regulation.pdf"
+    if not paths and default_pdf.exists():
+        pdf_paths.append(str(default_pdf))
+
+    if pdf_paths:
+        try:
+            from document_processor import DocumentProcessor
+            processor = DocumentProcessor(use_cache=False)
+            for path in pdf_paths:
+                documents.append((path, processor.clean_text(processor.extract_text_from_pdf(path))))
+        except (ImportError, ValueError) as e:
+            print(f"⚠️  PDF extraction unavailable ({e}), PDF documents skipped")
+
+    cleaner = TextCleaner()
+    for path in paths:
+        if not path.lower().endswith(".pdf"):
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                documents.append((path, cleaner.clean(f.read())))
+    return documents
+
+
+def time_segmenter(text: str, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        tree = segment_structure(text)
+        units = flatten(tree, text)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings), tree, units
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ARCA structure segmenter benchmark")
+    parser.add_argument("paths", nargs="*", help="Regulation .pdf/.txt/.md files")
+    parser.add_argument("--sizes-mb", type=float, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    documents = load_documents(args.paths)
+    documents += [(f"synthetic gazette {size:g} MB", build_gazette(size)) for size in args.sizes_mb]
+    documents += [
+        (f"restarting numbering {size:g} MB", build_gazette(size, restart_every=8))
+        for size in args.sizes_mb
+    ]
+
+    print("=" * 70)
+    print(f"🧩 Structure segmenter benchmark ({args.repeat} runs each, median)")
+    print("=" * 70)
+
+    for name, text in documents:
+        median, tree, units = time_segmenter(text, args.repeat)
+        mb = len(text) / 1024 / 1024
+        print(
+            f"{name:<40} {mb:6.2f} MB | {median * 1000:8.1f} ms | "
+            f"{mb / median if median else 0:7.1f} MB/s | {len(units):6d} units"
+        )
+        print(f"   {structure_summary(tree)}")
+
+
+if __name__ == "__main__":
+    main()
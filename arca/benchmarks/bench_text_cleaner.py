@@ -0,0 +1,109 @@
+# benchmarks/bench_text_cleaner.py
+"""
+ARCA Text Cleaning Microbenchmark
+
+Times the original clean_text passes (text_cleaner.reference_clean) against
+TextCleaner.clean and TextCleaner.iter_clean on a large synthetic gazette:
+the policy corpus (or the given files) repeated with page artifacts, until
+the target size is reached.
+
+Run:
+    python benchmarks/bench_text_cleaner.py --size-mb 8 --repeat 5
+    python benchmarks/bench_text_cleaner.py --size-mb 4 regulation.txt
+"""
+
+import sys
+import glob
+import time
+import random
+import argparse
+import statistics
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from text_cleaner import TextCleaner, reference_clean
+
+PAGE_FOOTERS = ["\n{n}\n", "\nPage {n}\n", "\n- {n} -\n"]
+
+
+def build_document(paths, size_mb: float, seed: int = 7) -> str:
+    """Concatenate documents as PDF-like pages with footers and layout noise"""
+    sources = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            sources.append(f.read())
+    if not sources:
+        raise SystemExit("No input documents found")
+
+    rng = random.Random(seed)
+    target = int(size_mb * 1024 * 1024)
+    parts, size, page = [], 0, 1
+    while size < target:
+        lines = rng.choice(sources).split("\n")
+        for start in range(0, len(lines), 40):
+            body = "\n".join(
+                ("  " + line + "   ") if rng.random() < 0.2 else line
+                for line in lines[start:start + 40]
+            )
+            block = body.replace("- ", "• ", 1) + rng.choice(PAGE_FOOTERS).format(n=page) + "\n\n\n"
+            parts.append(block)
+            size += len(block)
+            page += 1
+    return "".join(parts)
+
+
+def time_runs(func, text: str, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(text)
+        timings.append(time.perf_counter() - started)
+    return timings, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ARCA text cleaning microbenchmark")
+    parser.add_argument("paths", nargs="*", help="Text/Markdown files (default: data/policies/*.md)")
+    parser.add_argument("--size-mb", type=float, default=8)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--block-chars", type=int, default=64 * 1024,
+                        help="Chunk size fed to iter_clean")
+    args = parser.parse_args()
+
+    paths = args.paths or sorted(glob.glob(str(PROJECT_ROOT / "data" / "policies" / "*.md")))
+    text = build_document(paths, args.size_mb)
+    cleaner = TextCleaner(header_footer_rules=[])
+
+    def streamed(doc: str) -> str:
+        blocks = (doc[i:i + args.block_chars] for i in range(0, len(doc), args.block_chars))
+        return "".join(cleaner.iter_clean(blocks))
+
+    candidates = [
+        ("reference (original passes)", reference_clean),
+        ("TextCleaner.clean", cleaner.clean),
+        ("TextCleaner.iter_clean", streamed)
+    ]
+
+    print("=" * 70)
+    print(f"🧹 Text cleaning benchmark: {len(text) / 1024 / 1024:.1f} MB, {args.repeat} runs each")
+    print("=" * 70)
+
+    baseline = None
+    expected = None
+    for name, func in candidates:
+        timings, result = time_runs(func, text, args.repeat)
+        median = statistics.median(timings)
+        if baseline is None:
+            baseline, expected = median, result
+        identical = "identical" if result == expected else "DIFFERENT OUTPUT"
+        print(
+            f"{name:<30} median {median * 1000:8.1f} ms | "
+            f"{len(text) / median / 1024 / 1024:7.1f} MB/s | "
+            f"x{baseline / median:4.2f} | {identical}"
+        )
+
+
+if __name__ == "__main__":
+    main()
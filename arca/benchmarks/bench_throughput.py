@@ -0,0 +1,167 @@
+# benchmarks/bench_throughput.py
+"""
+ARCA Throughput Benchmark (offline)
+
+Runs the full pipeline (or the HTTP API) against the deterministic stand-in
+LLM, so throughput and latency can be measured without spending quota.
+
+Targets:
+- pipeline: ARCASystem.analyze_regulation() in-process, N requests over C threads
+- api: POST /analyze_regulation on a running api.py, N requests over C threads
+       (start the API with ARCA_LLM_BACKEND=stub, or openai + stub_llm_server.py)
+
+Run:
+    python benchmarks/bench_throughput.py --requests 20 --concurrency 4
+    python benchmarks/bench_throughput.py --backend openai --start-stub --latency-ms 500 --error-rate 0.05
+    python benchmarks/bench_throughput.py --target api --api-url http://localhost:8000
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+SAMPLE_REGULATION = """Article {n}: Data Retention and Deletion Requirements
+
+1. All personal customer data must be permanently deleted within {days} days of receiving a deletion request from the customer.
+
+2. Companies must implement automated deletion mechanisms that do not require manual review for standard deletion requests.
+
+3. Deletion logs must be maintained for audit purposes for a minimum period of {years} years.
+
+4. Customers must receive confirmation of deletion within 48 hours of the deletion being completed.
+"""
+
+
+def make_regulation(i: int) -> str:
+    """Distinct regulation per request, so no cache layer short-circuits the run"""
+    return SAMPLE_REGULATION.format(n=i + 1, days=15 + i % 30, years=3 + i % 5)
+
+
+def percentile(values, pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_pipeline_request(system, i: int, args) -> float:
+    started = time.perf_counter()
+    system.analyze_regulation(
+        new_regulation_text=make_regulation(i),
+        regulation_title=f"Benchmark Regulation {i + 1}",
+        top_k=args.top_k,
+        save_report=False,
+        batch_audit=args.batch_audit,
+        cascade_audit=args.cascade_audit
+    )
+    return time.perf_counter() - started
+
+
+def run_api_request(i: int, args) -> float:
+    payload = json.dumps({
+        "new_regulation_text": make_regulation(i),
+        "regulation_title": f"Benchmark Regulation {i + 1}",
+        "batch_audit": args.batch_audit,
+        "cascade_audit": args.cascade_audit
+    }).encode("utf-8")
+    request = urllib.request.Request(
+        args.api_url.rstrip("/") + "/analyze_regulation",
+        data=payload,
+        headers={"Content-Type": "application/json"},
+        method="POST"
+    )
+    started = time.perf_counter()
+    with urllib.request.urlopen(request, timeout=600) as response:
+        response.read()
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ARCA offline throughput benchmark")
+    parser.add_argument("--target", choices=["pipeline", "api"], default="pipeline")
+    parser.add_argument("--requests", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=2)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--batch-audit", action="store_true")
+    parser.add_argument("--cascade-audit", action="store_true")
+    parser.add_argument("--backend", choices=["stub", "openai"], default="stub")
+    parser.add_argument("--start-stub", action="store_true",
+                        help="Serve stub_llm_server.py in-process for the openai backend")
+    parser.add_argument("--latency-ms", type=float, default=300)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rpm", type=float, default=100000,
+                        help="Client-side rate limit (requests/min) for the run")
+    parser.add_argument("--api-url", default="http://localhost:8000")
+    args = parser.parse_args()
+
+    # LLM configuration is read at import time, so set it before importing ARCA modules
+    os.environ["ARCA_LLM_BACKEND"] = args.backend
+    os.environ["ARCA_LLM_RPM"] = str(args.rpm)
+    os.environ["ARCA_LLM_TPM"] = str(args.rpm * 10000)
+    os.environ["ARCA_STUB_LATENCY_MS"] = str(args.latency_ms)
+    os.environ["ARCA_STUB_ERROR_RATE"] = str(args.error_rate)
+    os.environ.setdefault("ARCA_VERDICT_CACHE", "0")
+
+    stub_server = None
+    if args.backend == "openai" and args.start_stub:
+        from stub_llm_server import start_stub_server
+        stub_server, base_url = start_stub_server()
+        os.environ["ARCA_LLM_BASE_URL"] = base_url
+        print(f"🧪 Stub LLM server: {base_url}")
+
+    if args.target == "pipeline":
+        from arca_pipeline import ARCASystem
+        system = ARCASystem()
+        task = lambda i: run_pipeline_request(system, i, args)
+    else:
+        task = lambda i: run_api_request(i, args)
+
+    print(f"\n🏁 {args.requests} requests, concurrency {args.concurrency}, target={args.target}, backend={args.backend}")
+
+    latencies, failures = [], 0
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        futures = [pool.submit(task, i) for i in range(args.requests)]
+        for future in futures:
+            try:
+                latencies.append(future.result())
+            except Exception as e:
+                failures += 1
+                print(f"   ❌ Request failed: {e}")
+    wall = time.perf_counter() - started
+
+    print("\n" + "=" * 60)
+    print("📊 THROUGHPUT RESULTS")
+    print("=" * 60)
+    print(f"   Completed: {len(latencies)} | Failed: {failures}")
+    print(f"   Wall time: {wall:.2f}s")
+    print(f"   Throughput: {len(latencies) / wall:.2f} req/s" if wall else "   Throughput: n/a")
+    if latencies:
+        print(f"   Latency p50: {percentile(latencies, 50):.2f}s | "
+              f"p95: {percentile(latencies, 95):.2f}s | "
+              f"mean: {statistics.mean(latencies):.2f}s")
+
+    if args.target == "pipeline":
+        from llm_client import get_llm_stats
+        print("\n   LLM clients:")
+        for name, stats in get_llm_stats().items():
+            print(f"   - {name}: {stats['calls']} calls, {stats['retries']} retries, "
+                  f"{stats['failures']} failures, {stats['throttle_wait_seconds']:.2f}s throttled")
+    print("=" * 60)
+
+    if stub_server is not None:
+        stub_server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+# disk_cache.py
+"""
+ARCA System: Persistent Disk Cache
+
+SQLite-backed key/value store shared by the caching layers of the pipeline
+(LLM verdicts, processed documents).
+
+Features:
+- JSON values stored under content-hash keys
+- TTL expiry (entries older than ttl_seconds are ignored and purged)
+- Size eviction by entry count and/or total bytes (least recently used first)
+- Hit/miss statistics
+
+Dependencies: sqlite3 (standard library)
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+# Default location: arca/cache/
+DEFAULT_CACHE_DIR = str(Path(__file__).parent / "cache")
+
+
+def content_hash(*parts: str) -> str:
+    """
+    SHA-256 over several text parts (length-prefixed so boundaries are unambiguous)
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        data = (part or "").encode("utf-8")
+        digest.update(str(len(data)).encode("ascii") + b":")
+        digest.update(data)
+    return digest.hexdigest()
+
+
+class SQLiteCache:
+    """
+    Thread-safe persistent cache backed by a single SQLite table
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        table: str = "cache",
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None
+    ):
+        """
+        Args:
+            db_path: SQLite file path (parent directory is created)
+            table: Table name (lets several caches share one file)
+            ttl_seconds: Entry lifetime (None = never expires)
+            max_entries: Maximum number of entries (None = unbounded)
+            max_bytes: Maximum total size of stored values (None = unbounded)
+        """
+        if not table.isidentifier():
+            raise ValueError(f"Invalid cache table name: {table}")
+
+        self.db_path = db_path
+        self.table = table
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                f"""CREATE TABLE IF NOT EXISTS {self.table} (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )"""
+            )
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.table}_accessed ON {self.table}(accessed_at)"
+            )
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the cached value for key, or None on miss/expiry
+        """
+        now = time.time()
+
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                f"SELECT value, created_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            value, created_at = row
+            if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+                self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                self.evictions += 1
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self.hits += 1
+
+        return json.loads(value)
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a JSON-serializable value and apply size eviction
+        """
+        payload = json.dumps(value, ensure_ascii=False)
+        now = time.time()
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"""INSERT OR REPLACE INTO {self.table}
+                    (key, value, size, created_at, accessed_at)
+                    VALUES (?, ?, ?, ?, ?)""",
+                (key, payload, len(payload.encode("utf-8")), now, now)
+            )
+            self.writes += 1
+            self._evict(now)
+
+    def delete(self, key: str) -> None:
+        """Remove a single entry"""
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Remove every entry"""
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self.table}")
+
+    def _evict(self, now: float) -> None:
+        """
+        Drop expired entries, then least-recently-used entries until within limits
+        (caller holds the lock and the transaction)
+        """
+        if self.ttl_seconds is not None:
+            cursor = self._conn.execute(
+                f"DELETE FROM {self.table} WHERE created_at < ?", (now - self.ttl_seconds,)
+            )
+            self.evictions += max(cursor.rowcount, 0)
+
+        if self.max_entries is not None:
+            count = self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+            excess = count - self.max_entries
+            if excess > 0:
+                self._conn.execute(
+                    f"""DELETE FROM {self.table} WHERE key IN (
+                        SELECT key FROM {self.table} ORDER BY accessed_at ASC LIMIT ?
+                    )""",
+                    (excess,)
+                )
+                self.evictions += excess
+
+        if self.max_bytes is not None:
+            total = self._conn.execute(
+                f"SELECT COALESCE(SUM(size), 0) FROM {self.table}"
+            ).fetchone()[0]
+            if total > self.max_bytes:
+                rows = self._conn.execute(
+                    f"SELECT key, size FROM {self.table} ORDER BY accessed_at ASC"
+                ).fetchall()
+                for key, size in rows:
+                    if total <= self.max_bytes:
+                        break
+                    self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                    total -= size
+                    self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Hit-rate and size statistics for this process
+        """
+        with self._lock:
+            entries, total_bytes = self._conn.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM {self.table}"
+            ).fetchone()
+
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "entries": entries,
+            "total_bytes": total_bytes
+        }
+
+    def close(self) -> None:
+        """Close the underlying connection"""
+        with self._lock:
+            self._conn.close()
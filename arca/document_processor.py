@@ -4,47 +4,508 @@ ARCA System: Document Preprocessing Module
 
 Handles PDF and TXT file processing:
 1. Extract text from PDF or TXT files
-2. Clean text (remove artifacts, fix formatting)
+2. Clean text (remove artifacts, fix formatting; see text_cleaner.py)
 3. Summarize long documents using LLM
 4. Prepare text for ARCA pipeline
 
-Dependencies: pdfplumber, dotenv, langchain_google_genai
+Summarization modes (ARCA_SUMMARY_MODE):
+- single: the whole cleaned document in one prompt
+- map_reduce: articles (see Structure below) are packed into chunks,
+  summarized concurrently under the shared rate limit, then the partial
+  summaries are merged within the word budget
+- extractive: local sentence selection, no LLM call (extractive_summarizer.py)
+- auto (default): map_reduce above ARCA_SUMMARY_SINGLE_MAX_WORDS words
+A failed LLM call falls back to the extractive summary of its text.
+
+PDF backends (ARCA_PDF_BACKEND, see pdf_backends.py): pdfplumber, pdfminer
+text-only mode or pypdfium2, whichever are installed; "auto" probes the
+first pages with each and uses the fastest one with adequate text density.
+
+Large PDFs: pages are extracted in a process pool (ARCA_PDF_WORKERS) once a
+document has ARCA_PDF_PARALLEL_MIN_PAGES pages; each worker opens the file
+and extracts a contiguous page slice. A page that fails to extract is
+recorded and skipped instead of failing the document.
+
+Streaming (process_document(..., lean=True)): pages are extracted, cleaned
+and consumed block by block (iter_raw_text -> iter_clean_text), so the raw
+text is never held in full; the result drops raw_text and reports
+raw_word_count. The cleaned text is identical to the batch path.
+
+Structure: segment_document() parses parts, chapters, sections, articles
+and numbered clauses into a tree with character offsets (linear time, see
+document_structure.py); processed results report the number of nodes of
+each kind. The units feed map-reduce chunking and the auditor's clause
+selector.
+
+In-memory input: every entry point also accepts the document as bytes or a
+binary file object (read once), e.g. an upload; PDFs are opened from a
+BytesIO, TXT encodings are tried on the bytes in memory, nothing is written
+to disk. process_document then needs the filename for the file type.
+
+Document cache: results are persisted in SQLite (cache/documents.sqlite),
+keyed by the SHA-256 of the file bytes plus PROCESSOR_VERSION, max_words,
+the summarize flag and the cleaning rules, so a repeated upload skips
+extraction, cleaning and summarization. Entries are evicted least recently
+used first beyond ARCA_DOCUMENT_CACHE_MAX_MB. Results with failed pages or a
+failed summarization call are never cached.
+
+Dependencies: a PDF backend (pdfplumber, pdfminer.six or pypdfium2), dotenv,
+langchain_google_genai (via llm_client)
 """
 
+import io
 import os
 import re
+import time
+import hashlib
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional
-import pdfplumber
+from collections import deque
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Iterator, Iterable, Union, BinaryIO, TextIO
 from dotenv import load_dotenv
-from langchain_google_genai import GoogleGenerativeAI
+
+from llm_client import get_llm, estimate_tokens
+from disk_cache import SQLiteCache, content_hash, DEFAULT_CACHE_DIR
+from text_cleaner import TextCleaner
+from extractive_summarizer import ExtractiveSummarizer
+from document_structure import segment_structure, flatten, structure_summary
+from pdf_backends import PDF_BACKEND, open_document, resolve_backend
 
 load_dotenv()
 
-# LLM Configuration
-llm = GoogleGenerativeAI(
+# Per-call deadline for the summarization request (seconds)
+SUMMARY_CALL_TIMEOUT = float(os.getenv("ARCA_SUMMARY_TIMEOUT", "90"))
+
+# Summarization: "single", "map_reduce", "extractive" or "auto"
+SUMMARY_MODES = ("auto", "single", "map_reduce", "extractive")
+SUMMARY_MODE = os.getenv("ARCA_SUMMARY_MODE", "auto")
+# auto switches to map-reduce above this many words
+SUMMARY_SINGLE_MAX_WORDS = int(os.getenv("ARCA_SUMMARY_SINGLE_MAX_WORDS", "20000"))
+# Words of source text per map call, and concurrent map calls
+SUMMARY_CHUNK_WORDS = int(os.getenv("ARCA_SUMMARY_CHUNK_WORDS", "4000"))
+SUMMARY_MAP_WORKERS = int(os.getenv("ARCA_SUMMARY_MAP_WORKERS", "4"))
+# Smallest word budget handed to one map call
+SUMMARY_MIN_CHUNK_BUDGET = 120
+
+MAP_SUMMARY_PROMPT = """You are a legal document analyst. The text below is part {index} of {total} of a long regulation document. Extract ONLY the key regulatory requirements it contains.
+
+Your summary must:
+1. Focus on obligations, prohibitions, and compliance requirements
+2. Include specific deadlines, timeframes, and numeric requirements
+3. Keep article/section numbers so requirements stay traceable
+4. Omit preambles, background, definitions, and administrative procedures
+5. Be under {max_words} words (write nothing if this part has no requirements)
+
+REGULATION TEXT:
+{text}
+
+SUMMARIZED REQUIREMENTS (under {max_words} words):"""
+
+MERGE_SUMMARY_PROMPT = """You are a legal document analyst. Below are requirement summaries of consecutive parts of ONE regulation document. Merge them into a single summary of the key regulatory requirements.
+
+Your summary must:
+1. Keep every distinct obligation, prohibition, deadline and numeric requirement
+2. Remove duplicates and merge overlapping requirements
+3. Keep the order of the document and its article/section numbers
+4. Be under {max_words} words
+5. Maintain the legal tone and precision
+
+PARTIAL SUMMARIES:
+{text}
+
+MERGED REQUIREMENTS (under {max_words} words):"""
+
+# Bump when extraction, cleaning or summarization output changes so stale
+# cached documents are never served
+PROCESSOR_VERSION = "2025-06.2"
+
+# Document cache configuration
+DOCUMENT_CACHE_ENABLED = os.getenv("ARCA_DOCUMENT_CACHE", "1") != "0"
+DOCUMENT_CACHE_PATH = os.getenv(
+    "ARCA_DOCUMENT_CACHE_PATH", os.path.join(DEFAULT_CACHE_DIR, "documents.sqlite")
+)
+DOCUMENT_CACHE_MAX_MB = float(os.getenv("ARCA_DOCUMENT_CACHE_MAX_MB", "256"))
+
+# PDF page extraction: worker processes (0 = one per CPU, 1 = sequential)
+PDF_WORKERS = int(os.getenv("ARCA_PDF_WORKERS", "0"))
+# Smaller documents are extracted sequentially (process start-up costs more)
+PDF_PARALLEL_MIN_PAGES = int(os.getenv("ARCA_PDF_PARALLEL_MIN_PAGES", "40"))
+# Pages per worker task; bounds the text held by in-flight slices
+PDF_SLICE_PAGES = int(os.getenv("ARCA_PDF_SLICE_PAGES", "25"))
+
+# TXT decoding attempts, in order
+TXT_ENCODINGS = ['utf-8', 'latin-1', 'cp1252']
+
+# A document: file path, raw bytes, or a binary file object
+DocumentSource = Union[str, os.PathLike, bytes, bytearray, memoryview, BinaryIO]
+
+# TXT files are streamed in blocks of this many characters
+TXT_BLOCK_CHARS = 1 << 20
+
+# LLM Configuration (shared rate-limited client, see llm_client.py)
+llm = get_llm(
     model="gemini-2.5-flash",
-    temperature=0.3,  # Slightly creative for summarization
-    google_api_key=os.getenv("GOOGLE_API_KEY")
+    temperature=0.3  # Slightly creative for summarization
 )
 
 
+def load_source(source: DocumentSource) -> Union[str, bytes]:
+    """Paths stay paths; bytes-like objects and file objects (read once) become bytes"""
+    if isinstance(source, (str, os.PathLike)):
+        return os.fspath(source)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source)
+    if hasattr(source, "read"):
+        data = source.read()
+        if not isinstance(data, bytes):
+            raise ValueError("Document file objects must be opened in binary mode")
+        return data
+    raise TypeError(f"Unsupported document source: {type(source).__name__}")
+
+
+def source_name(source: Union[str, bytes], filename: Optional[str] = None) -> str:
+    """Base filename of a document (required for in-memory documents)"""
+    name = filename or (source if isinstance(source, str) else None)
+    if not name:
+        raise ValueError("filename is required when the document is passed as bytes or a file object")
+    return os.path.basename(name)
+
+
+def open_pdf(source: Union[str, bytes], backend: str = "pdfplumber"):
+    """PDF handle (len(), page_text(index)) on a path or on in-memory bytes"""
+    return open_document(backend, source)
+
+
+def open_txt(source: Union[str, bytes], encoding: str) -> TextIO:
+    """
+    Text stream on a path or on in-memory bytes; both translate newlines
+    the same way, so the decoded text is identical
+    """
+    if isinstance(source, bytes):
+        return io.TextIOWrapper(io.BytesIO(source), encoding=encoding)
+    return open(source, 'r', encoding=encoding)
+
+
+def require_file(source: Union[str, bytes], kind: str) -> None:
+    """FileNotFoundError for a missing path (in-memory documents always exist)"""
+    if isinstance(source, str) and not os.path.exists(source):
+        raise FileNotFoundError(f"{kind} file not found: {source}")
+
+
+# In-memory PDF of a pool worker, sent once per process by the initializer
+_WORKER_PDF_BYTES: Optional[bytes] = None
+
+
+def _init_pdf_worker(data: bytes) -> None:
+    global _WORKER_PDF_BYTES
+    _WORKER_PDF_BYTES = data
+
+
+def iter_page_range(
+    source: Union[str, bytes],
+    start: int,
+    end: int,
+    backend: str = "pdfplumber"
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield pages [start, end) of a PDF (0-based), one record per page
+
+    Each call opens its own handle. Errors are caught per page.
+
+    Args:
+        source: PDF path or bytes
+        backend: PDF backend name (see pdf_backends.BACKENDS)
+
+    Yields:
+        Dicts: page (1-based), text, seconds, error (None on success)
+    """
+    with open_pdf(source, backend) as pdf:
+        for index in range(start, min(end, len(pdf))):
+            started = time.perf_counter()
+            try:
+                text = pdf.page_text(index)
+                error = None
+            except Exception as e:
+                text = ""
+                error = f"{type(e).__name__}: {e}"
+            yield {
+                "page": index + 1,
+                "text": text,
+                "seconds": round(time.perf_counter() - started, 4),
+                "error": error
+            }
+
+
+def extract_page_range(
+    source: Optional[Union[str, bytes]],
+    start: int,
+    end: int,
+    backend: str = "pdfplumber"
+) -> List[Dict[str, Any]]:
+    """
+    Page records of pages [start, end); module-level so process-pool workers
+    can run it (source None = the worker's in-memory PDF)
+    """
+    return list(iter_page_range(_WORKER_PDF_BYTES if source is None else source, start, end, backend))
+
+
+def split_page_ranges(page_count: int, workers: int, max_slice_pages: int = PDF_SLICE_PAGES) -> List[tuple]:
+    """Contiguous (start, end) slices: at least two per worker, at most max_slice_pages each"""
+    slices = max(1, min(page_count, max(workers * 2, -(-page_count // max_slice_pages))))
+    size = -(-page_count // slices)
+    return [(start, min(start + size, page_count)) for start in range(0, page_count, size)]
+
+
+def count_words(chunks: Iterable[str], counter: Dict[str, int]) -> Iterator[str]:
+    """Pass chunks through, adding their word count to counter["words"] (words split across chunks count once)"""
+    inside_word = False
+    for chunk in chunks:
+        words = len(chunk.split())
+        if words and inside_word and not chunk[0].isspace():
+            words -= 1
+        counter["words"] += words
+        if chunk:
+            inside_word = not chunk[-1].isspace()
+        yield chunk
+
+
+def file_sha256(file_path: Union[str, bytes], block_size: int = 1 << 20) -> str:
+    """SHA-256 of a file's bytes, read block by block (or of in-memory bytes)"""
+    if isinstance(file_path, bytes):
+        return hashlib.sha256(file_path).hexdigest()
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def build_document_cache() -> Optional[SQLiteCache]:
+    """
+    Open the persistent document cache (None when disabled via ARCA_DOCUMENT_CACHE=0)
+    """
+    if not DOCUMENT_CACHE_ENABLED:
+        return None
+    return SQLiteCache(
+        DOCUMENT_CACHE_PATH,
+        table="documents",
+        max_bytes=int(DOCUMENT_CACHE_MAX_MB * 1024 * 1024)
+    )
+
+
+def split_sections(text: str) -> List[str]:
+    """Article-level units of the document structure, in order (preamble first)"""
+    return [unit["text"] for unit in flatten(segment_structure(text), text, depth="article")]
+
+
+def pack_chunks(sections: List[str], chunk_words: int) -> List[str]:
+    """
+    Pack consecutive sections into chunks of at most chunk_words words;
+    oversized sections are split at paragraphs, then at word windows
+    """
+    pieces = []
+    for section in sections:
+        if len(section.split()) <= chunk_words:
+            pieces.append(section)
+            continue
+        for paragraph in re.split(r'\n\s*\n', section):
+            words = paragraph.split()
+            for start in range(0, len(words), chunk_words):
+                pieces.append(' '.join(words[start:start + chunk_words]))
+
+    chunks, current, current_words = [], [], 0
+    for piece in pieces:
+        words = len(piece.split())
+        if not words:
+            continue
+        if current and current_words + words > chunk_words:
+            chunks.append('\n\n'.join(current))
+            current, current_words = [], 0
+        current.append(piece.strip())
+        current_words += words
+    if current:
+        chunks.append('\n\n'.join(current))
+    return chunks
+
+
+def trim_words(text: str, max_words: int) -> str:
+    words = text.split()
+    return text if len(words) <= max_words else ' '.join(words[:max_words])
+
+
 class DocumentProcessor:
     """
     Process regulation documents (PDF, TXT) for ARCA analysis
+
+    One instance can serve concurrent documents (ARCASystem keeps one): the
+    per-document statistics (last_pdf_extraction, last_summary_stats) are
+    kept per thread.
     """
     
-    def __init__(self):
-        """Initialize the document processor"""
+    def __init__(
+        self,
+        cleaner: Optional[TextCleaner] = None,
+        document_cache: Optional[SQLiteCache] = None,
+        use_cache: bool = True,
+        embeddings: Any = None,
+        pdf_backend: Optional[str] = None
+    ):
+        """
+        Initialize the document processor
+
+        Args:
+            cleaner: TextCleaner to use (default: header/footer rules from
+                     ARCA_HEADER_FOOTER_RULES)
+            document_cache: Cache instance to use (default: built from env config)
+            use_cache: Set False to bypass the document cache entirely
+            embeddings: LangChain embeddings for extractive summarization
+                        centrality (e.g. PolicyResearcherAgent.embeddings);
+                        None = TF-IDF
+            pdf_backend: PDF backend name or "auto" (default: ARCA_PDF_BACKEND)
+        """
         self.llm = llm
+        self.cleaner = cleaner or TextCleaner()
+        self.extractive_summarizer = ExtractiveSummarizer(embeddings=embeddings)
         self.max_words = 2000  # API limit
+        self.pdf_workers = PDF_WORKERS or (os.cpu_count() or 1)
+        self.pdf_backend = pdf_backend or PDF_BACKEND
+        self._local = threading.local()
+
+        if not use_cache:
+            self.document_cache = None
+        elif document_cache is not None:
+            self.document_cache = document_cache
+        else:
+            try:
+                self.document_cache = build_document_cache()
+            except Exception as e:
+                print(f"⚠️  Document cache unavailable ({e}), continuing without cache")
+                self.document_cache = None
+
+    @property
+    def last_pdf_extraction(self) -> Optional[Dict[str, Any]]:
+        """Page extraction stats of the current thread's last PDF"""
+        return getattr(self._local, "pdf_extraction", None)
+
+    @last_pdf_extraction.setter
+    def last_pdf_extraction(self, stats: Optional[Dict[str, Any]]) -> None:
+        self._local.pdf_extraction = stats
+
+    @property
+    def last_summary_stats(self) -> Optional[Dict[str, Any]]:
+        """Summarization stats of the current thread's last document"""
+        return getattr(self._local, "summary_stats", None)
+
+    @last_summary_stats.setter
+    def last_summary_stats(self, stats: Optional[Dict[str, Any]]) -> None:
+        self._local.summary_stats = stats
+
+    def close(self) -> None:
+        """Close the document cache connection"""
+        if self.document_cache is not None:
+            self.document_cache.close()
     
-    def extract_text_from_pdf(self, file_path: str) -> str:
+    def iter_pdf_pages(self, file_path: DocumentSource, workers: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the page records of a PDF in page order
+
+        Large documents are extracted in a process pool with a bounded window
+        of in-flight page slices, so only a few slices are held in memory.
+        Statistics are stored in self.last_pdf_extraction once the last page
+        has been yielded.
+
+        Args:
+            file_path: Path to PDF file, PDF bytes or binary file object;
+                       in-memory PDFs are sent once to each worker process
+            workers: Worker processes (default: ARCA_PDF_WORKERS / CPU count);
+                     1 forces sequential extraction
+        """
+        source = load_source(file_path)
+        workers = workers or self.pdf_workers
+        started = time.perf_counter()
+
+        backend, probes = resolve_backend(source, self.pdf_backend)
+        with open_pdf(source, backend) as pdf:
+            page_count = len(pdf)
+        print(f"📄 Extracting text from PDF ({page_count} pages, {backend})...")
+
+        failed = []
+        timings = []
+
+        def track(page):
+            timings.append((page["seconds"], page["page"]))
+            if page["error"]:
+                failed.append({"page": page["page"], "error": page["error"]})
+            return page
+
+        if workers <= 1 or page_count < PDF_PARALLEL_MIN_PAGES:
+            mode = "sequential"
+            workers = 1
+            for page in iter_page_range(source, 0, page_count, backend):
+                yield track(page)
+        else:
+            mode = "process_pool"
+            ranges = split_page_ranges(page_count, workers)
+            workers = min(workers, len(ranges))
+            print(f"   ⚡ {workers} worker processes, {len(ranges)} page slices")
+            if isinstance(source, bytes):
+                pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_pdf_worker, initargs=(source,))
+                task_source = None
+            else:
+                pool = ProcessPoolExecutor(max_workers=workers)
+                task_source = source
+            with pool:
+                in_flight = deque()
+                pending = iter(ranges)
+                for page_range in islice(pending, workers * 2):
+                    in_flight.append((page_range, pool.submit(extract_page_range, task_source, *page_range, backend)))
+                while in_flight:
+                    (range_start, range_end), future = in_flight.popleft()
+                    try:
+                        pages = future.result()
+                    except Exception as e:
+                        # A crashed worker only costs its slice: redo it in-process
+                        print(f"   ⚠️  Worker failed on pages {range_start + 1}-{range_end} ({e}), retrying in-process")
+                        pages = extract_page_range(source, range_start, range_end, backend)
+                    for page_range in islice(pending, 1):
+                        in_flight.append((page_range, pool.submit(extract_page_range, task_source, *page_range, backend)))
+                    for page in pages:
+                        yield track(page)
+
+        slowest = sorted(timings, reverse=True)[:5]
+        self.last_pdf_extraction = {
+            "backend": backend,
+            "backend_probe": probes,
+            "mode": mode,
+            "workers": workers,
+            "pages": page_count,
+            "failed_pages": failed,
+            "seconds": round(time.perf_counter() - started, 3),
+            "page_seconds_total": round(sum(seconds for seconds, _ in timings), 3),
+            "slowest_pages": [{"page": page, "seconds": seconds} for seconds, page in slowest]
+        }
+        if failed:
+            print(f"   ⚠️  {len(failed)} page(s) could not be extracted: {', '.join(str(f['page']) for f in failed[:10])}")
+
+    def extract_pdf_pages(self, file_path: DocumentSource, workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Extract every page of a PDF, in a process pool for large documents
+
+        Returns:
+            Page records in page order (see extract_page_range); extraction
+            statistics are kept in self.last_pdf_extraction
+        """
+        return list(self.iter_pdf_pages(file_path, workers=workers))
+
+    def extract_text_from_pdf(self, file_path: DocumentSource, workers: Optional[int] = None) -> str:
         """
         Extract text from a PDF file
         
         Args:
-            file_path: Path to PDF file
+            file_path: Path to PDF file, PDF bytes or binary file object
+            workers: Worker processes for page extraction (see extract_pdf_pages)
             
         Returns:
             Extracted text as string
@@ -53,24 +514,12 @@ class DocumentProcessor:
             FileNotFoundError: If file doesn't exist
             ValueError: If PDF extraction fails
         """
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"PDF file not found: {file_path}")
+        source = load_source(file_path)
+        require_file(source, "PDF")
         
         try:
-            text_content = []
-            
-            with pdfplumber.open(file_path) as pdf:
-                print(f"📄 Extracting text from PDF ({len(pdf.pages)} pages)...")
-                
-                for i, page in enumerate(pdf.pages, 1):
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_content.append(page_text)
-                    
-                    if i % 10 == 0:
-                        print(f"   Processed {i}/{len(pdf.pages)} pages...")
-            
-            full_text = "\n\n".join(text_content)
+            pages = self.extract_pdf_pages(source, workers=workers)
+            full_text = "\n\n".join(p["text"] for p in pages if p["text"])
             
             if not full_text.strip():
                 raise ValueError("No text could be extracted from PDF (possibly scanned image)")
@@ -81,12 +530,14 @@ class DocumentProcessor:
         except Exception as e:
             raise ValueError(f"Failed to extract text from PDF: {e}")
     
-    def extract_text_from_txt(self, file_path: str) -> str:
+    def extract_text_from_txt(self, file_path: DocumentSource) -> str:
         """
         Extract text from a TXT file
         
+        The file is read once; encodings are tried on the bytes in memory.
+
         Args:
-            file_path: Path to TXT file
+            file_path: Path to TXT file, file bytes or binary file object
             
         Returns:
             File content as string
@@ -94,16 +545,18 @@ class DocumentProcessor:
         Raises:
             FileNotFoundError: If file doesn't exist
         """
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"TXT file not found: {file_path}")
+        source = load_source(file_path)
+        require_file(source, "TXT")
         
         try:
+            if isinstance(source, str):
+                with open(source, 'rb') as f:
+                    source = f.read()
+
             # Try UTF-8 first, then fallback to other encodings
-            encodings = ['utf-8', 'latin-1', 'cp1252']
-            
-            for encoding in encodings:
+            for encoding in TXT_ENCODINGS:
                 try:
-                    with open(file_path, 'r', encoding=encoding) as f:
+                    with open_txt(source, encoding) as f:
                         text = f.read()
                     print(f"✅ Read TXT file ({len(text)} characters, encoding: {encoding})")
                     return text
@@ -115,6 +568,66 @@ class DocumentProcessor:
         except Exception as e:
             raise ValueError(f"Failed to read TXT file: {e}")
     
+    @staticmethod
+    def detect_txt_encoding(file_path: Union[str, bytes]) -> str:
+        """
+        First encoding of TXT_ENCODINGS that decodes the whole file (path or
+        bytes), checked block by block without keeping the text
+        """
+        for encoding in TXT_ENCODINGS:
+            try:
+                with open_txt(file_path, encoding) as f:
+                    while f.read(TXT_BLOCK_CHARS):
+                        pass
+                return encoding
+            except UnicodeDecodeError:
+                continue
+        raise ValueError("Could not decode file with any supported encoding")
+
+    def iter_raw_text(self, file_path: DocumentSource, filename: Optional[str] = None) -> Iterator[str]:
+        """
+        Stream the raw text of a PDF (page by page) or TXT file (in blocks)
+
+        Concatenating the yielded chunks gives exactly what
+        extract_text_from_pdf / extract_text_from_txt return.
+
+        Args:
+            file_path: Path, file bytes or binary file object
+            filename: Name giving the file type of an in-memory document
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If extraction fails or the file type is unsupported
+        """
+        source = load_source(file_path)
+        file_ext = Path(source_name(source, filename)).suffix.lower()
+        require_file(source, "Document")
+
+        if file_ext == '.pdf':
+            try:
+                has_text = False
+                for page in self.iter_pdf_pages(source):
+                    if page["text"]:
+                        yield page["text"] if not has_text else "\n\n" + page["text"]
+                        has_text = True
+                if not has_text:
+                    raise ValueError("No text could be extracted from PDF (possibly scanned image)")
+            except Exception as e:
+                raise ValueError(f"Failed to extract text from PDF: {e}")
+
+        elif file_ext in ['.txt', '.md']:
+            try:
+                encoding = self.detect_txt_encoding(source)
+                print(f"✅ Streaming TXT file (encoding: {encoding})")
+                with open_txt(source, encoding) as f:
+                    for block in iter(lambda: f.read(TXT_BLOCK_CHARS), ""):
+                        yield block
+            except Exception as e:
+                raise ValueError(f"Failed to read TXT file: {e}")
+
+        else:
+            raise ValueError(f"Unsupported file type: {file_ext}. Use .pdf or .txt")
+
     def clean_text(self, raw_text: str) -> str:
         """
         Clean extracted text by removing artifacts and normalizing formatting
@@ -125,53 +638,172 @@ class DocumentProcessor:
         Returns:
             Cleaned text
         """
-        text = raw_text
-        
-        # Remove page numbers (common patterns)
-        text = re.sub(r'\n\s*Page\s+\d+\s*\n', '\n', text, flags=re.IGNORECASE)
-        text = re.sub(r'\n\s*\d+\s*\n', '\n', text)
-        
-        # Remove excessive whitespace
-        text = re.sub(r' +', ' ', text)  # Multiple spaces to single
-        text = re.sub(r'\n{3,}', '\n\n', text)  # Multiple newlines to double
-        
-        # Remove common OCR artifacts
-        text = re.sub(r'[▪•●○■□]', '', text)  # Bullet points
-        
-        # Normalize quotes
-        text = text.replace('"', '"').replace('"', '"')
-        text = text.replace(''', "'").replace(''', "'")
-        
-        # Remove header/footer patterns (common in legal docs)
-        text = re.sub(r'\n\s*-\s*\d+\s*-\s*\n', '\n', text)
-        
-        # Trim whitespace from each line
-        lines = [line.strip() for line in text.split('\n')]
-        text = '\n'.join(lines)
-        
-        # Final cleanup
-        text = text.strip()
-        
+        text = self.cleaner.clean(raw_text)
+
         print(f"🧹 Text cleaned ({len(text)} characters)")
         return text
+        
+    def iter_clean_text(self, raw_chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Stream clean_text over raw text arriving in chunks
+
+        Concatenating the yielded pieces gives exactly
+        clean_text("".join(raw_chunks)) (see TextCleaner.iter_clean).
+        """
+        return self.cleaner.iter_clean(raw_chunks)
     
-    def summarize_and_extract_requirements(self, text: str, max_words: int = 2000) -> str:
+    def _summary_call(self, prompt: str) -> Dict[str, Any]:
+        """One summarization request; returns text, tokens and seconds (text None on failure)"""
+        started = time.perf_counter()
+        try:
+            summary = self.llm.invoke(
+                prompt,
+                timeout=SUMMARY_CALL_TIMEOUT,
+                validator=lambda response: bool(response and response.strip())
+            ).strip()
+            error = None
+        except Exception as e:
+            summary, error = None, str(e)
+        return {
+            "text": summary,
+            "error": error,
+            "prompt_tokens": estimate_tokens(prompt),
+            "completion_tokens": estimate_tokens(summary or ""),
+            "seconds": time.perf_counter() - started
+        }
+
+    @staticmethod
+    def _phase_stats(calls: List[Dict[str, Any]], seconds: float) -> Dict[str, Any]:
+        return {
+            "calls": len(calls),
+            "failed": sum(1 for c in calls if c["text"] is None),
+            "prompt_tokens": sum(c["prompt_tokens"] for c in calls),
+            "completion_tokens": sum(c["completion_tokens"] for c in calls),
+            "seconds": round(seconds, 3)
+        }
+
+    def map_reduce_summarize(self, text: str, max_words: int = 2000) -> str:
+        """
+        Summarize a long document section by section, then merge
+
+        Map: chunks of whole sections (SUMMARY_CHUNK_WORDS words) are
+        summarized concurrently; every call goes through the shared
+        rate-limited client. Each chunk gets a word budget proportional to
+        its size (twice its share, so the merge has material to choose from).
+        Reduce: partial summaries that exceed max_words are merged by one
+        more call. A failed map call uses the extractive summary of its chunk;
+        a failed merge trims every partial summary to its share.
+
+        Per-phase timing and token usage are stored in self.last_summary_stats.
+        """
+        started = time.perf_counter()
+        chunks = pack_chunks(split_sections(text), SUMMARY_CHUNK_WORDS)
+        total_words = sum(len(chunk.split()) for chunk in chunks)
+        shares = [max(1, round(max_words * len(chunk.split()) / total_words)) for chunk in chunks]
+
+        print(f"📝 Map-reduce summarization: {len(chunks)} chunks → target: {max_words} words")
+
+        prompts = [
+            MAP_SUMMARY_PROMPT.format(
+                index=i,
+                total=len(chunks),
+                text=chunk,
+                max_words=max(SUMMARY_MIN_CHUNK_BUDGET, 2 * share)
+            )
+            for i, (chunk, share) in enumerate(zip(chunks, shares), 1)
+        ]
+        map_started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, min(SUMMARY_MAP_WORKERS, len(prompts)))) as pool:
+            map_calls = list(pool.map(self._summary_call, prompts))
+        map_seconds = time.perf_counter() - map_started
+
+        partials, partial_shares = [], []
+        for i, (call, chunk, share) in enumerate(zip(map_calls, chunks, shares), 1):
+            if call["text"] is None:
+                print(f"   ⚠️  Chunk {i}/{len(chunks)} summarization failed ({call['error']}), using its extractive summary")
+                partials.append(self.extractive_summarizer.summarize(chunk, max_words=share))
+                partial_shares.append(share)
+            elif call["text"]:
+                partials.append(call["text"])
+                partial_shares.append(share)
+
+        reduce_calls = []
+        reduce_started = time.perf_counter()
+        combined = "\n\n".join(partials)
+        if len(combined.split()) <= max_words:
+            summary = combined
+        else:
+            call = self._summary_call(MERGE_SUMMARY_PROMPT.format(text=combined, max_words=max_words))
+            reduce_calls.append(call)
+            if call["text"]:
+                summary = trim_words(call["text"], max_words)
+            else:
+                print(f"   ⚠️  Merge failed ({call['error']}), trimming partial summaries to their share")
+                summary = trim_words(
+                    "\n\n".join(trim_words(p, s) for p, s in zip(partials, partial_shares)),
+                    max_words
+                )
+        reduce_seconds = time.perf_counter() - reduce_started
+
+        self.last_summary_stats = {
+            "mode": "map_reduce",
+            "chunks": len(chunks),
+            "map": self._phase_stats(map_calls, map_seconds),
+            "reduce": self._phase_stats(reduce_calls, reduce_seconds),
+            "total_seconds": round(time.perf_counter() - started, 3)
+        }
+        print(
+            f"✅ Summarized to {len(summary.split())} words "
+            f"(map {map_seconds:.1f}s, reduce {reduce_seconds:.1f}s)"
+        )
+        return summary
+
+    def extractive_summarize(self, text: str, max_words: int = 2000) -> str:
+        """Local extractive summary (no LLM call), stats in self.last_summary_stats"""
+        summary = self.extractive_summarizer.summarize(text, max_words=max_words)
+        self.last_summary_stats = self.extractive_summarizer.last_stats
+        print(
+            f"✅ Extracted {self.last_summary_stats['selected']} sentences, "
+            f"{len(summary.split())} words ({self.last_summary_stats['total_seconds']:.2f}s)"
+        )
+        return summary
+
+    def summarize_and_extract_requirements(
+        self,
+        text: str,
+        max_words: int = 2000,
+        mode: Optional[str] = None
+    ) -> str:
         """
         Summarize long regulation text and extract key requirements using LLM
         
         Args:
             text: Full regulation text
             max_words: Maximum words in summary (default: 2000)
+            mode: "single", "map_reduce", "extractive" or "auto"
+                  (default: ARCA_SUMMARY_MODE)
             
         Returns:
             Summarized text with key requirements
         """
+        mode = mode or SUMMARY_MODE
+        if mode not in SUMMARY_MODES:
+            raise ValueError(f"Unknown summary mode: {mode}. Use one of {', '.join(SUMMARY_MODES)}")
+
         word_count = len(text.split())
+        self.last_summary_stats = None
         
         # If already under limit, return cleaned text
         if word_count <= max_words:
             print(f"✅ Text already within limit ({word_count} words)")
             return text
+
+        if mode == "auto":
+            mode = "map_reduce" if word_count > SUMMARY_SINGLE_MAX_WORDS else "single"
+        if mode == "map_reduce":
+            return self.map_reduce_summarize(text, max_words=max_words)
+        if mode == "extractive":
+            return self.extractive_summarize(text, max_words=max_words)
         
         print(f"📝 Summarizing text ({word_count} words → target: {max_words} words)...")
         
@@ -190,65 +822,184 @@ REGULATION TEXT:
 
 SUMMARIZED REQUIREMENTS (under {max_words} words):"""
 
-        try:
-            summary = self.llm.invoke(prompt)
-            summary_word_count = len(summary.split())
+        call = self._summary_call(prompt)
+        self.last_summary_stats = {
+            "mode": "single",
+            "chunks": 1,
+            "map": self._phase_stats([call], call["seconds"]),
+            "total_seconds": round(call["seconds"], 3)
+        }
+
+        if call["text"] is not None:
+            summary_word_count = len(call["text"].split())
             
             print(f"✅ Summarized to {summary_word_count} words")
-            return summary.strip()
+            return call["text"]
             
-        except Exception as e:
-            print(f"⚠️  Summarization failed: {e}")
-            print(f"   Falling back to truncation method...")
+        else:
+            print(f"⚠️  Summarization failed: {call['error']}")
+            print(f"   Falling back to extractive summary...")
             
-            # Fallback: Simple truncation
-            words = text.split()
-            truncated = ' '.join(words[:max_words])
-            return truncated
+            # Fallback: local sentence selection (keeps late articles in play)
+            return self.extractive_summarizer.summarize(text, max_words=max_words)
     
+    def segment_document(self, text: str, depth: str = "subclause") -> Dict[str, Any]:
+        """
+        Parse the article/section/clause structure of a (cleaned) document
+
+        Args:
+            text: Document text
+            depth: Deepest kind split into its own unit (e.g. "article")
+
+        Returns:
+            Dict with tree (nested nodes with offsets) and units (contiguous
+            spans with segment ids, see document_structure.flatten)
+        """
+        tree = segment_structure(text)
+        return {"tree": tree, "units": flatten(tree, text, depth=depth)}
+
+    # ─────────────────────────────────────────────────────────
+    # DOCUMENT CACHE
+    # ─────────────────────────────────────────────────────────
+
+    def _cache_key(
+        self,
+        file_digest: str,
+        summarize: bool,
+        max_words: int,
+        summary_mode: Optional[str] = None
+    ) -> str:
+        """Content-hash key: file bytes + processor version + summarization settings + cleaning rules + PDF backend"""
+        return content_hash(
+            file_digest,
+            PROCESSOR_VERSION,
+            str(max_words),
+            f"summarize:{summary_mode or SUMMARY_MODE}" if summarize else "no-summarize",
+            "\n".join(self.cleaner.header_footer_rules),
+            f"pdf:{self.pdf_backend}"
+        )
+
+    def _cache_lookup(self, key: str, lean: bool) -> Optional[Dict[str, Any]]:
+        """Return a cached result or None (lean entries lack raw_text for full requests)"""
+        if self.document_cache is None:
+            return None
+        try:
+            cached = self.document_cache.get(key)
+        except Exception as e:
+            print(f"⚠️  Document cache read failed: {e}")
+            return None
+
+        if cached is None or (not lean and "raw_text" not in cached):
+            return None
+        if lean:
+            cached.pop("raw_text", None)
+        return cached
+
+    def _cache_store(self, key: str, result: Dict[str, Any]) -> None:
+        """Persist a processed document unless part of it is a fallback"""
+        if self.document_cache is None:
+            return
+        if result.get("pdf_extraction", {}).get("failed_pages"):
+            return
+        stats = result.get("summary_stats") or {}
+        if any(stats.get(phase, {}).get("failed") for phase in ("map", "reduce")):
+            return
+        try:
+            self.document_cache.set(key, {k: v for k, v in result.items() if k != "cache"})
+        except Exception as e:
+            print(f"⚠️  Document cache write failed: {e}")
+
     def process_document(
         self, 
-        file_path: str,
+        file_path: DocumentSource,
         summarize: bool = True,
-        max_words: int = 2000
+        max_words: int = 2000,
+        lean: bool = False,
+        summary_mode: Optional[str] = None,
+        filename: Optional[str] = None,
+        sha256: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Complete document processing pipeline
         
         Args:
-            file_path: Path to PDF or TXT file
+            file_path: Path to PDF or TXT file, or the file's bytes / a binary
+                       file object (read once, never written to disk)
             summarize: Whether to summarize if text exceeds max_words
             max_words: Maximum words to pass to ARCA pipeline
+            lean: Stream extraction and cleaning block by block and leave
+                  raw_text out of the result (memory tracks one page)
+            summary_mode: "single", "map_reduce", "extractive" or "auto"
+                          (default: ARCA_SUMMARY_MODE)
+            filename: Original filename (required for bytes / file objects;
+                      gives the file type and original_file)
+            sha256: SHA-256 of the file bytes when already known (e.g.
+                    hashed while the upload streamed in)
             
         Returns:
             Dict with:
                 - original_file: Original filename
                 - file_type: 'pdf' or 'txt'
-                - raw_text: Extracted text
+                - raw_text: Extracted text (omitted when lean)
+                - raw_word_count: Word count of the extracted text
                 - cleaned_text: Cleaned text
                 - processed_text: Final text for ARCA (cleaned + optionally summarized)
                 - word_count: Final word count
                 - was_summarized: Boolean indicating if summarization occurred
+                - structure: Number of parts/chapters/sections/articles/clauses
+                - summary_stats: Summarization mode, per-phase timing and token
+                  usage (when summarized)
+                - pdf_extraction: Page extraction stats (PDF only: backend and
+                  backend probe, mode, workers, failed_pages, per-page timing
+                  of the slowest pages)
+                - cache: Document cache lookup (hit, sha256) when the cache is on
         """
         print("=" * 60)
         print("📂 DOCUMENT PROCESSOR: Starting")
         print("=" * 60)
-        print(f"File: {file_path}")
+        source = load_source(file_path)
+        original_file = source_name(source, filename)
+        print(f"File: {original_file}" + (" (in memory)" if isinstance(source, bytes) else ""))
         
         # Determine file type
-        file_ext = Path(file_path).suffix.lower()
+        file_ext = Path(original_file).suffix.lower()
         
         if file_ext == '.pdf':
             file_type = 'pdf'
-            raw_text = self.extract_text_from_pdf(file_path)
         elif file_ext in ['.txt', '.md']:
             file_type = 'txt'
-            raw_text = self.extract_text_from_txt(file_path)
         else:
             raise ValueError(f"Unsupported file type: {file_ext}. Use .pdf or .txt")
+
+        cache_key = None
+        if self.document_cache is not None:
+            file_digest = sha256 or file_sha256(source)
+            cache_key = self._cache_key(file_digest, summarize, max_words, summary_mode)
+            cached = self._cache_lookup(cache_key, lean)
+            if cached is not None:
+                cached["original_file"] = original_file
+                cached["cache"] = {"hit": True, "sha256": file_digest}
+                print(f"♻️  Document cache hit ({file_digest[:12]}), skipping extraction and summarization")
+                print(f"Final output: {cached['word_count']} words")
+                return cached
         
-        # Clean text
-        cleaned_text = self.clean_text(raw_text)
+        if lean:
+            # Extract and clean in one streaming pass, the raw text is never joined
+            word_counter = {"words": 0}
+            raw_chunks = count_words(self.iter_raw_text(source, filename=original_file), word_counter)
+            raw_text = None
+            cleaned_text = "".join(self.iter_clean_text(raw_chunks))
+            raw_word_count = word_counter["words"]
+            print(f"🧹 Text extracted and cleaned ({len(cleaned_text)} characters)")
+        else:
+            if file_type == 'pdf':
+                raw_text = self.extract_text_from_pdf(source)
+            else:
+                raw_text = self.extract_text_from_txt(source)
+            raw_word_count = len(raw_text.split())
+
+            # Clean text
+            cleaned_text = self.clean_text(raw_text)
         
         # Summarize if needed
         was_summarized = False
@@ -259,26 +1010,37 @@ SUMMARIZED REQUIREMENTS (under {max_words} words):"""
             if word_count > max_words:
                 processed_text = self.summarize_and_extract_requirements(
                     cleaned_text, 
-                    max_words=max_words
+                    max_words=max_words,
+                    mode=summary_mode
                 )
                 was_summarized = True
         
         final_word_count = len(processed_text.split())
         
         result = {
-            "original_file": os.path.basename(file_path),
+            "original_file": original_file,
             "file_type": file_type,
-            "raw_text": raw_text,
+            "raw_word_count": raw_word_count,
             "cleaned_text": cleaned_text,
             "processed_text": processed_text,
             "word_count": final_word_count,
-            "was_summarized": was_summarized
+            "was_summarized": was_summarized,
+            "structure": structure_summary(segment_structure(cleaned_text))
         }
+        if not lean:
+            result["raw_text"] = raw_text
+        if was_summarized and self.last_summary_stats is not None:
+            result["summary_stats"] = self.last_summary_stats
+        if file_type == 'pdf' and self.last_pdf_extraction is not None:
+            result["pdf_extraction"] = self.last_pdf_extraction
+        if cache_key is not None:
+            self._cache_store(cache_key, result)
+            result["cache"] = {"hit": False, "sha256": file_digest}
         
         print("\n" + "=" * 60)
         print("✅ DOCUMENT PROCESSING COMPLETE")
         print("=" * 60)
-        print(f"Original words: {len(raw_text.split())}")
+        print(f"Original words: {raw_word_count}")
         print(f"After cleaning: {len(cleaned_text.split())}")
         print(f"Final output: {final_word_count} words")
         print(f"Summarized: {'Yes' if was_summarized else 'No'}")
@@ -0,0 +1,183 @@
+# document_structure.py
+"""
+ARCA System: Regulation Structure Segmenter
+
+Parses the heading structure of a regulation (parts/titles, chapters,
+sections, articles, numbered clauses, lettered sub-clauses) into a
+lightweight tree with exact character offsets into the text.
+
+Linear time: one regex scan finds every heading line, and a stack of open
+nodes builds the tree (each heading is pushed and popped once), so
+multi-MB gazettes segment in milliseconds.
+
+Tree nodes (dicts):
+- segment_id: Path of the node, e.g. "chapter-2/article-12/clause-3"
+- kind: document | part | chapter | section | article | clause | subclause
+- label: Heading number as written ("12", "II", "premier", "a")
+- heading: The heading line
+- start/end: Span of the node, children included ([start, end) of the text)
+- children: Nested nodes in document order
+
+flatten() turns the tree into contiguous units that tile the text (a
+node's intro before its first child is a unit of its own), down to a given
+level: articles for map-reduce summarization, clauses for clause selection.
+
+Dependencies: none (standard library only)
+"""
+
+import re
+from typing import List, Dict, Any, Iterator, Optional
+
+# Heading kinds, outermost first (rank = position)
+LEVELS = ["part", "chapter", "section", "article", "clause", "subclause"]
+RANK = {kind: rank for rank, kind in enumerate(LEVELS)}
+
+_NUMBER = r"(?:premier|premi[eè]re|first|\d+(?:[.\-]\d+)*(?:er|e)?(?:\s+(?:bis|ter|quater))?|[IVXLC]+)"
+# Headings stand on their own or are followed by a title separator
+_HEADING_END = r"(?=[ \t]*(?:$|[:.\-–—]))"
+
+HEADING_RE = re.compile(
+    r"^[ \t]*(?:"
+    r"(?P<part>(?:part|partie|title|titre|livre|book)[ \t]+(?P<part_no>" + _NUMBER + r"))\b" + _HEADING_END +
+    r"|(?P<chapter>(?:chapter|chapitre)[ \t]+(?P<chapter_no>" + _NUMBER + r"))\b" + _HEADING_END +
+    r"|(?P<section>(?:sous-section|section)[ \t]+(?P<section_no>" + _NUMBER + r"))\b" + _HEADING_END +
+    r"|(?P<article>(?:article|art\.)[ \t]*(?P<article_no>" + _NUMBER + r"))\b" + _HEADING_END +
+    r"|(?P<clause>(?P<clause_no>\d{1,3}(?:\.\d{1,3})*)[.)])[ \t]"
+    r"|(?P<subclause>\(?(?P<subclause_no>[a-z]|[ivx]{1,4})\))[ \t]"
+    r")",
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Id-safe label: lowercase, spaces and dots to dashes
+_LABEL_RE = re.compile(r"[^0-9a-z]+")
+
+
+def _node(kind: str, label: str, heading: str, start: int, parent_id: Optional[str]) -> Dict[str, Any]:
+    slug = _LABEL_RE.sub("-", label.lower()).strip("-") or "0"
+    segment_id = f"{kind}-{slug}"
+    return {
+        "segment_id": f"{parent_id}/{segment_id}" if parent_id else segment_id,
+        "kind": kind,
+        "label": label,
+        "heading": heading,
+        "start": start,
+        "end": None,
+        "children": []
+    }
+
+
+def segment_structure(text: str) -> Dict[str, Any]:
+    """
+    Parse the heading structure of text into a tree
+
+    A heading closes every open node of the same or a deeper level; a
+    heading that skips levels (an article directly in a chapter) nests
+    under the nearest open ancestor. Duplicate sibling ids (the same article
+    number twice) get a "~2", "~3"... suffix so ids stay unique.
+
+    Returns:
+        Root node (kind "document", segment_id "") spanning the whole text
+    """
+    root = {
+        "segment_id": "",
+        "kind": "document",
+        "label": "",
+        "heading": "",
+        "start": 0,
+        "end": len(text),
+        "children": []
+    }
+    stack = [(-1, root)]
+    seen_ids = set()
+    next_suffix: Dict[str, int] = {}
+
+    for match in HEADING_RE.finditer(text):
+        # The heading group closes after its number group, so it is lastgroup
+        kind = match.lastgroup
+        rank = RANK[kind]
+        start = match.start() + (len(match.group(0)) - len(match.group(0).lstrip(" \t")))
+
+        while stack[-1][0] >= rank:
+            stack.pop()[1]["end"] = start
+
+        parent = stack[-1][1]
+        line_end = text.find("\n", start)
+        heading = text[start:line_end if line_end != -1 else len(text)].strip()
+        node = _node(kind, match.group(f"{kind}_no"), heading, start, parent["segment_id"])
+        base_id = node["segment_id"]
+        if base_id in seen_ids:
+            # "~" never occurs in a slug, so suffixed ids cannot collide with
+            # plain ones; one counter per base id keeps each collision O(1)
+            suffix = next_suffix.get(base_id, 2)
+            node["segment_id"] = f"{base_id}~{suffix}"
+            next_suffix[base_id] = suffix + 1
+        seen_ids.add(base_id)
+
+        parent["children"].append(node)
+        stack.append((rank, node))
+
+    while len(stack) > 1:
+        stack.pop()[1]["end"] = len(text)
+    return root
+
+
+def iter_nodes(tree: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Every node below the root, in document order (iterative DFS)"""
+    pending = list(reversed(tree["children"]))
+    while pending:
+        node = pending.pop()
+        yield node
+        pending.extend(reversed(node["children"]))
+
+
+def flatten(tree: Dict[str, Any], text: str, depth: str = "subclause") -> List[Dict[str, Any]]:
+    """
+    Contiguous units tiling the text, split no deeper than the given level
+
+    Args:
+        tree: Result of segment_structure(text)
+        text: The segmented text
+        depth: Deepest kind split into its own units ("article" keeps each
+               article whole, "subclause" splits every heading)
+
+    Returns:
+        List of dicts: segment_id, kind, text (stripped), start, end (offsets
+        of the stripped text); the preamble before the first heading has
+        kind "preamble", a node's intro before its first child has its id
+    """
+    max_rank = RANK[depth]
+    spans = []
+
+    def emit(node_id: str, kind: str, start: int, end: int):
+        raw = text[start:end]
+        stripped = raw.strip()
+        if stripped:
+            lead = len(raw) - len(raw.lstrip())
+            spans.append({
+                "segment_id": node_id,
+                "kind": kind,
+                "text": stripped,
+                "start": start + lead,
+                "end": start + lead + len(stripped)
+            })
+
+    first = tree["children"][0]["start"] if tree["children"] else len(text)
+    emit("preamble", "preamble", 0, first)
+
+    pending = list(reversed(tree["children"]))
+    while pending:
+        node = pending.pop()
+        if RANK[node["kind"]] >= max_rank or not node["children"]:
+            emit(node["segment_id"], node["kind"], node["start"], node["end"])
+            continue
+        emit(node["segment_id"], node["kind"], node["start"], node["children"][0]["start"])
+        pending.extend(reversed(node["children"]))
+    return spans
+
+
+def structure_summary(tree: Dict[str, Any]) -> Dict[str, int]:
+    """Number of nodes of each kind, e.g. {"chapter": 4, "article": 52, "clause": 130}"""
+    counts = {kind: 0 for kind in LEVELS}
+    for node in iter_nodes(tree):
+        counts[node["kind"]] += 1
+    return {kind: count for kind, count in counts.items() if count}
@@ -0,0 +1,273 @@
+# extractive_summarizer.py
+"""
+ARCA System: Local Extractive Summarizer
+
+Offline alternative to LLM summarization for documents over the word
+budget: whole sentences are selected from the document instead of being
+rewritten, so every late article still competes for a place and nothing
+is invented.
+
+Sentence score (each signal normalized to 0..1 over the document):
+- obligation: obligation vocabulary (must, shall, within, delete, notify...)
+- centrality: TextRank (PageRank over the sentence similarity graph), using
+  MiniLM embeddings when given, TF-IDF vectors otherwise
+- numeric: quantities ("30 days", "5%") and deadline/date expressions
+
+Selection: best-scoring sentences first, skipping near-duplicates, until
+the word budget is full; the output keeps document order.
+
+Speed: only the ARCA_EXTRACTIVE_MAX_CANDIDATES sentences with the best
+lexical scores enter the similarity graph, so the cost is bounded on long
+documents. numpy (installed with sentence-transformers) is imported lazily;
+without it, centrality uses sparse TF-IDF in pure Python.
+"""
+
+import os
+import re
+import math
+import time
+import threading
+from collections import Counter
+from typing import List, Dict, Any, Optional, Tuple
+
+from agents.span_aligner import split_sentences
+from agents.prescreen import OBLIGATION_TERMS, QUANTITY_RE, STOPWORDS
+
+# Sentences entering the TextRank graph (best lexical scores first)
+MAX_CANDIDATES = int(os.getenv("ARCA_EXTRACTIVE_MAX_CANDIDATES", "300"))
+
+# Weights of the sentence score
+DEFAULT_WEIGHTS = {
+    "obligation": 0.4,
+    "centrality": 0.35,
+    "numeric": 0.25
+}
+
+TEXTRANK_DAMPING = 0.85
+TEXTRANK_ITERATIONS = 30
+# A candidate this similar to an already selected sentence is skipped
+DUPLICATE_SIMILARITY = 0.9
+
+DEADLINE_RE = re.compile(
+    r"\b(?:within|no later than|not later than|before|until|by|deadline|at least|at most"
+    r"|dans un délai|au plus tard|avant le|à compter)\b"
+    r"|\b\d{4}-\d{2}-\d{2}\b"
+    r"|\b\d{1,2}(?:er)?\s+(?:january|february|march|april|may|june|july|august|september"
+    r"|october|november|december|janvier|février|mars|avril|mai|juin|juillet|août"
+    r"|septembre|octobre|novembre|décembre)\b"
+    r"|\b(?:january|february|march|april|may|june|july|august|september|october"
+    r"|november|december)\s+\d{1,2},?\s+\d{4}\b",
+    re.IGNORECASE
+)
+
+TOKEN_RE = re.compile(r"[a-zA-ZÀ-ÿ]+")
+# TF-IDF terms: content words and numbers ("30 days" vs "90 days" must differ)
+TERM_RE = re.compile(r"[a-zA-ZÀ-ÿ]{4,}|\d+(?:[.,]\d+)?")
+
+
+def _normalize(values: List[float]) -> List[float]:
+    top = max(values, default=0.0)
+    return [v / top for v in values] if top > 0 else [0.0] * len(values)
+
+
+def lexical_scores(sentence: str) -> Dict[str, float]:
+    """Raw obligation and numeric/deadline counts of one sentence"""
+    words = [w.lower() for w in TOKEN_RE.findall(sentence)]
+    return {
+        "obligation": float(sum(1 for w in words if w in OBLIGATION_TERMS)),
+        "numeric": float(len(QUANTITY_RE.findall(sentence)) + len(DEADLINE_RE.findall(sentence)))
+    }
+
+
+def _tfidf_vectors(texts: List[str]) -> List[Dict[str, float]]:
+    """Unit-length sparse TF-IDF vectors over content words and numbers"""
+    bags = [Counter(w.lower() for w in TERM_RE.findall(t) if w.lower() not in STOPWORDS) for t in texts]
+    document_frequency = Counter(word for bag in bags for word in bag)
+    count = len(texts)
+    vectors = []
+    for bag in bags:
+        vector = {
+            word: tf * (math.log((1 + count) / (1 + document_frequency[word])) + 1.0)
+            for word, tf in bag.items()
+        }
+        norm = math.sqrt(sum(v * v for v in vector.values()))
+        vectors.append({w: v / norm for w, v in vector.items()} if norm else {})
+    return vectors
+
+
+def _similarity_matrix_python(vectors: List[Dict[str, float]]) -> List[List[float]]:
+    size = len(vectors)
+    matrix = [[0.0] * size for _ in range(size)]
+    for i in range(size):
+        a = vectors[i]
+        for j in range(i + 1, size):
+            b = vectors[j]
+            if len(b) < len(a):
+                small, large = b, a
+            else:
+                small, large = a, b
+            sim = sum(v * large.get(w, 0.0) for w, v in small.items())
+            matrix[i][j] = matrix[j][i] = sim
+    return matrix
+
+
+def textrank(matrix: List[List[float]]) -> List[float]:
+    """PageRank over a symmetric non-negative similarity matrix (pure Python)"""
+    size = len(matrix)
+    if size == 0:
+        return []
+    out_weight = [sum(row) for row in matrix]
+    # Incoming edges of every node, pre-divided by the sender's out-weight
+    incoming = [
+        [(j, matrix[i][j] / out_weight[j]) for j in range(size) if matrix[i][j]]
+        for i in range(size)
+    ]
+    ranks = [1.0 / size] * size
+    for _ in range(TEXTRANK_ITERATIONS):
+        ranks = [
+            (1 - TEXTRANK_DAMPING) / size
+            + TEXTRANK_DAMPING * sum(ranks[j] * weight for j, weight in edges)
+            for edges in incoming
+        ]
+    return ranks
+
+
+class ExtractiveSummarizer:
+    """
+    Select the most requirement-dense sentences of a document under a word budget
+    """
+
+    def __init__(
+        self,
+        embeddings: Any = None,
+        weights: Optional[Dict[str, float]] = None,
+        max_candidates: int = MAX_CANDIDATES
+    ):
+        """
+        Args:
+            embeddings: LangChain embeddings (e.g. PolicyResearcherAgent.embeddings);
+                        None = TF-IDF centrality
+            weights: Signal weights (default: DEFAULT_WEIGHTS)
+            max_candidates: Sentences entering the TextRank graph
+        """
+        self.embeddings = embeddings
+        self.weights = dict(weights or DEFAULT_WEIGHTS)
+        self.max_candidates = max_candidates
+        # Per thread: one summarizer serves concurrent documents
+        self._local = threading.local()
+
+    @property
+    def last_stats(self) -> Optional[Dict[str, Any]]:
+        """Stats of the last summarize() call made by the current thread"""
+        return getattr(self._local, "stats", None)
+
+    @last_stats.setter
+    def last_stats(self, stats: Optional[Dict[str, Any]]) -> None:
+        self._local.stats = stats
+
+    def _similarity(self, texts: List[str]) -> Tuple[Any, str]:
+        """
+        Pairwise similarity of the candidates (clipped at 0, zero diagonal)
+        and the method used; a numpy array when numpy is available, else
+        nested lists
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+
+        if np is None:
+            return _similarity_matrix_python(_tfidf_vectors(texts)), "tfidf"
+
+        if self.embeddings is not None:
+            vectors = np.asarray(self.embeddings.embed_documents(texts), dtype=np.float32)
+            method = "embeddings"
+        else:
+            sparse = _tfidf_vectors(texts)
+            vocabulary = {w: i for i, w in enumerate(sorted({w for v in sparse for w in v}))}
+            vectors = np.zeros((len(texts), max(1, len(vocabulary))), dtype=np.float32)
+            for row, vector in enumerate(sparse):
+                for word, value in vector.items():
+                    vectors[row, vocabulary[word]] = value
+            method = "tfidf"
+
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = vectors / np.where(norms == 0, 1, norms)
+        matrix = np.clip(vectors @ vectors.T, 0.0, None)
+        np.fill_diagonal(matrix, 0.0)
+        return matrix, method
+
+    @staticmethod
+    def _textrank(matrix: Any) -> List[float]:
+        if isinstance(matrix, list):
+            return textrank(matrix)
+
+        import numpy as np
+        size = matrix.shape[0]
+        if size == 0:
+            return []
+        out_weight = matrix.sum(axis=1)
+        transition = matrix / np.where(out_weight == 0, 1, out_weight)[:, None]
+        ranks = np.full(size, 1.0 / size)
+        for _ in range(TEXTRANK_ITERATIONS):
+            ranks = (1 - TEXTRANK_DAMPING) / size + TEXTRANK_DAMPING * (transition.T @ ranks)
+        return ranks.tolist()
+
+    def summarize(self, text: str, max_words: int = 2000) -> str:
+        """
+        Extract the best sentences of text within max_words words
+
+        Returns:
+            Selected sentences in document order, one per line
+        """
+        started = time.perf_counter()
+        sentences = split_sentences(text)
+        word_counts = [len(s["text"].split()) for s in sentences]
+
+        raw_scores = [lexical_scores(s["text"]) for s in sentences]
+        obligation = _normalize([r["obligation"] for r in raw_scores])
+        numeric = _normalize([r["numeric"] for r in raw_scores])
+        lexical_score = [
+            self.weights["obligation"] * o + self.weights["numeric"] * n
+            for o, n in zip(obligation, numeric)
+        ]
+
+        # Only the lexically strongest sentences enter the similarity graph
+        candidates = sorted(
+            range(len(sentences)), key=lambda i: lexical_score[i], reverse=True
+        )[:self.max_candidates]
+        candidates.sort()
+
+        matrix, method = self._similarity([sentences[i]["text"] for i in candidates])
+        centrality = _normalize(self._textrank(matrix))
+
+        scored = sorted(
+            (
+                (lexical_score[i] + self.weights["centrality"] * c, position, i)
+                for position, (i, c) in enumerate(zip(candidates, centrality))
+            ),
+            reverse=True
+        )
+
+        selected, selected_positions, used = [], [], 0
+        for score, position, i in scored:
+            if used + word_counts[i] > max_words:
+                continue
+            if any(matrix[position][p] >= DUPLICATE_SIMILARITY for p in selected_positions):
+                continue
+            selected.append(i)
+            selected_positions.append(position)
+            used += word_counts[i]
+            if used >= max_words:
+                break
+
+        summary = "\n".join(" ".join(sentences[i]["text"].split()) for i in sorted(selected))
+        self.last_stats = {
+            "mode": "extractive",
+            "sentences": len(sentences),
+            "candidates": len(candidates),
+            "selected": len(selected),
+            "centrality": method,
+            "total_seconds": round(time.perf_counter() - started, 3)
+        }
+        return summary
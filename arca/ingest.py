@@ -8,9 +8,14 @@ TSD Requirements:
 - Overlap: 50 tokens
 - Model: all-MiniLM-L6-v2
 - Storage: FAISS vectorstore
+
+Optional stage (--obligations or ARCA_INGEST_OBLIGATIONS=1):
+- Extract structured obligation records per chunk into
+  vectorstore/obligations.json (see agents/obligation_records.py)
 """
 
 import os
+import sys
 from langchain_community.document_loaders import TextLoader
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_community.vectorstores import FAISS
@@ -19,6 +24,7 @@ from langchain_huggingface import HuggingFaceEmbeddings
 # Configuration (TSD Section 1.2)
 POLICIES_DIR = "./data/policies"
 VECTOR_DIR = "./vectorstore"
+EXTRACT_OBLIGATIONS = os.getenv("ARCA_INGEST_OBLIGATIONS", "0") != "0"
 
 def load_documents():
     """
@@ -97,6 +103,19 @@ def embed_and_store(chunks):
     print(f"   Location: {VECTOR_DIR}")
     print(f"   Total vectors: {vectorstore.index.ntotal}")
 
+    return vectorstore
+
+def extract_obligations(chunks):
+    """
+    Optional: precompute obligation records for every chunk
+
+    Runs after the index is saved, so the records are stamped with the
+    fingerprint of the index they belong to.
+    """
+    from agents.obligation_records import build_obligation_store
+
+    build_obligation_store([chunk.page_content for chunk in chunks], VECTOR_DIR)
+
 if __name__ == "__main__":
     print("=" * 60)
     print("🚀 ARCA PHASE 1: DATA INGESTION")
@@ -113,6 +132,10 @@ if __name__ == "__main__":
         # Step 3: Embed and store
         embed_and_store(chunks)
         
+        # Step 4 (optional): Structured obligations
+        if EXTRACT_OBLIGATIONS or "--obligations" in sys.argv:
+            extract_obligations(chunks)
+
         print("\n" + "=" * 60)
         print("✅ INGESTION COMPLETE")
         print("=" * 60)
@@ -0,0 +1,574 @@
+# job_queue.py
+"""
+ARCA System: Persistent Analysis Job Queue
+
+Analyses take 10-45 seconds, longer than load balancer and browser timeouts
+for a synchronous POST. The API accepts them as jobs instead: the request
+returns a job id at once, workers run the pipeline in the background and
+clients poll the job for progress and fetch the report when it is done.
+
+Storage: one SQLite table (same connection pattern as disk_cache.SQLiteCache)
+- status: queued → running → succeeded | failed
+- params (JSON) and payload (uploaded file bytes, dropped on completion)
+- progress (JSON): current stage and per-stage status/timings, fed by the
+  pipeline's on_event callback
+- result (JSON report) or error
+
+Reliability:
+- Restarts: jobs live in the database, so queued jobs survive a restart.
+  A claimed job holds a lease (ARCA_JOB_LEASE_SECONDS) renewed by a
+  heartbeat while it runs; a job whose worker died (crash, kill -9) is
+  claimed again once its lease expires. Progress, completion and failure
+  are only recorded by the worker still holding the lease; a worker that
+  lost it abandons the attempt. A graceful shutdown releases its running
+  jobs immediately, without counting the attempt.
+- Retries: a failed attempt is re-queued with exponential backoff
+  (ARCA_JOB_RETRY_BACKOFF x 2^(attempt-1)) until ARCA_JOB_MAX_ATTEMPTS;
+  invalid input (ValueError) fails at once.
+- Retention: finished jobs older than ARCA_JOB_RETENTION_HOURS are purged.
+
+Workers (JobWorkerPool): asyncio tasks on the API's event loop, each running
+one analysis at a time through the async pipeline; the blocking work already
+runs on the pipeline executor, so ARCA_JOB_WORKERS bounds concurrent analyses.
+The queue's own database calls (claims every JOB_POLL_SECONDS, heartbeats,
+progress writes) run on a small thread pool of the queue (JobQueue.call),
+so they neither wait behind analyses nor show up in the executor's metrics.
+Several API processes may share one database: claims are conditional
+updates, so a job is only ever held by one worker.
+
+Dependencies: sqlite3 (standard library)
+"""
+
+import os
+import json
+import time
+import uuid
+import socket
+import sqlite3
+import asyncio
+import threading
+import functools
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Callable, Awaitable
+
+# Default location: arca/jobs/jobs.sqlite
+JOBS_DB_PATH = os.getenv("ARCA_JOBS_DB_PATH", str(Path(__file__).parent / "jobs" / "jobs.sqlite"))
+# Concurrent analyses per API process
+JOB_WORKERS = int(os.getenv("ARCA_JOB_WORKERS", "2"))
+JOB_MAX_ATTEMPTS = int(os.getenv("ARCA_JOB_MAX_ATTEMPTS", "3"))
+# A running job is re-claimed when its worker misses heartbeats this long
+JOB_LEASE_SECONDS = float(os.getenv("ARCA_JOB_LEASE_SECONDS", "120"))
+# Delay before the first retry (doubled for each further attempt)
+JOB_RETRY_BACKOFF = float(os.getenv("ARCA_JOB_RETRY_BACKOFF", "5"))
+JOB_RETENTION_HOURS = float(os.getenv("ARCA_JOB_RETENTION_HOURS", "168"))
+# Idle workers check for new jobs this often
+JOB_POLL_SECONDS = 1.0
+# Threads for the queue's database calls (claims, heartbeats, progress, lookups)
+JOB_IO_THREADS = 4
+
+JOB_STATUSES = ["queued", "running", "succeeded", "failed"]
+FINISHED_STATUSES = ("succeeded", "failed")
+
+
+def _initial_progress(stages: List[str]) -> Dict[str, Any]:
+    return {
+        "stage": None,
+        "stages": {stage: {"status": "pending"} for stage in stages}
+    }
+
+
+class JobQueue:
+    """
+    Thread-safe persistent job queue backed by a single SQLite table
+    """
+
+    def __init__(
+        self,
+        db_path: str = JOBS_DB_PATH,
+        max_attempts: int = JOB_MAX_ATTEMPTS,
+        lease_seconds: float = JOB_LEASE_SECONDS,
+        retry_backoff: float = JOB_RETRY_BACKOFF
+    ):
+        """
+        Args:
+            db_path: SQLite file path (parent directory is created)
+            max_attempts: Attempts per job before it is marked failed
+            lease_seconds: Time a running job is reserved without a heartbeat
+            retry_backoff: Delay before the first retry, in seconds
+        """
+        self.db_path = db_path
+        self.max_attempts = max_attempts
+        self.lease_seconds = lease_seconds
+        self.retry_backoff = retry_backoff
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        # Off the pipeline executor (see module docstring)
+        self._executor = ThreadPoolExecutor(max_workers=JOB_IO_THREADS, thread_name_prefix="arca-jobs")
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    params TEXT NOT NULL,
+                    payload BLOB,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    max_attempts INTEGER NOT NULL,
+                    progress TEXT NOT NULL,
+                    result TEXT,
+                    error TEXT,
+                    worker TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    started_at REAL,
+                    finished_at REAL,
+                    available_at REAL NOT NULL,
+                    lease_until REAL
+                )"""
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status, available_at)"
+            )
+
+    async def call(self, method: Callable[..., Any], *args: Any) -> Any:
+        """
+        Await one of this queue's blocking methods, run on the queue's threads
+
+        Usage: job = await queue.call(queue.get, job_id)
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(method, *args))
+
+    def submit(
+        self,
+        kind: str,
+        params: Dict[str, Any],
+        payload: Optional[bytes] = None,
+        stages: Optional[List[str]] = None
+    ) -> str:
+        """
+        Queue a job
+
+        Args:
+            kind: Job type understood by the worker handler (e.g. "text", "file")
+            params: JSON-serializable handler arguments
+            payload: Optional binary input (uploaded file)
+            stages: Stage names reported in the job's progress
+
+        Returns:
+            Job id
+        """
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                """INSERT INTO jobs
+                    (id, kind, params, payload, status, max_attempts, progress,
+                     created_at, updated_at, available_at)
+                    VALUES (?, ?, ?, ?, 'queued', ?, ?, ?, ?, ?)""",
+                (
+                    job_id, kind, json.dumps(params, ensure_ascii=False), payload,
+                    self.max_attempts, json.dumps(_initial_progress(stages or [])),
+                    now, now, now
+                )
+            )
+        return job_id
+
+    def claim(self, worker: str) -> Optional[Dict[str, Any]]:
+        """
+        Reserve the oldest runnable job: queued and due, or running with an
+        expired lease (its worker is gone)
+
+        Returns:
+            Job dict including params and payload, or None if nothing is runnable
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            # Abandoned jobs that already used their last attempt
+            self._conn.execute(
+                """UPDATE jobs SET status = 'failed', finished_at = ?, updated_at = ?,
+                       payload = NULL, lease_until = NULL,
+                       error = 'Worker lost during the last attempt'
+                   WHERE status = 'running' AND lease_until < ? AND attempts >= max_attempts""",
+                (now, now, now)
+            )
+            row = self._conn.execute(
+                """SELECT id, status, lease_until FROM jobs
+                   WHERE (status = 'queued' AND available_at <= ?)
+                      OR (status = 'running' AND lease_until < ?)
+                   ORDER BY created_at ASC LIMIT 1""",
+                (now, now)
+            ).fetchone()
+            if row is None:
+                return None
+
+            # Conditional update: another process may have claimed it meanwhile
+            cursor = self._conn.execute(
+                """UPDATE jobs SET status = 'running', attempts = attempts + 1, worker = ?,
+                       lease_until = ?, updated_at = ?, started_at = COALESCE(started_at, ?)
+                   WHERE id = ? AND status = ? AND lease_until IS ?""",
+                (worker, now + self.lease_seconds, now, now, row["id"], row["status"], row["lease_until"])
+            )
+            if cursor.rowcount != 1:
+                return None
+
+            job = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (row["id"],)).fetchone()
+        return self._to_dict(job, internal=True)
+
+    def heartbeat(self, job_id: str, worker: str) -> bool:
+        """
+        Extend the lease of a running job
+
+        Returns:
+            False if the job is no longer held by this worker
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                """UPDATE jobs SET lease_until = ?, updated_at = ?
+                   WHERE id = ? AND worker = ? AND status = 'running'""",
+                (now + self.lease_seconds, now, job_id, worker)
+            )
+        return cursor.rowcount == 1
+
+    def update_progress(
+        self,
+        job_id: str,
+        worker: str,
+        event: Dict[str, Any],
+        at: Optional[float] = None
+    ) -> None:
+        """
+        Apply a pipeline stage event (stage_start / stage_end) to the job's
+        progress (ignored unless worker holds the job)
+
+        Args:
+            at: When the event happened (default: now)
+        """
+        stage = event.get("stage")
+        if event.get("event") not in ("stage_start", "stage_end") or not stage:
+            return
+
+        now = at if at is not None else time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT progress FROM jobs WHERE id = ? AND worker = ? AND status = 'running'",
+                (job_id, worker)
+            ).fetchone()
+            if row is None:
+                return
+
+            progress = json.loads(row["progress"])
+            entry = progress["stages"].setdefault(stage, {"status": "pending"})
+            details = {k: v for k, v in event.items() if k not in ("event", "stage")}
+            if event["event"] == "stage_start":
+                progress["stage"] = stage
+                entry.update(status="running", started_at=now, **details)
+                entry.pop("finished_at", None)
+                entry.pop("seconds", None)
+            else:
+                entry.update(status="done", finished_at=now, **details)
+                if "started_at" in entry:
+                    entry["seconds"] = round(now - entry["started_at"], 3)
+
+            self._conn.execute(
+                "UPDATE jobs SET progress = ?, updated_at = ? WHERE id = ?",
+                (json.dumps(progress, ensure_ascii=False, default=str), now, job_id)
+            )
+
+    def complete(self, job_id: str, worker: str, result: Any) -> bool:
+        """
+        Store the result and mark the job succeeded (the payload is dropped)
+
+        Returns:
+            False if worker no longer holds the job (nothing is written)
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                """UPDATE jobs SET status = 'succeeded', result = ?, error = NULL,
+                       payload = NULL, lease_until = NULL, finished_at = ?, updated_at = ?
+                   WHERE id = ? AND worker = ? AND status = 'running'""",
+                (json.dumps(result, ensure_ascii=False, default=str), now, now, job_id, worker)
+            )
+        return cursor.rowcount == 1
+
+    def fail(self, job_id: str, worker: str, error: str, retryable: bool = True) -> Optional[str]:
+        """
+        Record a failed attempt: re-queue with backoff, or mark the job failed
+        when it is not retryable or out of attempts
+
+        Returns:
+            The job's new status ("queued" or "failed"), or None if worker no
+            longer holds the job (nothing is written)
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                """SELECT attempts, max_attempts, progress FROM jobs
+                   WHERE id = ? AND worker = ? AND status = 'running'""",
+                (job_id, worker)
+            ).fetchone()
+            if row is None:
+                return None
+
+            if retryable and row["attempts"] < row["max_attempts"]:
+                delay = self.retry_backoff * (2 ** (row["attempts"] - 1))
+                # The retry re-runs every stage
+                stages = list(json.loads(row["progress"])["stages"])
+                self._conn.execute(
+                    """UPDATE jobs SET status = 'queued', error = ?, worker = NULL,
+                           lease_until = NULL, available_at = ?, progress = ?, updated_at = ?
+                       WHERE id = ? AND worker = ? AND status = 'running'""",
+                    (error, now + delay, json.dumps(_initial_progress(stages)), now, job_id, worker)
+                )
+                return "queued"
+
+            self._conn.execute(
+                """UPDATE jobs SET status = 'failed', error = ?, payload = NULL,
+                       lease_until = NULL, finished_at = ?, updated_at = ?
+                   WHERE id = ? AND worker = ? AND status = 'running'""",
+                (error, now, now, job_id, worker)
+            )
+            return "failed"
+
+    def release(self, job_id: str, worker: str) -> None:
+        """Put a running job back in the queue without counting the attempt (shutdown)"""
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT progress FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None:
+                return
+            stages = list(json.loads(row["progress"])["stages"])
+            self._conn.execute(
+                """UPDATE jobs SET status = 'queued', attempts = MAX(attempts - 1, 0),
+                       worker = NULL, lease_until = NULL, available_at = ?, progress = ?,
+                       updated_at = ?
+                   WHERE id = ? AND worker = ? AND status = 'running'""",
+                (now, json.dumps(_initial_progress(stages)), now, job_id, worker)
+            )
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Public view of a job (without params, payload or result), None if unknown
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_dict(row) if row is not None else None
+
+    def get_result(self, job_id: str) -> Optional[Any]:
+        """The stored result of a succeeded job, else None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result FROM jobs WHERE id = ? AND status = 'succeeded'", (job_id,)
+            ).fetchone()
+        return json.loads(row["result"]) if row is not None and row["result"] is not None else None
+
+    def purge(self, older_than_seconds: float = JOB_RETENTION_HOURS * 3600) -> int:
+        """
+        Delete finished jobs older than the retention period
+
+        Returns:
+            Number of jobs deleted
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND finished_at < ?",
+                (*FINISHED_STATUSES, time.time() - older_than_seconds)
+            )
+        return max(cursor.rowcount, 0)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Job counts by status and age of the oldest queued job
+        """
+        now = time.time()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) AS n, MIN(created_at) AS oldest FROM jobs GROUP BY status"
+            ).fetchall()
+
+        counts = {status: 0 for status in JOB_STATUSES}
+        oldest_queued = None
+        for row in rows:
+            counts[row["status"]] = row["n"]
+            if row["status"] == "queued":
+                oldest_queued = round(now - row["oldest"], 1)
+        return {
+            **counts,
+            "oldest_queued_seconds": oldest_queued,
+            "db_path": self.db_path
+        }
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row, internal: bool = False) -> Dict[str, Any]:
+        job = {
+            "job_id": row["id"],
+            "kind": row["kind"],
+            "status": row["status"],
+            "attempts": row["attempts"],
+            "max_attempts": row["max_attempts"],
+            "progress": json.loads(row["progress"]),
+            "error": row["error"],
+            "created_at": row["created_at"],
+            "started_at": row["started_at"],
+            "finished_at": row["finished_at"],
+            "next_attempt_at": row["available_at"] if row["status"] == "queued" and row["attempts"] else None
+        }
+        if internal:
+            job["params"] = json.loads(row["params"])
+            job["payload"] = row["payload"]
+        return job
+
+
+# Worker handler: runs one job, reporting progress through the callback
+JobHandler = Callable[[Dict[str, Any], Callable[[Dict[str, Any]], None]], Awaitable[Any]]
+
+
+class JobWorkerPool:
+    """
+    asyncio workers claiming jobs from a JobQueue and running them with a handler
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        handler: JobHandler,
+        workers: int = JOB_WORKERS,
+        poll_interval: float = JOB_POLL_SECONDS
+    ):
+        """
+        Args:
+            queue: Job queue to drain
+            handler: async handler(job, on_event) returning the job result;
+                     a ValueError fails the job without retry
+            workers: Concurrent jobs
+            poll_interval: Idle wait between claims, in seconds
+        """
+        self.queue = queue
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.poll_interval = poll_interval
+        self.worker_prefix = f"{socket.gethostname()}:{os.getpid()}"
+        self._tasks: List[asyncio.Task] = []
+        self._stopping = False
+
+    def start(self) -> None:
+        """Start the worker tasks on the running event loop"""
+        if self._tasks:
+            return
+        # Clear out jobs finished long ago
+        self.queue.purge()
+        self._tasks = [
+            asyncio.create_task(self._work(f"{self.worker_prefix}:{i}"))
+            for i in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        """Cancel the workers; their running jobs are released back to the queue"""
+        self._stopping = True
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._stopping = False
+
+    async def _work(self, worker: str) -> None:
+        while True:
+            try:
+                job = await self.queue.call(self.queue.claim, worker)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️  Job claim failed: {e}")
+                job = None
+
+            if job is None:
+                await asyncio.sleep(self.poll_interval)
+                continue
+            await self._run(job, worker)
+
+    async def _write_progress(self, job_id: str, worker: str, events: asyncio.Queue) -> None:
+        """Apply progress events in arrival order, on the queue's threads (None ends)"""
+        while True:
+            queued = await events.get()
+            if queued is None:
+                return
+            at, event = queued
+            try:
+                await self.queue.call(self.queue.update_progress, job_id, worker, event, at)
+            except Exception as e:
+                print(f"⚠️  Job {job_id} progress update failed: {e}")
+
+    async def _heartbeat(self, job_id: str, worker: str, work: asyncio.Task, lease_lost: asyncio.Event) -> None:
+        """Renew the lease; once it is lost (another worker took the job), cancel the attempt"""
+        while True:
+            await asyncio.sleep(self.queue.lease_seconds / 3)
+            try:
+                held = await self.queue.call(self.queue.heartbeat, job_id, worker)
+            except Exception as e:
+                print(f"⚠️  Job {job_id} heartbeat failed: {e}")
+                continue
+            if not held:
+                lease_lost.set()
+                work.cancel()
+                return
+
+    async def _run(self, job: Dict[str, Any], worker: str) -> None:
+        job_id = job["job_id"]
+        print(f"📥 Job {job_id} started ({job['kind']}, attempt {job['attempts']}/{job['max_attempts']})")
+
+        loop = asyncio.get_running_loop()
+        events: asyncio.Queue = asyncio.Queue()
+
+        def on_event(event: Dict[str, Any]) -> None:
+            # Pipeline callbacks must not block: the SQLite write is queued
+            # for _write_progress instead of done here
+            if event.get("event") in ("stage_start", "stage_end"):
+                loop.call_soon_threadsafe(events.put_nowait, (time.time(), event))
+
+        writer = asyncio.create_task(self._write_progress(job_id, worker, events))
+        work = asyncio.create_task(self.handler(job, on_event))
+        lease_lost = asyncio.Event()
+        heartbeat = asyncio.create_task(self._heartbeat(job_id, worker, work, lease_lost))
+        try:
+            try:
+                result = await work
+            finally:
+                heartbeat.cancel()
+                # Flush the progress of this attempt before recording its outcome
+                events.put_nowait(None)
+                await writer
+        except asyncio.CancelledError:
+            if lease_lost.is_set() and not self._stopping:
+                # Another worker holds the job now: leave it alone
+                print(f"⚠️  Job {job_id} lease lost, attempt abandoned")
+                return
+            await self.queue.call(self.queue.release, job_id, worker)
+            print(f"↩️  Job {job_id} released")
+            raise
+        except Exception as e:
+            retryable = not isinstance(e, ValueError)
+            new_status = await self.queue.call(
+                self.queue.fail, job_id, worker, f"{type(e).__name__}: {e}", retryable
+            )
+            if new_status is None:
+                print(f"⚠️  Job {job_id} lease lost, failure of this attempt discarded: {e}")
+            else:
+                print(f"❌ Job {job_id} failed: {e} ({'retry queued' if new_status == 'queued' else 'giving up'})")
+        else:
+            if await self.queue.call(self.queue.complete, job_id, worker, result):
+                print(f"✅ Job {job_id} succeeded")
+            else:
+                print(f"⚠️  Job {job_id} lease lost, result of this attempt discarded")
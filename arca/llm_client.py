@@ -0,0 +1,703 @@
+# llm_client.py
+"""
+ARCA System: Shared LLM Client
+
+Every LLM caller (Compliance Auditor, Document Processor) goes through
+one rate-limited client per model, so the whole process stays under the
+provider quota instead of tripping 429s and degrading into fallback results.
+
+Features:
+1. Token buckets for requests/min and tokens/min (shared per model)
+2. Jittered exponential backoff on retryable errors (quota, 5xx, timeouts)
+3. Per-call deadlines covering queueing, attempts and backoff (the time left
+   is the backend request timeout, so attempts do not outlive the call)
+4. Hedged requests: when an attempt is slower than the model's recent p95
+   latency and the quota has headroom, a duplicate is sent and the first
+   valid answer wins (the hedge's request timeout is the hedge delay, so a
+   losing hedge stops early)
+5. Pluggable backends:
+   - gemini: Google Gemini via LangChain (default)
+   - openai: Any OpenAI-compatible /chat/completions server (vLLM, Ollama,
+             llama.cpp, or stub_llm_server.py)
+   - stub: In-process deterministic stand-in (stub_llm_server.StubResponder)
+
+Configuration (environment):
+- ARCA_LLM_BACKEND: gemini | openai | stub (default: gemini)
+- ARCA_LLM_BASE_URL: Base URL for the openai backend (default: http://localhost:8001/v1)
+- ARCA_LLM_API_KEY: Bearer token for the openai backend (optional)
+- ARCA_LLM_RPM: Requests per minute per model (default: 10)
+- ARCA_LLM_TPM: Tokens per minute per model (default: 250000)
+- ARCA_LLM_MAX_RETRIES: Retries after the first attempt (default: 5)
+- ARCA_LLM_TIMEOUT: Per-call deadline in seconds (default: 120)
+- ARCA_LLM_HEDGE: Enable hedged requests (default: 1)
+- ARCA_LLM_HEDGE_PERCENTILE: Latency percentile that triggers the hedge (default: 95)
+- ARCA_LLM_HEDGE_MIN_SAMPLES: Successful calls observed before hedging starts (default: 20)
+- ARCA_LLM_HEDGE_MIN_DELAY: Lower bound for the hedge delay in seconds (default: 1.0)
+- ARCA_LLM_HEDGE_MIN_HEADROOM: Share of the per-minute quota that must be free
+  for a hedge to be sent (default: 0.5)
+
+Dependencies: dotenv, langchain_google_genai (gemini backend only)
+"""
+
+import os
+import re
+import json
+import time
+import random
+import threading
+import urllib.request
+import urllib.error
+from collections import deque
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    TimeoutError as FutureTimeoutError,
+    wait,
+    FIRST_COMPLETED
+)
+from typing import Dict, Any, Optional, Callable
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DEFAULT_BACKEND = os.getenv("ARCA_LLM_BACKEND", "gemini")
+OPENAI_BASE_URL = os.getenv("ARCA_LLM_BASE_URL", "http://localhost:8001/v1")
+OPENAI_API_KEY = os.getenv("ARCA_LLM_API_KEY", "")
+
+DEFAULT_RPM = float(os.getenv("ARCA_LLM_RPM", "10"))
+DEFAULT_TPM = float(os.getenv("ARCA_LLM_TPM", "250000"))
+DEFAULT_MAX_RETRIES = int(os.getenv("ARCA_LLM_MAX_RETRIES", "5"))
+DEFAULT_TIMEOUT = float(os.getenv("ARCA_LLM_TIMEOUT", "120"))
+
+HEDGE_ENABLED = os.getenv("ARCA_LLM_HEDGE", "1") != "0"
+HEDGE_PERCENTILE = float(os.getenv("ARCA_LLM_HEDGE_PERCENTILE", "95"))
+HEDGE_MIN_SAMPLES = int(os.getenv("ARCA_LLM_HEDGE_MIN_SAMPLES", "20"))
+HEDGE_MIN_DELAY = float(os.getenv("ARCA_LLM_HEDGE_MIN_DELAY", "1.0"))
+HEDGE_MIN_HEADROOM = float(os.getenv("ARCA_LLM_HEDGE_MIN_HEADROOM", "0.5"))
+
+# Recent successful call latencies kept per client
+LATENCY_WINDOW = 200
+
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 30.0
+
+# Rough token estimate (Gemini averages ~4 chars/token)
+CHARS_PER_TOKEN = 4
+
+# Error fragments that indicate a transient failure worth retrying
+RETRYABLE_ERROR_NAMES = (
+    "ResourceExhausted",
+    "TooManyRequests",
+    "ServiceUnavailable",
+    "InternalServerError",
+    "DeadlineExceeded",
+    "GatewayTimeout",
+    "Timeout",
+)
+# HTTP statuses worth retrying (rate limited, server-side errors)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+# A status code in an error message: leading ("429 Too Many Requests") or
+# after "status"/"code"/"HTTP" ("HTTP Error 503"), never any bare number
+# ("max_output_tokens must be <= 8192, got 15000" is not retryable)
+STATUS_IN_MESSAGE_RE = re.compile(
+    r"(?:^\s*|\b(?:http|status|code)\b[^0-9\n]{0,12})\b(429|500|502|503|504)\b",
+    re.IGNORECASE
+)
+RETRYABLE_ERROR_MESSAGES = (
+    "quota",
+    "rate limit",
+    "resource exhausted",
+    "temporarily unavailable",
+    "timed out",
+    "deadline",
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of a prompt or response"""
+    return max(1, len(text) // CHARS_PER_TOKEN) if text else 0
+
+
+class LLMTimeoutError(TimeoutError):
+    """Raised when a call cannot complete within its deadline"""
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket
+
+    capacity tokens are available in a burst; the bucket refills
+    continuously at refill_per_second.
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self._cond = threading.Condition()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self.updated_at
+        self.updated_at = now
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_per_second)
+
+    def acquire(self, amount: float, deadline: Optional[float] = None) -> float:
+        """
+        Block until amount tokens are available, then take them
+
+        Requests larger than the capacity wait for a full bucket instead of
+        blocking forever.
+
+        Args:
+            amount: Tokens to take
+            deadline: time.monotonic() value after which to give up
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            LLMTimeoutError: If the deadline passes first
+        """
+        amount = min(float(amount), self.capacity)
+        started = time.monotonic()
+
+        with self._cond:
+            while True:
+                self._refill()
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return time.monotonic() - started
+
+                wait = (amount - self.tokens) / self.refill_per_second
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or wait > remaining:
+                        raise LLMTimeoutError("Rate limiter wait exceeds call deadline")
+                self._cond.wait(timeout=wait)
+
+    def refund(self, amount: float) -> None:
+        """Return tokens taken by acquire() for work that did not happen"""
+        with self._cond:
+            self._refill()
+            self.tokens = min(self.capacity, self.tokens + min(float(amount), self.capacity))
+            self._cond.notify_all()
+
+    def available(self) -> float:
+        """Tokens that could be taken right now"""
+        with self._cond:
+            self._refill()
+            return max(0.0, self.tokens)
+
+    def debit(self, amount: float) -> None:
+        """Take tokens without waiting (the balance may go negative)"""
+        with self._cond:
+            self._refill()
+            self.tokens -= float(amount)
+
+
+class RateLimiter:
+    """
+    Requests/min + tokens/min limits for one model
+    """
+
+    def __init__(self, rpm: float = DEFAULT_RPM, tpm: float = DEFAULT_TPM):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.requests = TokenBucket(capacity=rpm, refill_per_second=rpm / 60.0)
+        self.tokens = TokenBucket(capacity=tpm, refill_per_second=tpm / 60.0)
+
+    def acquire(self, prompt_tokens: int, deadline: Optional[float] = None) -> float:
+        """
+        Wait for one request slot and the prompt's token budget
+
+        The request slot is refunded when the token budget is not available
+        before the deadline, so refused calls do not consume RPM capacity.
+        """
+        waited = self.requests.acquire(1, deadline)
+        try:
+            waited += self.tokens.acquire(prompt_tokens, deadline)
+        except LLMTimeoutError:
+            self.requests.refund(1)
+            raise
+        return waited
+
+    def headroom(self) -> float:
+        """Free share of the tighter of the two quotas (0 = exhausted, 1 = idle)"""
+        return min(
+            self.requests.available() / self.requests.capacity,
+            self.tokens.available() / self.tokens.capacity
+        )
+
+    def record_completion(self, completion_tokens: int) -> None:
+        """Charge output tokens once they are known"""
+        self.tokens.debit(completion_tokens)
+
+
+class LatencyTracker:
+    """
+    Rolling window of successful call latencies
+    """
+
+    def __init__(self, window: int = LATENCY_WINDOW, min_samples: int = HEDGE_MIN_SAMPLES):
+        self.samples = deque(maxlen=window)
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self.samples.append(seconds)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Latency at the given percentile (None until min_samples calls were seen)"""
+        with self._lock:
+            if len(self.samples) < self.min_samples:
+                return None
+            ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+        return ordered[index]
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    """HTTP status carried by an exception or its response, if any"""
+    for holder in (error, getattr(error, "response", None)):
+        for attr in ("status_code", "code", "status"):
+            value = getattr(holder, attr, None)
+            if isinstance(value, int) and not isinstance(value, bool):
+                return value
+    return None
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """True for quota, server-side and timeout errors"""
+    if isinstance(error, (TimeoutError, FutureTimeoutError, ConnectionError)):
+        return True
+    if _status_code(error) in RETRYABLE_STATUS_CODES:
+        return True
+    name = type(error).__name__
+    if any(fragment in name for fragment in RETRYABLE_ERROR_NAMES):
+        return True
+    message = str(error)
+    if STATUS_IN_MESSAGE_RE.search(message):
+        return True
+    message = message.lower()
+    return any(fragment in message for fragment in RETRYABLE_ERROR_MESSAGES)
+
+
+# ─────────────────────────────────────────────────────────
+# BACKENDS
+# ─────────────────────────────────────────────────────────
+
+class LLMBackendError(Exception):
+    """Non-2xx response from an HTTP backend (message starts with the status code)"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class GeminiBackend:
+    """Google Gemini through LangChain"""
+
+    name = "gemini"
+
+    def __init__(self, model: str, temperature: float, timeout: float):
+        from langchain_google_genai import GoogleGenerativeAI
+
+        # Retries are handled by RateLimitedLLM, not inside the Google client
+        self.client = GoogleGenerativeAI(
+            model=model,
+            temperature=temperature,
+            google_api_key=os.getenv("GOOGLE_API_KEY"),
+            max_retries=1,
+            timeout=timeout
+        )
+
+    def invoke(self, prompt: str, timeout: Optional[float] = None) -> str:
+        # The LangChain client has no per-call timeout: attempts are bounded
+        # by the client timeout (ARCA_LLM_TIMEOUT) instead of the call deadline
+        return self.client.invoke(prompt)
+
+
+class OpenAICompatibleBackend:
+    """Any server implementing POST {base_url}/chat/completions"""
+
+    name = "openai"
+
+    def __init__(
+        self,
+        model: str,
+        temperature: float,
+        timeout: float,
+        base_url: str = OPENAI_BASE_URL,
+        api_key: str = OPENAI_API_KEY
+    ):
+        self.model = model
+        self.temperature = temperature
+        self.timeout = timeout
+        self.url = base_url.rstrip("/") + "/chat/completions"
+        self.api_key = api_key
+
+    def invoke(self, prompt: str, timeout: Optional[float] = None) -> str:
+        """
+        Args:
+            prompt: Prompt text
+            timeout: Socket timeout for this request (default: client timeout)
+        """
+        payload = json.dumps({
+            "model": self.model,
+            "temperature": self.temperature,
+            "messages": [{"role": "user", "content": prompt}]
+        }).encode("utf-8")
+
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+
+        request = urllib.request.Request(self.url, data=payload, headers=headers, method="POST")
+        try:
+            with urllib.request.urlopen(request, timeout=timeout or self.timeout) as response:
+                body = json.loads(response.read().decode("utf-8"))
+        except urllib.error.HTTPError as e:
+            raise LLMBackendError(f"{e.code} {e.reason} from {self.url}", status_code=e.code) from e
+        except urllib.error.URLError as e:
+            raise ConnectionError(f"Cannot reach LLM server at {self.url}: {e.reason}") from e
+
+        try:
+            return body["choices"][0]["message"]["content"]
+        except (KeyError, IndexError, TypeError) as e:
+            raise LLMBackendError(f"Malformed completion response from {self.url}") from e
+
+
+class StubBackend:
+    """In-process deterministic stand-in (no network, no quota)"""
+
+    name = "stub"
+
+    def __init__(self, model: str, temperature: float, timeout: float):
+        from stub_llm_server import StubResponder
+        self.responder = StubResponder()
+
+    def invoke(self, prompt: str, timeout: Optional[float] = None) -> str:
+        return self.responder.complete(prompt)
+
+
+BACKENDS = {
+    GeminiBackend.name: GeminiBackend,
+    OpenAICompatibleBackend.name: OpenAICompatibleBackend,
+    StubBackend.name: StubBackend
+}
+
+
+def create_backend(name: str, model: str, temperature: float, timeout: float) -> Any:
+    """
+    Instantiate a backend by name
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown LLM backend '{name}' (expected one of: {', '.join(BACKENDS)})")
+    return BACKENDS[name](model=model, temperature=temperature, timeout=timeout)
+
+
+class RateLimitedLLM:
+    """
+    Drop-in replacement for GoogleGenerativeAI.invoke() with rate limiting,
+    retry/backoff and deadlines, on top of any backend
+    """
+
+    # Attempts run on worker threads so the caller can stop waiting at its
+    # deadline. A running attempt cannot be cancelled: it keeps its thread (and
+    # the request it already sent) until the backend returns, which is why each
+    # attempt gets the remaining deadline as its socket timeout. Attempts still
+    # running after the caller gave up are counted in stats() (abandoned_*).
+    _executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="arca-llm")
+
+    def __init__(
+        self,
+        model: str,
+        temperature: float,
+        limiter: RateLimiter,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        timeout: float = DEFAULT_TIMEOUT,
+        backend: str = DEFAULT_BACKEND,
+        hedge: bool = HEDGE_ENABLED
+    ):
+        self.model = model
+        self.temperature = temperature
+        self.limiter = limiter
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.backend = backend
+        self.hedge = hedge
+
+        self.client = create_backend(backend, model, temperature, timeout)
+        self.latency = LatencyTracker()
+
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "calls": 0,
+            "attempts": 0,
+            "retries": 0,
+            "failures": 0,
+            "hedges": 0,
+            "hedge_wins": 0,
+            "hedge_losses": 0,
+            "hedges_skipped": 0,
+            "abandoned_attempts": 0,
+            "abandoned_running": 0,
+            "throttle_wait_seconds": 0.0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0
+        }
+
+    def _record(self, **increments: float) -> None:
+        with self._stats_lock:
+            for key, value in increments.items():
+                self._stats[key] += value
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging an attempt (None = do not hedge)"""
+        if not self.hedge:
+            return None
+        observed = self.latency.percentile(HEDGE_PERCENTILE)
+        if observed is None:
+            return None
+        return max(HEDGE_MIN_DELAY, observed)
+
+    def latency_percentile(self, pct: float) -> Optional[float]:
+        """Recent latency at pct (None until enough calls were observed)"""
+        return self.latency.percentile(pct)
+
+    def _acquire_hedge_slot(self, prompt_tokens: int) -> bool:
+        """Take quota for a hedge only if the limiter has spare headroom right now"""
+        if self.limiter.headroom() < HEDGE_MIN_HEADROOM:
+            self._record(hedges_skipped=1)
+            return False
+        try:
+            self.limiter.acquire(prompt_tokens, deadline=time.monotonic())
+            return True
+        except LLMTimeoutError:
+            return False
+
+    def _submit(self, prompt: str, timeout: float):
+        """Run one backend request on the shared pool, bounded by timeout"""
+        return self._executor.submit(self.client.invoke, prompt, max(timeout, 0.001))
+
+    def _abandon(self, futures) -> None:
+        """Stop waiting for futures; count the ones that are already running"""
+        for future in futures:
+            if future.cancel() or future.done():
+                continue
+            self._record(abandoned_attempts=1, abandoned_running=1)
+            future.add_done_callback(lambda _: self._record(abandoned_running=-1))
+
+    def _attempt(
+        self,
+        prompt: str,
+        prompt_tokens: int,
+        deadline: float,
+        validator: Optional[Callable[[str], bool]]
+    ) -> str:
+        """
+        One attempt, hedged with a duplicate request after the p95 delay
+
+        The hedge's request timeout is the hedge delay: a hedge slower than
+        the p95 latency is no help and only holds a thread. Hedges that do not
+        provide the answer are counted as hedge_losses.
+
+        Returns the first response accepted by the validator. If every request
+        finishes without a valid answer, the last response is returned (the
+        caller's parser reports the problem); if all of them failed, the last
+        error is raised.
+        """
+        started = time.monotonic()
+        futures = {self._submit(prompt, deadline - started): ("primary", started)}
+        hedge_at = None
+        delay = self.hedge_delay()
+        if delay is not None:
+            hedge_at = started + delay
+
+        invalid_response = None
+        last_error = None
+        hedged = False
+
+        while futures:
+            now = time.monotonic()
+            remaining = deadline - now
+            if remaining <= 0:
+                self._abandon(futures)
+                if hedged:
+                    self._record(hedge_losses=1)
+                raise LLMTimeoutError(f"LLM call exceeded deadline ({self.model})")
+
+            wait_for = remaining if hedge_at is None else min(remaining, max(0.0, hedge_at - now))
+            done, _ = wait(list(futures), timeout=wait_for, return_when=FIRST_COMPLETED)
+
+            if not done:
+                if hedge_at is not None and time.monotonic() >= hedge_at:
+                    hedge_at = None
+                    if self._acquire_hedge_slot(prompt_tokens):
+                        hedged = True
+                        self._record(hedges=1, prompt_tokens=prompt_tokens)
+                        hedge_timeout = min(delay, deadline - time.monotonic())
+                        futures[self._submit(prompt, hedge_timeout)] = ("hedge", time.monotonic())
+                continue
+
+            for future in done:
+                kind, submitted = futures.pop(future)
+                try:
+                    response = future.result()
+                except Exception as e:
+                    last_error = e
+                    continue
+
+                if validator is not None:
+                    try:
+                        valid = bool(validator(response))
+                    except Exception:
+                        valid = False
+                    if not valid:
+                        invalid_response = response
+                        continue
+
+                self.latency.record(time.monotonic() - submitted)
+                if kind == "hedge":
+                    self._record(hedge_wins=1)
+                elif hedged:
+                    self._record(hedge_losses=1)
+                self._abandon(futures)
+                return response
+
+        if hedged:
+            self._record(hedge_losses=1)
+        if invalid_response is not None:
+            return invalid_response
+        raise last_error
+
+    def invoke(
+        self,
+        prompt: str,
+        timeout: Optional[float] = None,
+        validator: Optional[Callable[[str], bool]] = None
+    ) -> str:
+        """
+        Send a prompt and return the text response
+
+        Args:
+            prompt: Prompt text
+            timeout: Deadline in seconds for the whole call, including
+                     rate-limit waits and retries (default: client timeout)
+            validator: Optional check on the response text; with hedging,
+                       the first response it accepts wins
+
+        Raises:
+            LLMTimeoutError: If the deadline passes
+            Exception: The last error once retries are exhausted, or the
+                       first non-retryable error
+        """
+        deadline = time.monotonic() + (timeout if timeout is not None else self.timeout)
+        prompt_tokens = estimate_tokens(prompt)
+        self._record(calls=1)
+
+        attempt = 0
+        while True:
+            try:
+                waited = self.limiter.acquire(prompt_tokens, deadline)
+                self._record(attempts=1, throttle_wait_seconds=waited, prompt_tokens=prompt_tokens)
+
+                if deadline - time.monotonic() <= 0:
+                    raise LLMTimeoutError("LLM call deadline exceeded")
+
+                response = self._attempt(prompt, prompt_tokens, deadline, validator)
+
+                completion_tokens = estimate_tokens(response)
+                self.limiter.record_completion(completion_tokens)
+                self._record(completion_tokens=completion_tokens)
+                return response
+
+            except LLMTimeoutError:
+                # The deadline is absolute, a retry could not finish either
+                self._record(failures=1)
+                raise
+
+            except Exception as e:
+                retryable = is_retryable_error(e)
+                if not retryable or attempt >= self.max_retries:
+                    self._record(failures=1)
+                    raise
+
+                # Full jitter: sleep uniformly in [0, min(cap, base * 2^attempt)]
+                backoff = random.uniform(
+                    0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** attempt))
+                )
+                remaining = deadline - time.monotonic()
+                if backoff >= remaining:
+                    self._record(failures=1)
+                    raise LLMTimeoutError(
+                        f"LLM call deadline exceeded after {attempt + 1} attempts: {e}"
+                    )
+
+                attempt += 1
+                self._record(retries=1)
+                print(f"   ⏳ LLM retry {attempt}/{self.max_retries} in {backoff:.1f}s ({type(e).__name__})")
+                time.sleep(backoff)
+
+    def stats(self) -> Dict[str, Any]:
+        """Call, retry and throttling counters for this client"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["model"] = self.model
+        stats["temperature"] = self.temperature
+        stats["backend"] = self.backend
+        stats["hedge_delay_seconds"] = self.hedge_delay()
+        return stats
+
+
+# ─────────────────────────────────────────────────────────
+# SHARED REGISTRY
+# ─────────────────────────────────────────────────────────
+
+_registry_lock = threading.Lock()
+_limiters: Dict[str, RateLimiter] = {}
+_clients: Dict[tuple, RateLimitedLLM] = {}
+
+
+def get_rate_limiter(model: str) -> RateLimiter:
+    """Return the process-wide limiter for a model (quotas are per model)"""
+    with _registry_lock:
+        if model not in _limiters:
+            _limiters[model] = RateLimiter()
+        return _limiters[model]
+
+
+def get_llm(
+    model: str = "gemini-2.5-flash",
+    temperature: float = 0.0,
+    backend: Optional[str] = None
+) -> RateLimitedLLM:
+    """
+    Return the shared rate-limited client for (model, temperature, backend)
+
+    Clients with different temperatures still share the model's limiter.
+
+    Args:
+        model: Model name passed to the backend
+        temperature: Sampling temperature
+        backend: gemini | openai | stub (default: ARCA_LLM_BACKEND)
+    """
+    backend = backend or DEFAULT_BACKEND
+    limiter = get_rate_limiter(model)
+    key = (model, temperature, backend)
+    with _registry_lock:
+        if key not in _clients:
+            _clients[key] = RateLimitedLLM(model, temperature, limiter, backend=backend)
+        return _clients[key]
+
+
+def get_llm_stats() -> Dict[str, Any]:
+    """Stats for every client created in this process"""
+    with _registry_lock:
+        clients = list(_clients.values())
+    return {f"{c.backend}:{c.model}@{c.temperature}": c.stats() for c in clients}
@@ -0,0 +1,279 @@
+# pdf_backends.py
+"""
+ARCA System: PDF Text Extraction Backends
+
+Interchangeable page-text extractors behind one small interface, so
+DocumentProcessor can use whichever PDF library is installed locally:
+- pdfplumber: pdfminer layout analysis plus pdfplumber's character model
+  (the original extractor; slowest, most faithful on complex layouts)
+- pdfminer: pdfminer.six text-only mode (line/word grouping without the
+  box-ordering analysis, LAParams(boxes_flow=None))
+- pypdfium2: PDFium text layer (native, typically the fastest)
+
+Selection (ARCA_PDF_BACKEND):
+- a backend name forces that backend
+- auto (default): probe_backends() extracts the first ARCA_PDF_PROBE_PAGES
+  pages with every installed backend; select_backend() keeps the backends
+  whose text density (non-space characters and words per page) reaches
+  PROBE_MIN_DENSITY_RATIO of the densest one, and picks the fastest of them.
+  Documents without a text layer fall back to the first installed backend
+  in BACKEND_PREFERENCE.
+
+Every document handle accepts a path or in-memory bytes and is opened
+independently in each process-pool worker.
+
+Dependencies: at least one of pdfplumber, pdfminer.six, pypdfium2
+"""
+
+import io
+import os
+import time
+import importlib
+from typing import List, Dict, Any, Optional, Tuple, Union
+
+PDF_BACKEND = os.getenv("ARCA_PDF_BACKEND", "auto")
+# Pages extracted by each backend when probing
+PROBE_PAGES = int(os.getenv("ARCA_PDF_PROBE_PAGES", "3"))
+# A backend is adequate with at least this share of the best text density
+PROBE_MIN_DENSITY_RATIO = 0.9
+
+# Fallback order when no probe decides (no text layer, single backend)
+BACKEND_PREFERENCE = ["pdfplumber", "pdfminer", "pypdfium2"]
+
+
+class PdfplumberDocument:
+    """pdfplumber handle (layout analysis)"""
+
+    module = "pdfplumber"
+
+    def __init__(self, source: Union[str, bytes]):
+        import pdfplumber
+        self.pdf = pdfplumber.open(io.BytesIO(source) if isinstance(source, bytes) else source)
+
+    def __len__(self) -> int:
+        return len(self.pdf.pages)
+
+    def page_text(self, index: int) -> str:
+        page = self.pdf.pages[index]
+        try:
+            return page.extract_text() or ""
+        finally:
+            # Drop the page's parsed objects, workers hold many pages
+            if hasattr(page, "close"):
+                page.close()
+
+    def close(self) -> None:
+        self.pdf.close()
+
+
+class PdfminerDocument:
+    """pdfminer.six handle in text-only mode (no box-ordering analysis)"""
+
+    module = "pdfminer"
+
+    def __init__(self, source: Union[str, bytes]):
+        from pdfminer.pdfparser import PDFParser
+        from pdfminer.pdfdocument import PDFDocument
+        from pdfminer.pdfpage import PDFPage
+        from pdfminer.pdfinterp import PDFResourceManager
+        from pdfminer.layout import LAParams
+
+        self.file = io.BytesIO(source) if isinstance(source, bytes) else open(source, "rb")
+        try:
+            self.pages = list(PDFPage.create_pages(PDFDocument(PDFParser(self.file))))
+        except Exception:
+            self.file.close()
+            raise
+        self.resources = PDFResourceManager(caching=True)
+        self.laparams = LAParams(boxes_flow=None)
+
+    def __len__(self) -> int:
+        return len(self.pages)
+
+    def page_text(self, index: int) -> str:
+        from pdfminer.converter import TextConverter
+        from pdfminer.pdfinterp import PDFPageInterpreter
+
+        output = io.StringIO()
+        device = TextConverter(self.resources, output, laparams=self.laparams)
+        try:
+            PDFPageInterpreter(self.resources, device).process_page(self.pages[index])
+        finally:
+            device.close()
+        # TextConverter ends every page with a form feed
+        return output.getvalue().rstrip("\f").strip()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class Pypdfium2Document:
+    """PDFium handle (native text layer)"""
+
+    module = "pypdfium2"
+
+    def __init__(self, source: Union[str, bytes]):
+        import pypdfium2
+        self.pdf = pypdfium2.PdfDocument(source)
+
+    def __len__(self) -> int:
+        return len(self.pdf)
+
+    def page_text(self, index: int) -> str:
+        page = self.pdf[index]
+        try:
+            textpage = page.get_textpage()
+            try:
+                text = textpage.get_text_range()
+            finally:
+                textpage.close()
+        finally:
+            page.close()
+        return text.replace("\r\n", "\n").replace("\r", "\n").strip()
+
+    def close(self) -> None:
+        self.pdf.close()
+
+
+BACKENDS = {
+    "pdfplumber": PdfplumberDocument,
+    "pdfminer": PdfminerDocument,
+    "pypdfium2": Pypdfium2Document
+}
+
+
+class PDFBackendDocument:
+    """Context manager around a backend handle: len(), page_text(index)"""
+
+    def __init__(self, backend: str, source: Union[str, bytes]):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown PDF backend: {backend!r} (choose from {', '.join(BACKENDS)})")
+        self.backend = backend
+        self.handle = BACKENDS[backend](source)
+
+    def __len__(self) -> int:
+        return len(self.handle)
+
+    def page_text(self, index: int) -> str:
+        return self.handle.page_text(index)
+
+    def __enter__(self) -> "PDFBackendDocument":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.handle.close()
+
+
+def open_document(backend: str, source: Union[str, bytes]) -> PDFBackendDocument:
+    """Open a PDF path or bytes with the named backend"""
+    return PDFBackendDocument(backend, source)
+
+
+def available_backends(names: Optional[List[str]] = None) -> List[str]:
+    """
+    Installed backends, in BACKEND_PREFERENCE order
+
+    The libraries are imported here, so probe timings exclude import time.
+    """
+    available = []
+    for name in names or BACKEND_PREFERENCE:
+        if name not in BACKENDS:
+            raise ValueError(f"Unknown PDF backend: {name!r} (choose from {', '.join(BACKENDS)})")
+        try:
+            importlib.import_module(BACKENDS[name].module)
+        except ImportError:
+            continue
+        available.append(name)
+    return available
+
+
+def text_density(texts: List[str]) -> Dict[str, float]:
+    """Non-space characters and words per page"""
+    pages = max(1, len(texts))
+    return {
+        "chars_per_page": round(sum(len("".join(t.split())) for t in texts) / pages, 1),
+        "words_per_page": round(sum(len(t.split()) for t in texts) / pages, 1)
+    }
+
+
+def probe_backends(
+    source: Union[str, bytes],
+    names: Optional[List[str]] = None,
+    pages: int = PROBE_PAGES
+) -> List[Dict[str, Any]]:
+    """
+    Extract the first pages with every installed backend
+
+    Returns:
+        One dict per backend: backend, pages, seconds, pages_per_second,
+        chars_per_page, words_per_page, error (None on success)
+    """
+    results = []
+    for name in available_backends(names):
+        started = time.perf_counter()
+        texts = []
+        error = None
+        try:
+            with open_document(name, source) as document:
+                for index in range(min(pages, len(document))):
+                    texts.append(document.page_text(index))
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        seconds = time.perf_counter() - started
+        results.append({
+            "backend": name,
+            "pages": len(texts),
+            "seconds": round(seconds, 4),
+            "pages_per_second": round(len(texts) / seconds, 1) if seconds > 0 else None,
+            **text_density(texts),
+            "error": error
+        })
+    return results
+
+
+def select_backend(
+    source: Union[str, bytes],
+    names: Optional[List[str]] = None,
+    pages: int = PROBE_PAGES
+) -> Tuple[str, List[Dict[str, Any]]]:
+    """
+    Fastest backend whose text density is adequate on the first pages
+
+    Returns:
+        (backend name, probe results); the probe list is empty when only
+        one backend is installed
+
+    Raises:
+        ValueError: If no PDF backend is installed
+    """
+    installed = available_backends(names)
+    if not installed:
+        raise ValueError(f"No PDF backend installed (install one of: {', '.join(BACKEND_PREFERENCE)})")
+    if len(installed) == 1:
+        return installed[0], []
+
+    probes = probe_backends(source, installed, pages)
+    usable = [p for p in probes if p["error"] is None]
+    best_chars = max((p["chars_per_page"] for p in usable), default=0)
+    best_words = max((p["words_per_page"] for p in usable), default=0)
+    if best_chars == 0:
+        return (usable[0]["backend"] if usable else installed[0]), probes
+
+    adequate = [
+        p for p in usable
+        if p["chars_per_page"] >= PROBE_MIN_DENSITY_RATIO * best_chars
+        and p["words_per_page"] >= PROBE_MIN_DENSITY_RATIO * best_words
+    ] or [max(usable, key=lambda p: p["chars_per_page"])]
+    return min(adequate, key=lambda p: p["seconds"])["backend"], probes
+
+
+def resolve_backend(
+    source: Union[str, bytes],
+    backend: str = PDF_BACKEND
+) -> Tuple[str, List[Dict[str, Any]]]:
+    """Backend to extract source with: the configured name, or the probe's pick for "auto" """
+    if backend == "auto":
+        return select_backend(source)
+    if not available_backends([backend]):
+        raise ValueError(f"PDF backend {backend!r} is not installed")
+    return backend, []
@@ -0,0 +1,195 @@
+# pipeline_executor.py
+"""
+ARCA System: Managed Pipeline Executor
+
+One instrumented thread pool for the blocking parts of the pipeline
+(embedding + FAISS search, clause/pre-screen embeddings, document
+extraction and summarization, waits on the rate-limited LLM client).
+The API creates it on startup and installs it as the event loop's default
+executor, so every asyncio.to_thread / run_in_executor(None, ...) hop of
+ARCASystem.analyze_regulation_async runs on it; it is shut down with the app.
+
+Sizing (ARCA_EXECUTOR_WORKERS, 0 = auto):
+- auto = CPU count (CPU-bound work: embeddings, cleaning, segmentation)
+  + LLM slots (threads parked on LLM calls): enough for one analysis to
+  fan out its audit calls (ARCA_AUDIT_CONCURRENCY), or for the calls the
+  provider quota can keep in flight (ARCA_LLM_RPM x ARCA_EXECUTOR_LLM_SECONDS
+  / 60, Little's law), whichever is larger. More threads than that would
+  only queue on the rate limiter.
+
+Metrics (stats()):
+- queue_depth: tasks submitted but not started (pool saturated when > 0)
+- running / submitted / completed / failed counters
+- wait_seconds: submit → start latency of one task (p50, p95, max over a
+  rolling window)
+- run_seconds: start → end latency of one task
+- runs: the same per analysis, for code wrapped in track_run() (the API
+  wraps every analyze_regulation_async call): wait_seconds is the time the
+  analysis' tasks spent queued, run_seconds its wall time
+
+Only pipeline work runs here: the job queue's claims, heartbeats and progress
+writes have their own threads (job_queue.py).
+
+A persistent wait time with a low run time means the pool is too small; a
+high running count with long run times and low CPU means the pipeline is
+waiting on the LLM quota, where more workers do not help.
+
+Threads only: the offloaded calls are bound methods of the loaded agents
+(MiniLM model, FAISS index), which cannot be shipped to another process;
+CPU-heavy PDF extraction already has its own process pool (ARCA_PDF_WORKERS).
+
+Dependencies: none beyond llm_client and the auditor's settings
+"""
+
+import os
+import math
+import time
+import threading
+import contextvars
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Dict, Any, Optional, Callable, Iterator
+
+from llm_client import LatencyTracker, DEFAULT_RPM
+from agents.compliance_auditor import AUDIT_CONCURRENCY
+
+# Worker threads (0 = CPU count + LLM slots)
+EXECUTOR_WORKERS = int(os.getenv("ARCA_EXECUTOR_WORKERS", "0"))
+# Typical LLM call duration used to size the LLM slots
+EXECUTOR_LLM_SECONDS = float(os.getenv("ARCA_EXECUTOR_LLM_SECONDS", "10"))
+
+# Task latencies kept for the wait/run percentiles
+METRICS_WINDOW = 500
+
+# Run (analysis) the current asyncio task belongs to: submit() is called from
+# the awaiting coroutine, so its context tells which run a task is part of
+_current_run: contextvars.ContextVar[Optional[Dict[str, float]]] = contextvars.ContextVar(
+    "arca_pipeline_run", default=None
+)
+
+
+def llm_slots(rpm: float = DEFAULT_RPM, call_seconds: float = EXECUTOR_LLM_SECONDS) -> int:
+    """Threads expected to be parked on LLM calls at once"""
+    return max(AUDIT_CONCURRENCY, math.ceil(rpm * call_seconds / 60.0))
+
+
+def default_workers() -> int:
+    """CPU count + LLM slots (see module docstring)"""
+    return (os.cpu_count() or 1) + llm_slots()
+
+
+def _latency_summary(tracker: LatencyTracker) -> Dict[str, Optional[float]]:
+    summary = {}
+    for name, pct in (("p50", 50), ("p95", 95), ("max", 100)):
+        value = tracker.percentile(pct)
+        summary[name] = round(value, 4) if value is not None else None
+    return summary
+
+
+class InstrumentedExecutor(ThreadPoolExecutor):
+    """
+    ThreadPoolExecutor recording queue depth, wait time and run time
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, thread_name_prefix: str = "arca-pipeline"):
+        """
+        Args:
+            max_workers: Worker threads (default: ARCA_EXECUTOR_WORKERS, else
+                         default_workers())
+        """
+        self.max_workers = max_workers or EXECUTOR_WORKERS or default_workers()
+        super().__init__(max_workers=self.max_workers, thread_name_prefix=thread_name_prefix)
+        self.wait_latency = LatencyTracker(window=METRICS_WINDOW, min_samples=1)
+        self.run_latency = LatencyTracker(window=METRICS_WINDOW, min_samples=1)
+        self.run_wait_latency = LatencyTracker(window=METRICS_WINDOW, min_samples=1)
+        self.run_wall_latency = LatencyTracker(window=METRICS_WINDOW, min_samples=1)
+        self._metrics_lock = threading.Lock()
+        self._counters = {
+            "queue_depth": 0,
+            "running": 0,
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "runs_active": 0,
+            "runs_completed": 0
+        }
+
+    def _count(self, **increments: int) -> None:
+        with self._metrics_lock:
+            for key, value in increments.items():
+                self._counters[key] += value
+
+    @contextmanager
+    def track_run(self) -> Iterator[None]:
+        """
+        Record one analysis (wall time, time its tasks spent queued)
+
+        Usage (in the coroutine running the analysis):
+            with executor.track_run():
+                result = await arca.analyze_regulation_async(...)
+        """
+        run = {"wait": 0.0}
+        token = _current_run.set(run)
+        began = time.perf_counter()
+        self._count(runs_active=1)
+        try:
+            yield
+        finally:
+            _current_run.reset(token)
+            self.run_wall_latency.record(time.perf_counter() - began)
+            with self._metrics_lock:
+                self.run_wait_latency.record(run["wait"])
+            self._count(runs_active=-1, runs_completed=1)
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:
+        submitted_at = time.perf_counter()
+        started = threading.Event()
+        run = _current_run.get()
+
+        def tracked():
+            begin = time.perf_counter()
+            started.set()
+            self._count(queue_depth=-1, running=1)
+            self.wait_latency.record(begin - submitted_at)
+            if run is not None:
+                with self._metrics_lock:
+                    run["wait"] += begin - submitted_at
+            succeeded = False
+            try:
+                result = fn(*args, **kwargs)
+                succeeded = True
+                return result
+            finally:
+                self.run_latency.record(time.perf_counter() - begin)
+                self._count(running=-1, completed=1 if succeeded else 0, failed=0 if succeeded else 1)
+
+        self._count(queue_depth=1, submitted=1)
+        try:
+            future = super().submit(tracked)
+        except Exception:
+            self._count(queue_depth=-1, submitted=-1)
+            raise
+
+        def on_done(done: Future):
+            # Cancelled before a worker picked it up: it left the queue unrun
+            if done.cancelled() and not started.is_set():
+                self._count(queue_depth=-1)
+
+        future.add_done_callback(on_done)
+        return future
+
+    def stats(self) -> Dict[str, Any]:
+        """Current queue depth, counters and per-task and per-run latency percentiles"""
+        with self._metrics_lock:
+            stats = dict(self._counters)
+        stats["kind"] = "thread"
+        stats["max_workers"] = self.max_workers
+        stats["wait_seconds"] = _latency_summary(self.wait_latency)
+        stats["run_seconds"] = _latency_summary(self.run_latency)
+        stats["runs"] = {
+            "active": stats.pop("runs_active"),
+            "completed": stats.pop("runs_completed"),
+            "wait_seconds": _latency_summary(self.run_wait_latency),
+            "run_seconds": _latency_summary(self.run_wall_latency)
+        }
+        return stats
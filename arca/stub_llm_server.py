@@ -0,0 +1,414 @@
+# stub_llm_server.py
+"""
+ARCA System: Deterministic Stand-in LLM
+
+Offline replacement for Gemini used for load testing and benchmarks.
+Responses are derived from a hash of the prompt, so the same prompt always
+gets the same answer, and they follow the schemas the agents parse:
+- Auditor prompts (single and batch) -> schema-valid verdict JSON
+- Summarization prompts -> extractive summary of the obligation sentences
+- Obligation extraction prompts -> one record per obligation sentence
+- Anything else -> short echo
+
+Two ways to use it:
+1. In-process: ARCA_LLM_BACKEND=stub (see llm_client.py)
+2. Over HTTP (OpenAI-compatible /v1/chat/completions):
+       python stub_llm_server.py --port 8001 --latency-ms 300 --error-rate 0.05
+   then ARCA_LLM_BACKEND=openai ARCA_LLM_BASE_URL=http://localhost:8001/v1
+
+Configuration (environment, also settable via CLI flags):
+- ARCA_STUB_LATENCY: Latency distribution: fixed | uniform | lognormal (default: lognormal)
+- ARCA_STUB_LATENCY_MS: Median latency in milliseconds (default: 300)
+- ARCA_STUB_LATENCY_SPREAD: Lognormal sigma / uniform +- fraction (default: 0.5)
+- ARCA_STUB_ERROR_RATE: Fraction of calls failing with 503/429 (default: 0.0)
+- ARCA_STUB_SEED: Seed for latency and error sampling (default: random)
+
+Dependencies: Standard library only
+"""
+
+import os
+import re
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional, Tuple
+
+STUB_LATENCY = os.getenv("ARCA_STUB_LATENCY", "lognormal")
+STUB_LATENCY_MS = float(os.getenv("ARCA_STUB_LATENCY_MS", "300"))
+STUB_LATENCY_SPREAD = float(os.getenv("ARCA_STUB_LATENCY_SPREAD", "0.5"))
+STUB_ERROR_RATE = float(os.getenv("ARCA_STUB_ERROR_RATE", "0.0"))
+STUB_SEED = os.getenv("ARCA_STUB_SEED")
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "lognormal")
+
+# Prompt sections written by the agents (compliance_auditor.py, document_processor.py,
+# obligation_records.py)
+SINGLE_AUDIT_RE = re.compile(
+    r"NEW REGULATION:\n(?P<regulation>.*?)\n\nINTERNAL POLICY EXCERPT:\n(?P<excerpt>.*?)"
+    r"(?:\n\nSentences are numbered.*?)?\n\nANALYSIS INSTRUCTIONS",
+    re.DOTALL
+)
+BATCH_AUDIT_RE = re.compile(
+    r"NEW REGULATION:\n(?P<regulation>.*?)\n\nINTERNAL POLICY EXCERPTS:\n(?P<excerpts>.*?)"
+    r"(?:\n\nSentences are numbered.*?)?\n\nANALYSIS INSTRUCTIONS",
+    re.DOTALL
+)
+EXCERPT_LABEL_RE = re.compile(r"^\[EXCERPT (\d+)\][^\n]*\n", re.MULTILINE)
+SENTENCE_LABEL_RE = re.compile(r"^\[([RP]\d+)\]", re.MULTILINE)
+SUMMARY_RE = re.compile(
+    r"(?:REGULATION TEXT|PARTIAL SUMMARIES):\n(?P<text>.*?)\n\n"
+    r"(?:SUMMARIZED|MERGED) REQUIREMENTS \(under (?P<words>\d+) words\)",
+    re.DOTALL
+)
+
+OBLIGATION_CHUNK_RE = re.compile(
+    r"POLICY CHUNK:\n(?P<chunk>.*?)\n\nExtract every obligation", re.DOTALL
+)
+MODALITY_RE = re.compile(r"\b(must not|shall not|may not|must|shall|may)\b", re.IGNORECASE)
+DEADLINE_RE = re.compile(
+    r"\b(?:within|no later than|at least|for|every)\s+[^,.;]*?\b(?:hours?|days?|weeks?|months?|years?)\b",
+    re.IGNORECASE
+)
+
+OBLIGATION_WORDS = ("must", "shall", "required", "prohibited", "within", "no later than", "at least")
+SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+class StubServiceError(Exception):
+    """Simulated transient provider failure (message carries the HTTP status)"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"{status} {message} (stub)")
+        self.status = status
+
+
+def _digest(*parts: str) -> int:
+    """Stable integer derived from the prompt content"""
+    data = "\x00".join(parts).encode("utf-8")
+    return int.from_bytes(hashlib.sha256(data).digest()[:8], "big")
+
+
+def _quote(text: str, limit: int = 200) -> str:
+    text = " ".join(text.split())
+    return text[:limit]
+
+
+class StubResponder:
+    """
+    Deterministic responses with simulated latency and errors
+    """
+
+    def __init__(
+        self,
+        latency: str = STUB_LATENCY,
+        latency_ms: float = STUB_LATENCY_MS,
+        spread: float = STUB_LATENCY_SPREAD,
+        error_rate: float = STUB_ERROR_RATE,
+        seed: Optional[int] = int(STUB_SEED) if STUB_SEED else None
+    ):
+        """
+        Args:
+            latency: Latency distribution (fixed, uniform, lognormal)
+            latency_ms: Median latency in milliseconds
+            spread: Lognormal sigma, or +- fraction of the median for uniform
+            error_rate: Fraction of calls raising StubServiceError
+            seed: Seed for latency/error sampling (responses are always deterministic)
+        """
+        if latency not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {latency}")
+
+        self.latency = latency
+        self.latency_ms = latency_ms
+        self.spread = spread
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+        self.calls = 0
+        self.errors = 0
+
+    # ─────────────────────────────────────────────────────────
+    # SIMULATION
+    # ─────────────────────────────────────────────────────────
+
+    def sample_latency(self) -> float:
+        """Seconds to wait before answering"""
+        with self._lock:
+            if self.latency == "fixed":
+                ms = self.latency_ms
+            elif self.latency == "uniform":
+                ms = self._random.uniform(
+                    self.latency_ms * (1 - self.spread), self.latency_ms * (1 + self.spread)
+                )
+            else:
+                ms = self.latency_ms * self._random.lognormvariate(0.0, self.spread)
+        return max(ms, 0.0) / 1000.0
+
+    def _maybe_fail(self) -> None:
+        with self._lock:
+            self.calls += 1
+            roll = self._random.random()
+            if roll >= self.error_rate:
+                return
+            self.errors += 1
+        # Mostly overload, sometimes quota
+        if roll < self.error_rate * 0.25:
+            raise StubServiceError(429, "Too Many Requests")
+        raise StubServiceError(503, "Service Unavailable")
+
+    def complete(self, prompt: str) -> str:
+        """
+        Answer a prompt after the simulated latency
+
+        Raises:
+            StubServiceError: For the configured fraction of calls
+        """
+        time.sleep(self.sample_latency())
+        self._maybe_fail()
+        return self.respond(prompt)
+
+    # ─────────────────────────────────────────────────────────
+    # RESPONSES
+    # ─────────────────────────────────────────────────────────
+
+    def respond(self, prompt: str) -> str:
+        """Deterministic response text for a prompt (no latency, no errors)"""
+        batch = BATCH_AUDIT_RE.search(prompt)
+        if batch:
+            return json.dumps(self._batch_verdicts(batch.group("regulation"), batch.group("excerpts")), indent=2)
+
+        single = SINGLE_AUDIT_RE.search(prompt)
+        if single:
+            return json.dumps(self._verdict(single.group("regulation"), single.group("excerpt")), indent=2)
+
+        summary = SUMMARY_RE.search(prompt)
+        if summary:
+            return self._summary(summary.group("text"), int(summary.group("words")))
+
+        chunk = OBLIGATION_CHUNK_RE.search(prompt)
+        if chunk:
+            return json.dumps(self._obligations(chunk.group("chunk")), indent=2)
+
+        return f"Stub response ({len(prompt.split())} prompt words)."
+
+    def _verdict(self, regulation: str, excerpt: str) -> Dict[str, Any]:
+        digest = _digest(regulation, excerpt)
+        roll = digest % 100
+        # ~20% HIGH, ~30% MEDIUM, ~50% LOW
+        severity = "HIGH" if roll < 20 else "MEDIUM" if roll < 50 else "LOW"
+        has_conflict = severity != "LOW"
+        confidence = 0.5 + ((digest >> 8) % 50) / 100.0
+
+        verdict = {
+            "severity": severity,
+            "has_conflict": has_conflict,
+            "divergence_summary": (
+                "Stub: the policy excerpt diverges from the regulation."
+                if has_conflict else "Stub: no conflict detected."
+            ),
+            "recommendation": (
+                "Review and align the policy with the regulation."
+                if has_conflict else "No action required."
+            ),
+            "confidence": round(confidence, 2)
+        }
+
+        # Numbered prompts get sentence ids back, like the real model is asked to
+        policy_ids = SENTENCE_LABEL_RE.findall(excerpt)
+        regulation_ids = SENTENCE_LABEL_RE.findall(regulation)
+        if policy_ids and regulation_ids:
+            verdict["policy_sentences"] = [policy_ids[(digest >> 16) % len(policy_ids)]]
+            verdict["regulation_sentences"] = [regulation_ids[(digest >> 24) % len(regulation_ids)]]
+        else:
+            verdict["conflicting_policy_excerpt"] = _quote(excerpt)
+            verdict["new_rule_excerpt"] = _quote(regulation)
+        return verdict
+
+    def _batch_verdicts(self, regulation: str, excerpts_block: str) -> List[Dict[str, Any]]:
+        labels = list(EXCERPT_LABEL_RE.finditer(excerpts_block))
+        verdicts = []
+        for n, label in enumerate(labels):
+            end = labels[n + 1].start() if n + 1 < len(labels) else len(excerpts_block)
+            excerpt = excerpts_block[label.end():end].strip()
+            verdict = self._verdict(regulation, excerpt)
+            verdicts.append({"excerpt_index": int(label.group(1)), **verdict})
+        return verdicts
+
+    @staticmethod
+    def _obligations(chunk: str) -> List[Dict[str, Any]]:
+        records = []
+        for sentence in SENTENCE_SPLIT_RE.split(chunk):
+            modal = MODALITY_RE.search(sentence)
+            if not modal:
+                continue
+            modality = modal.group(1).lower()
+            modality = "must not" if " not" in modality else "may" if modality == "may" else "must"
+            deadline = DEADLINE_RE.search(sentence)
+            records.append({
+                "actor": " ".join(sentence[:modal.start()].split()[-3:]) or None,
+                "action": " ".join(sentence[modal.end():].split()[:12]).rstrip(".") or None,
+                "deadline": deadline.group(0) if deadline else None,
+                "scope": None,
+                "modality": modality
+            })
+        return records
+
+    @staticmethod
+    def _summary(text: str, max_words: int) -> str:
+        sentences = [s.strip() for s in SENTENCE_SPLIT_RE.split(text) if s.strip()]
+        kept = [s for s in sentences if any(w in s.lower() for w in OBLIGATION_WORDS)] or sentences
+
+        words, out = 0, []
+        for sentence in kept:
+            count = len(sentence.split())
+            if out and words + count > max_words:
+                break
+            out.append(sentence)
+            words += count
+        return " ".join(out)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "errors": self.errors,
+                "latency": self.latency,
+                "latency_ms": self.latency_ms,
+                "spread": self.spread,
+                "error_rate": self.error_rate
+            }
+
+
+# ─────────────────────────────────────────────────────────
+# OPENAI-COMPATIBLE HTTP SERVER
+# ─────────────────────────────────────────────────────────
+
+def _make_handler(responder: StubResponder):
+
+    class StubLLMHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path.rstrip("/") in ("/health", "/v1/health"):
+                self._send_json(200, {"status": "ok", **responder.stats()})
+            else:
+                self._send_json(404, {"error": {"message": "Not found"}})
+
+        def do_POST(self):
+            if self.path.rstrip("/") not in ("/v1/chat/completions", "/chat/completions"):
+                self._send_json(404, {"error": {"message": "Not found"}})
+                return
+
+            try:
+                length = int(self.headers.get("Content-Length", "0"))
+                request = json.loads(self.rfile.read(length) or b"{}")
+                messages = request.get("messages") or []
+                prompt = "\n".join(str(m.get("content", "")) for m in messages if m.get("role") != "system")
+            except (ValueError, AttributeError) as e:
+                self._send_json(400, {"error": {"message": f"Invalid request: {e}"}})
+                return
+
+            try:
+                text = responder.complete(prompt)
+            except StubServiceError as e:
+                self._send_json(e.status, {"error": {"message": str(e)}})
+                return
+
+            self._send_json(200, {
+                "id": f"stub-{_digest(prompt):x}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": request.get("model", "stub"),
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": text},
+                    "finish_reason": "stop"
+                }],
+                "usage": {
+                    "prompt_tokens": len(prompt) // 4,
+                    "completion_tokens": len(text) // 4,
+                    "total_tokens": (len(prompt) + len(text)) // 4
+                }
+            })
+
+        def log_message(self, format, *args):
+            # Request logging would dominate benchmark output
+            pass
+
+    return StubLLMHandler
+
+
+def start_stub_server(
+    host: str = "127.0.0.1",
+    port: int = 0,
+    responder: Optional[StubResponder] = None
+) -> Tuple[ThreadingHTTPServer, str]:
+    """
+    Start the HTTP stub on a background thread
+
+    Args:
+        host: Bind address
+        port: Port (0 = pick a free one)
+        responder: StubResponder to serve (default: configured from environment)
+
+    Returns:
+        (server, base_url) - call server.shutdown() to stop it
+    """
+    server = ThreadingHTTPServer((host, port), _make_handler(responder or StubResponder()))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="arca-stub-llm", daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_address[1]}/v1"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ARCA deterministic stand-in LLM server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency", choices=LATENCY_DISTRIBUTIONS, default=STUB_LATENCY)
+    parser.add_argument("--latency-ms", type=float, default=STUB_LATENCY_MS)
+    parser.add_argument("--spread", type=float, default=STUB_LATENCY_SPREAD)
+    parser.add_argument("--error-rate", type=float, default=STUB_ERROR_RATE)
+    parser.add_argument("--seed", type=int, default=int(STUB_SEED) if STUB_SEED else None)
+    args = parser.parse_args()
+
+    responder = StubResponder(
+        latency=args.latency,
+        latency_ms=args.latency_ms,
+        spread=args.spread,
+        error_rate=args.error_rate,
+        seed=args.seed
+    )
+    server = ThreadingHTTPServer((args.host, args.port), _make_handler(responder))
+    server.daemon_threads = True
+
+    print("="*60)
+    print("🧪 ARCA Stub LLM Server")
+    print("="*60)
+    print(f"   Endpoint: http://{args.host}:{args.port}/v1/chat/completions")
+    print(f"   Latency: {args.latency} (median {args.latency_ms:.0f} ms, spread {args.spread})")
+    print(f"   Error rate: {args.error_rate:.1%}")
+    print(f"   Use with: ARCA_LLM_BACKEND=openai ARCA_LLM_BASE_URL=http://{args.host}:{args.port}/v1")
+    print("="*60)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Stub server stopped")
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
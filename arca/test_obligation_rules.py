@@ -0,0 +1,106 @@
+# test_obligation_rules.py
+"""
+Test for the obligation rule engine (agents/obligation_rules.py)
+
+Checks that ObligationRuleEngine.screen:
+1. Resolves plain numeric mismatches with a HIGH verdict ("retained 90 days"
+   vs "deleted within 30 days", "48 hours" vs "5 business days")
+2. Leaves to the LLM every pair that is not clear-cut: a different recipient
+   or actor, a different anchoring event, a policy within the bound
+
+Run: python test_obligation_rules.py
+"""
+
+import sys
+
+from agents.obligation_rules import ObligationRuleEngine
+
+BREACH_REGULATION = (
+    "Controllers must notify the supervisory authority of a personal data breach within 72 hours."
+)
+
+# (name, regulation, policy excerpt, expected conflict or None)
+CASES = [
+    (
+        "retention beyond the deletion deadline",
+        "Personal data must be deleted within 30 days.",
+        "Personal data is retained for 90 days.",
+        "exceeds_maximum"
+    ),
+    (
+        "retention beyond the deletion deadline, same anchoring event",
+        "Personal data must be deleted within 30 days after account closure.",
+        "Customer personal data is retained for 90 days after account closure.",
+        "exceeds_maximum"
+    ),
+    (
+        "acknowledgement in business days beyond 48 hours",
+        "Customer complaints must be acknowledged within 48 hours.",
+        "Complaints are acknowledged within 5 business days.",
+        "exceeds_maximum"
+    ),
+    (
+        "breach notification to the same authority, too late",
+        BREACH_REGULATION,
+        "Personal data breaches are notified to the supervisory authority within 5 business days.",
+        "exceeds_maximum"
+    ),
+    (
+        "incident reported to the CISO (other recipient and event)",
+        BREACH_REGULATION,
+        "Security incidents are reported to the CISO within 5 business days.",
+        None
+    ),
+    (
+        "customers notified by the IT department (other recipient and actor)",
+        BREACH_REGULATION,
+        "The IT department must notify affected customers of a data breach within 7 days.",
+        None
+    ),
+    (
+        "retention with a different anchoring event",
+        "Personal data must be deleted within 30 days after account closure.",
+        "Personal data is retained for 90 days after collection.",
+        None
+    ),
+    (
+        "policy within the bound",
+        "Customer complaints must be acknowledged within 5 business days.",
+        "Complaints are acknowledged within 48 hours.",
+        None
+    )
+]
+
+
+def main():
+    engine = ObligationRuleEngine()
+    failures = 0
+
+    for name, regulation, excerpt, expected in CASES:
+        items = [{"policy_id": "POL-TEST", "excerpt": excerpt}]
+        to_audit, resolved, _ = engine.screen(regulation, items)
+        conflict = resolved[0]["rule"]["conflict"] if 0 in resolved else None
+
+        if conflict != expected:
+            failures += 1
+            print(f"❌ {name}: expected {expected}, got {conflict}")
+            continue
+        if expected is None and to_audit != [0]:
+            failures += 1
+            print(f"❌ {name}: not sent to the LLM")
+            continue
+        if expected is not None and resolved[0]["severity"] != "HIGH":
+            failures += 1
+            print(f"❌ {name}: severity {resolved[0]['severity']}")
+            continue
+        print(f"✅ {name}")
+
+    print("\n" + "=" * 60)
+    if failures:
+        print(f"❌ {failures} case(s) failed")
+        sys.exit(1)
+    print("✅ Rule engine resolves only clear-cut conflicts")
+
+
+if __name__ == "__main__":
+    main()
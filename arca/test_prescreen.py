@@ -0,0 +1,125 @@
+# test_prescreen.py
+"""
+Test for the compliance auditor pre-screen (agents/prescreen.py)
+
+Checks:
+1. calibrate_threshold keeps at least the target recall of relevant excerpts,
+   and is the highest threshold that does (randomized scores, with ties)
+2. train_classifier on labelled pairs (lexical signals only, no embeddings)
+   calibrates a threshold that keeps the target recall on its training set
+3. ExcerptPrescreener.screen with that model skips only unrelated excerpts
+
+Run: python test_prescreen.py
+"""
+
+import sys
+import random
+
+from agents.prescreen import ExcerptPrescreener, calibrate_threshold, train_classifier
+
+REGULATIONS = [
+    "Personal data must be deleted within 30 days after account closure.",
+    "Security incidents must be reported to the supervisory authority within 72 hours.",
+    "Employees must complete anti-corruption training every year.",
+    "Gifts exceeding MAD 500 must be declared to the compliance officer."
+]
+RELATED = [
+    "Customer personal data is retained for 90 days after account closure.",
+    "Security incidents are reported to the authority within 5 business days.",
+    "Anti-corruption training must be completed by all employees every two years.",
+    "Gifts above MAD 1000 must be declared to the compliance officer."
+]
+UNRELATED = [
+    "The cafeteria is open from 8am to 6pm on weekdays.",
+    "Parking spaces are assigned by seniority in the building.",
+    "Company vehicles must be washed every Friday afternoon.",
+    "Printer toner requests go through the facilities helpdesk."
+]
+
+
+def recall(scores, labels, threshold):
+    positives = [s for s, y in zip(scores, labels) if y == 1]
+    return sum(1 for s in positives if s >= threshold) / len(positives)
+
+
+def check_calibration(rng):
+    """Returns the number of failures"""
+    failures = 0
+    for trial in range(500):
+        n = rng.randint(1, 200)
+        scores = [round(rng.random(), 2) for _ in range(n)]
+        labels = [rng.randint(0, 1) for _ in range(n)]
+        target = rng.choice([0.9, 0.95, 0.98, 0.99, 1.0])
+        threshold = calibrate_threshold(scores, labels, target)
+
+        if 1 not in labels:
+            if threshold != 0.0:
+                failures += 1
+                print(f"❌ trial {trial}: no positives, threshold {threshold}")
+            continue
+        if recall(scores, labels, threshold) < target:
+            failures += 1
+            print(f"❌ trial {trial}: recall {recall(scores, labels, threshold):.3f} < {target}")
+            continue
+        higher = [s for s, y in zip(scores, labels) if y == 1 and s > threshold]
+        if higher and recall(scores, labels, min(higher)) >= target:
+            failures += 1
+            print(f"❌ trial {trial}: threshold {threshold} is not the highest keeping {target}")
+    if not failures:
+        print("✅ calibrate_threshold keeps the target recall")
+    return failures
+
+
+def check_training():
+    """Returns the number of failures"""
+    failures = 0
+    examples = []
+    for regulation, related in zip(REGULATIONS, RELATED):
+        examples.append({"regulation": regulation, "excerpt": related, "label": 1})
+        for unrelated in UNRELATED:
+            examples.append({"regulation": regulation, "excerpt": unrelated, "label": 0})
+
+    model = train_classifier(examples, target_recall=1.0, output_path=None)
+    screener = ExcerptPrescreener(threshold=model["threshold"], model_path=None, log_path=None)
+    screener.classifier = model
+
+    for regulation, related in zip(REGULATIONS, RELATED):
+        items = [{"policy_id": "POL-REL", "excerpt": related}] + [
+            {"policy_id": f"POL-UNREL-{i}", "excerpt": e} for i, e in enumerate(UNRELATED)
+        ]
+        to_audit, skipped, stats = screener.screen(regulation, items)
+        if 0 not in to_audit:
+            failures += 1
+            print(f"❌ related excerpt skipped for: {regulation}")
+        if any(skipped[i]["has_conflict"] for i in skipped):
+            failures += 1
+            print("❌ skipped excerpt reported as a conflict")
+        if stats["scorer"] != "classifier":
+            failures += 1
+            print(f"❌ scorer {stats['scorer']}")
+
+    if model["training_skip_precision"] != 1.0 or model["training_skip_rate"] == 0.0:
+        failures += 1
+        print(
+            f"❌ training skip rate {model['training_skip_rate']}, "
+            f"precision {model['training_skip_precision']}"
+        )
+    if not failures:
+        print(f"✅ train_classifier (threshold {model['threshold']:.3f}, "
+              f"skip rate {model['training_skip_rate']})")
+    return failures
+
+
+def main():
+    rng = random.Random(29)
+    failures = check_calibration(rng) + check_training()
+
+    print("\n" + "=" * 60)
+    if failures:
+        print(f"❌ {failures} check(s) failed")
+        sys.exit(1)
+    print("✅ Pre-screen keeps the calibrated recall")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+# test_text_cleaner.py
+"""
+Golden-output test for the text cleaning engine
+
+Checks that TextCleaner produces exactly the output of the original
+clean_text passes (text_cleaner.reference_clean) on:
+1. Real documents: data/policies/*.md, agents/new_regulation.pdf (when
+   pdfplumber is installed), regulation quotes from reports/*.json and any
+   extra .pdf/.txt/.md paths given on the command line
+2. The same documents with injected page artifacts (page numbers, "Page N",
+   "- N -", bullets, space and blank-line runs)
+3. Randomized artifact-heavy fragments
+4. Block-by-block cleaning (iter_clean) against whole-text cleaning
+5. Header/footer rules
+
+Run: python test_text_cleaner.py [extra_regulation.pdf ...]
+"""
+
+import os
+import sys
+import json
+import glob
+import random
+
+from text_cleaner import TextCleaner, reference_clean
+
+ARTIFACTS = [
+    "\n{n}\n", "\nPage {n}\n", "\n  page {n}  \n", "\n- {n} -\n", "\n\n\n\n",
+    "  ", "   ", " • ", "▪ ", "\t", " \n", "\n \n \n"
+]
+FUZZ_ALPHABET = list("  \n\n\t\r-.,'\"()") + [
+    "Page", "page", "12", "3", "- 4 -", "•", "▪", "●", "word", "Article",
+    ', "\'").replace(', "\x0c", " ", "x"
+]
+
+
+def load_corpus(extra_paths):
+    """(name, text) pairs of real documents"""
+    corpus = []
+    for path in sorted(glob.glob("data/policies/*.md")) + [
+        p for p in extra_paths if not p.lower().endswith(".pdf")
+    ]:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            corpus.append((path, f.read()))
+
+    pdf_paths = ["agents/new_regulation.pdf"] + [p for p in extra_paths if p.lower().endswith(".pdf")]
+    try:
+        import pdfplumber
+        for path in pdf_paths:
+            if os.path.exists(path):
+                with pdfplumber.open(path) as pdf:
+                    pages = [page.extract_text() for page in pdf.pages]
+                corpus.append((path, "\n\n".join(p for p in pages if p)))
+    except ImportError:
+        print("⚠️  pdfplumber not installed, PDF documents skipped")
+
+    quotes = []
+    for path in sorted(glob.glob("reports/*.json")):
+        with open(path, "r", encoding="utf-8") as f:
+            report = json.load(f)
+        quotes.extend(risk.get("new_rule_excerpt", "") for risk in report.get("risks", []))
+    if quotes:
+        corpus.append(("reports/*.json (regulation quotes)", "\n\n".join(quotes)))
+    return corpus
+
+
+def with_artifacts(text, rng):
+    """Insert page artifacts between lines, like a raw PDF extraction"""
+    out = []
+    for n, line in enumerate(text.split("\n"), 1):
+        out.append(line)
+        if rng.random() < 0.15:
+            out.append(rng.choice(ARTIFACTS).format(n=n))
+        out.append("\n")
+    return "".join(out)
+
+
+def random_chunks(text, rng, max_cuts=8):
+    cuts = sorted(rng.sample(range(len(text) + 1), min(len(text) + 1, rng.randint(0, max_cuts))))
+    chunks, previous = [], 0
+    for cut in cuts:
+        chunks.append(text[previous:cut])
+        previous = cut
+    chunks.append(text[previous:])
+    return chunks
+
+
+def main():
+    rng = random.Random(1234)
+    cleaner = TextCleaner(header_footer_rules=[])
+    failures = 0
+
+    def check(name, expected, actual):
+        nonlocal failures
+        if expected != actual:
+            failures += 1
+            index = next(
+                (i for i, (a, b) in enumerate(zip(expected, actual)) if a != b),
+                min(len(expected), len(actual))
+            )
+            print(f"❌ {name}: output differs at char {index}")
+            print(f"   expected: {expected[max(0, index - 40):index + 40]!r}")
+            print(f"   actual:   {actual[max(0, index - 40):index + 40]!r}")
+            return False
+        return True
+
+    # 1-2. Real documents, as-is and with page artifacts
+    corpus = load_corpus(sys.argv[1:])
+    for name, text in corpus:
+        ok = check(name, reference_clean(text), cleaner.clean(text))
+        noisy = with_artifacts(text, rng)
+        ok = check(f"{name} (+artifacts)", reference_clean(noisy), cleaner.clean(noisy)) and ok
+        if ok:
+            print(f"✅ {name} ({len(text)} chars)")
+
+    # 3. Randomized fragments
+    fuzz_failures = failures
+    for i in range(3000):
+        text = "".join(rng.choice(FUZZ_ALPHABET) for _ in range(rng.randint(0, 60)))
+        check(f"fuzz case {i}", reference_clean(text), cleaner.clean(text))
+    if failures == fuzz_failures:
+        print("✅ 3000 randomized fragments")
+
+    # 4. Block-by-block cleaning
+    stream_failures = failures
+    samples = [with_artifacts(text, rng) for _, text in corpus] + [
+        "".join(rng.choice(FUZZ_ALPHABET) for _ in range(rng.randint(0, 60))) for _ in range(2000)
+    ]
+    for i, text in enumerate(samples):
+        chunks = random_chunks(text, rng)
+        check(f"streamed sample {i}", cleaner.clean(text), "".join(cleaner.iter_clean(chunks)))
+    if failures == stream_failures:
+        print(f"✅ Streaming matches whole-text cleaning ({len(samples)} samples)")
+
+    # 5. Header/footer rules
+    rules_failures = failures
+    gazette = TextCleaner(header_footer_rules=["bulletin_officiel", "page_x_of_y"])
+    page = (
+        "BULLETIN OFFICIEL N° 7234 – 12 safar 1445 (28-8-2023)\n"
+        "Article {n}: Personal data must be deleted within 30 days.\n"
+        "Page {n} of 40\n"
+    )
+    text = "".join(page.format(n=n) for n in range(1, 41))
+    cleaned = gazette.clean(text)
+    if "BULLETIN" in cleaned or "of 40" in cleaned or cleaned.count("Article") != 40:
+        failures += 1
+        print("❌ Header/footer rules did not remove the running header/footer")
+    for i in range(200):
+        check(f"rules streamed sample {i}", cleaned, "".join(gazette.iter_clean(random_chunks(text, rng, 20))))
+    try:
+        TextCleaner(header_footer_rules=[r"a*"])
+        failures += 1
+        print("❌ A rule matching the empty string was accepted")
+    except ValueError:
+        pass
+    if failures == rules_failures:
+        print("✅ Header/footer rules")
+
+    print("\n" + "=" * 60)
+    if failures:
+        print(f"❌ {failures} golden-output mismatch(es)")
+        sys.exit(1)
+    print("✅ TextCleaner matches the reference implementation")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,8 +20,53 @@ const AnalyzerPage = () => {
   const [file, setFile] = useState(null);
   const [showLogo, setShowLogo] = useState(true);
   const [isAnalyzing, setIsAnalyzing] = useState(false);
+  const [jobStage, setJobStage] = useState(null);
 
   const API_BASE_URL = 'http://localhost:8000';
+  const JOB_POLL_INTERVAL_MS = 1500;
+
+  const STAGE_LABELS = {
+    document: 'Extracting the document...',
+    research: 'Retrieving relevant internal policies...',
+    audit: 'Auditing policies for conflicts...',
+    report: 'Generating the compliance report...',
+  };
+
+  // Analyses run as background jobs: submit, poll the status, then fetch the report
+  const runJob = async (submitResponse) => {
+    if (!submitResponse.ok) {
+      const errorData = await submitResponse.json();
+      throw new Error(errorData.detail || 'Analysis failed');
+    }
+
+    const { job_id } = await submitResponse.json();
+
+    while (true) {
+      await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+
+      const statusResponse = await fetch(`${API_BASE_URL}/jobs/${job_id}`);
+      if (!statusResponse.ok) {
+        const errorData = await statusResponse.json();
+        throw new Error(errorData.detail || 'Analysis failed');
+      }
+
+      const job = await statusResponse.json();
+      setJobStage(job.progress.stage);
+
+      if (job.status === 'failed') {
+        throw new Error(job.error || 'Analysis failed');
+      }
+
+      if (job.status === 'succeeded') {
+        const resultResponse = await fetch(`${API_BASE_URL}/jobs/${job_id}/result`);
+        if (!resultResponse.ok) {
+          const errorData = await resultResponse.json();
+          throw new Error(errorData.detail || 'Analysis failed');
+        }
+        return resultResponse.json();
+      }
+    }
+  };
 
   // Show logo on mount, hide it when scrolling
   useEffect(() => {
@@ -62,7 +107,7 @@ const AnalyzerPage = () => {
         requestBody.regulation_title = formData.regulation_title;
       }
 
-      const response = await fetch(`${API_BASE_URL}/analyze_regulation`, {
+      const response = await fetch(`${API_BASE_URL}/jobs`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -70,18 +115,14 @@ const AnalyzerPage = () => {
         body: JSON.stringify(requestBody),
       });
 
-      if (!response.ok) {
-        const errorData = await response.json();
-        throw new Error(errorData.detail || 'Analysis failed');
-      }
-
-      const data = await response.json();
+      const data = await runJob(response);
       setResult(data);
     } catch (err) {
       setError(err.message);
     } finally {
       setLoading(false);
       setIsAnalyzing(false);
+      setJobStage(null);
     }
   };
 
@@ -107,23 +148,19 @@ const AnalyzerPage = () => {
       if (formData.regulation_title) formDataFile.append('regulation_title', formData.regulation_title);
       formDataFile.append('summarize', 'true');
 
-      const response = await fetch(`${API_BASE_URL}/analyze_regulation_file`, {
+      const response = await fetch(`${API_BASE_URL}/jobs/file`, {
         method: 'POST',
         body: formDataFile,
       });
 
-      if (!response.ok) {
-        const errorData = await response.json();
-        throw new Error(errorData.detail || 'Analysis failed');
-      }
-
-      const data = await response.json();
+      const data = await runJob(response);
       setResult(data);
     } catch (err) {
       setError(err.message);
     } finally {
       setLoading(false);
       setIsAnalyzing(false);
+      setJobStage(null);
     }
   };
 
@@ -167,7 +204,9 @@ const AnalyzerPage = () => {
           {/* Loading Text */}
           <div className="text-center mt-8 animate-fadeIn">
             <h3 className="text-2xl font-bold text-slate-900 mb-2">Analyzing Regulation</h3>
-            <p className="text-slate-600">Please wait while our AI agents process your request...</p>
+            <p className="text-slate-600">
+              {STAGE_LABELS[jobStage] || 'Please wait while our AI agents process your request...'}
+            </p>
           </div>
         </div>
       )}